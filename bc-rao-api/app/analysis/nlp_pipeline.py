@@ -1,10 +1,11 @@
 """
-SpaCy NLP pipeline with custom components for Reddit post analysis.
+SpaCy NLP pipeline and batch metrics for Reddit post analysis.
 
-Custom components:
-- formality_scorer: Calculates text formality using Flesch-Kincaid and Gunning FOG
-- tone_classifier: Classifies sentiment using VADER
-- rhythm_analyzer: Analyzes sentence length patterns and vocabulary complexity
+SpaCy only tokenizes and parses; the metrics are computed in a post-pass
+over each batch of docs rather than as per-doc pipeline components:
+- formality: Flesch-Kincaid and Gunning FOG from doc token counts
+- tone: VADER sentiment, labelled for the whole batch at once
+- rhythm: sentence length patterns and vocabulary complexity
 
 IMPORTANT: This module requires en_core_web_md model installed:
     python -m spacy download en_core_web_md
@@ -12,137 +13,176 @@ IMPORTANT: This module requires en_core_web_md model installed:
 Zero external API costs - all processing is local.
 """
 
-import statistics
-from typing import Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice, repeat
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 import spacy
 import textstat
-from spacy.language import Language
+from spacy.attrs import IS_ALPHA, LOWER
 from spacy.tokens import Doc
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from app.analysis.scorers import score_text_signals
+from app.config import settings
+
 # Initialize textstat for English
 textstat.set_lang('en')
 
-# Load SpaCy model at module level (disable NER to save memory)
-nlp = spacy.load("en_core_web_md", disable=["ner"])
+# Load SpaCy model at module level. NER is excluded (not just disabled) so its
+# weights are never loaded; nothing downstream reads entities.
+nlp = spacy.load("en_core_web_md", exclude=["ner"])
+
+# Components the batch metrics never read (POS tags and lemmas). They are
+# skipped per call in analyze_posts_batch; the shared pipeline keeps them
+# for style_extractor. The parser stays on because it provides sentences.
+_METRICS_DISABLED = [
+    name for name in ("tagger", "attribute_ruler", "lemmatizer") if name in nlp.pipe_names
+]
 
 # Initialize VADER sentiment analyzer
 vader = SentimentIntensityAnalyzer()
 
-# Register custom Doc extensions
-Doc.set_extension("formality_score", default=None, force=True)
-Doc.set_extension("tone", default=None, force=True)
-Doc.set_extension("tone_compound", default=None, force=True)
-Doc.set_extension("avg_sentence_length", default=None, force=True)
-Doc.set_extension("sentence_length_std", default=None, force=True)
-Doc.set_extension("vocabulary_complexity", default=None, force=True)
-Doc.set_extension("num_sentences", default=None, force=True)
 
+@lru_cache(maxsize=10000)
+def _vader_compound(text: str) -> float:
+    """VADER compound score, memoized on the stripped text (batches repeat templates)."""
+    return vader.polarity_scores(text)['compound']
 
-@Language.component("formality_scorer")
-def formality_scorer(doc: Doc) -> Doc:
+
+@lru_cache(maxsize=50000)
+def _syllable_count(word: str) -> int:
     """
-    Calculate formality score using Flesch-Kincaid and Gunning FOG.
+    Syllables in a lowercased word, memoized per vocabulary entry.
 
-    Skip texts < 20 chars to avoid textstat errors on very short inputs.
+    textstat's syllable counter is pure Python and would otherwise run for
+    every token; word frequencies are heavily skewed, so nearly all lookups
+    hit the cache.
     """
-    text = doc.text.strip()
+    return textstat.syllable_count(word)
 
-    if len(text) < 20:
-        doc._.formality_score = None
-        return doc
 
-    try:
-        fk_grade = textstat.flesch_kincaid_grade(text)
-        gunning_fog = textstat.gunning_fog(text)
+def _readability_counts(doc: Doc) -> tuple[int, int, int]:
+    """
+    Count words, syllables and complex (3+ syllable) words.
 
-        # Average the two scores
-        doc._.formality_score = (fk_grade + gunning_fog) / 2.0
-    except (ZeroDivisionError, ValueError):
-        # Handle edge cases where textstat fails
-        doc._.formality_score = None
+    Uses the tokens SpaCy already produced instead of letting textstat
+    re-tokenize the raw text for every formula.
+    """
+    num_words = num_syllables = num_complex = 0
+    for token in doc:
+        if token.is_alpha:
+            syllables = _syllable_count(token.lower_)
+            num_words += 1
+            num_syllables += syllables
+            if syllables >= 3:
+                num_complex += 1
 
-    return doc
+    return num_words, num_syllables, num_complex
 
 
-@Language.component("tone_classifier")
-def tone_classifier(doc: Doc) -> Doc:
+def _formality_score(doc: Doc, text: str, num_sentences: int) -> Optional[float]:
     """
-    Classify text tone using VADER sentiment analysis.
+    Calculate formality score using Flesch-Kincaid and Gunning FOG.
+
+    Both grades are computed from the doc's own token and sentence counts:
+    - FK = 0.39 * (words / sentences) + 11.8 * (syllables / words) - 15.59
+    - FOG = 0.4 * ((words / sentences) + 100 * (complex_words / words))
+
+    num_sentences comes from _rhythm_metrics so the sentence boundaries are
+    only walked once. Skip texts < 20 chars to avoid unstable scores on very
+    short inputs, and docs without sentences.
+    """
+    if len(text) < 20 or not num_sentences:
+        return None
+
+    words, syllables, complex_words = _readability_counts(doc)
+    if not words:
+        return None
+
+    words_per_sentence = words / num_sentences
+    fk_grade = 0.39 * words_per_sentence + 11.8 * (syllables / words) - 15.59
+    gunning_fog = 0.4 * (words_per_sentence + 100.0 * (complex_words / words))
+
+    # Average the two scores
+    return (fk_grade + gunning_fog) / 2.0
+
+
+def _tone_labels(compounds: np.ndarray) -> list[str]:
+    """
+    Label VADER compound scores for a whole batch.
 
     Compound >= 0.05: positive
     Compound <= -0.05: negative
     Otherwise: neutral
     """
-    text = doc.text.strip()
-
-    if not text:
-        doc._.tone = "neutral"
-        doc._.tone_compound = 0.0
-        return doc
+    return np.select(
+        [compounds >= 0.05, compounds <= -0.05],
+        ["positive", "negative"],
+        "neutral",
+    ).tolist()
 
-    scores = vader.polarity_scores(text)
-    compound = scores['compound']
 
-    doc._.tone_compound = compound
-
-    if compound >= 0.05:
-        doc._.tone = "positive"
-    elif compound <= -0.05:
-        doc._.tone = "negative"
-    else:
-        doc._.tone = "neutral"
+def _count_distinct(ids: np.ndarray) -> int:
+    """
+    Count distinct 64-bit hashes with one in-place sort.
 
-    return doc
+    Cheaper than np.unique, which also materialises the unique values.
+    The array is sorted in place, so pass a scratch copy.
+    """
+    ids.sort()
+    return 1 + int(np.count_nonzero(ids[1:] != ids[:-1]))
 
 
-@Language.component("rhythm_analyzer")
-def rhythm_analyzer(doc: Doc) -> Doc:
+def _rhythm_metrics(doc: Doc) -> dict:
     """
     Analyze sentence length patterns and vocabulary complexity.
 
     Calculates:
     - Average sentence length (tokens per sentence)
     - Sentence length standard deviation (rhythm consistency)
-    - Vocabulary complexity (type-token ratio for alphabetic tokens)
+    - Vocabulary complexity (type-token ratio of lowercased alphabetic tokens)
+    - Number of sentences
     """
-    sentences = list(doc.sents)
-    doc._.num_sentences = len(sentences)
-
-    if not sentences:
-        doc._.avg_sentence_length = None
-        doc._.sentence_length_std = None
-        doc._.vocabulary_complexity = None
-        return doc
-
-    # Calculate sentence lengths
-    sentence_lengths = [len(sent) for sent in sentences]
-    doc._.avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths)
-
-    # Calculate standard deviation (handle single-sentence case)
-    if len(sentence_lengths) > 1:
-        doc._.sentence_length_std = statistics.stdev(sentence_lengths)
+    # Sentence lengths in tokens; mean and std come from one NumPy array
+    sentence_lengths = np.fromiter(
+        (sent.end - sent.start for sent in doc.sents), dtype=np.int32
+    )
+
+    if not sentence_lengths.size:
+        return {
+            "avg_sentence_length": None,
+            "sentence_length_std": None,
+            "vocabulary_complexity": None,
+            "num_sentences": 0,
+        }
+
+    # Sample standard deviation (handle single-sentence case)
+    if sentence_lengths.size > 1:
+        sentence_length_std = float(sentence_lengths.std(ddof=1))
     else:
-        doc._.sentence_length_std = 0.0
+        sentence_length_std = 0.0
 
     # Calculate vocabulary complexity (type-token ratio for alphabetic tokens)
-    alpha_tokens = [token.lemma_.lower() for token in doc if token.is_alpha]
+    # over lowercased-form hashes, so no token strings are materialised.
+    attrs = doc.to_array([LOWER, IS_ALPHA])
+    word_ids = attrs[attrs[:, 1] == 1, 0]
 
-    if alpha_tokens:
-        unique_lemmas = len(set(alpha_tokens))
-        total_tokens = len(alpha_tokens)
-        doc._.vocabulary_complexity = unique_lemmas / total_tokens
+    if word_ids.size:
+        vocabulary_complexity = _count_distinct(word_ids) / word_ids.size
     else:
-        doc._.vocabulary_complexity = None
-
-    return doc
-
+        vocabulary_complexity = None
 
-# Add custom components to pipeline
-nlp.add_pipe("formality_scorer", last=True)
-nlp.add_pipe("tone_classifier", last=True)
-nlp.add_pipe("rhythm_analyzer", last=True)
+    return {
+        "avg_sentence_length": float(sentence_lengths.mean()),
+        "sentence_length_std": sentence_length_std,
+        "vocabulary_complexity": vocabulary_complexity,
+        "num_sentences": int(sentence_lengths.size),
+    }
 
 
 def get_nlp_pipeline():
@@ -150,17 +190,62 @@ def get_nlp_pipeline():
     Get the configured SpaCy NLP pipeline (singleton pattern).
 
     Returns:
-        Configured SpaCy Language object with custom components.
+        Configured SpaCy Language object.
     """
     return nlp
 
 
+# Persistent worker pool, created on first use when NLP_PROCESS_WORKERS > 1
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _init_worker() -> None:
+    """Warm up the worker's pipeline (loaded on module import) before real work."""
+    nlp("Warm up.")
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared NLP process pool, or None when running in-process.
+
+    Workers are spawned (not forked) and load their own copy of the model.
+    BLAS is pinned to one thread per worker through the inherited
+    environment, otherwise K workers oversubscribe the cores.
+    """
+    global _executor
+
+    if settings.NLP_PROCESS_WORKERS <= 1:
+        return None
+
+    if _executor is None:
+        for var in ("OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+            os.environ.setdefault(var, "1")
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.NLP_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    return _executor
+
+
+def shutdown_nlp_executor() -> None:
+    """Stop the NLP worker pool if one was started."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
 def analyze_posts_batch(texts: list[str], batch_size: int = 100) -> list[dict]:
     """
     Process texts in batches and extract NLP metrics.
 
-    IMPORTANT: Never use n_process parameter inside Celery workers
-    (causes deadlock per research pitfall 2).
+    IMPORTANT: Never use spaCy's n_process parameter here (causes deadlocks
+    in worker processes per research pitfall 2). For parallelism set
+    NLP_PROCESS_WORKERS > 1: texts are sharded into batch_size chunks and
+    analyzed by a persistent spawned process pool.
 
     Args:
         texts: List of post texts to analyze
@@ -175,12 +260,67 @@ def analyze_posts_batch(texts: list[str], batch_size: int = 100) -> list[dict]:
         - sentence_length_std
         - vocabulary_complexity
         - num_sentences
+        - vulnerability_weight, marketing_jargon_penalty, link_density_penalty,
+          penalty_phrases (text-only scoring signals, see score_text_signals)
+    """
+    return list(analyze_posts_iter(texts, batch_size=batch_size))
+
+
+def analyze_posts_iter(texts: Iterable[str], batch_size: int = 100) -> Iterator[dict]:
+    """
+    Stream NLP metrics for texts, one result dict per text, in input order.
+
+    Same results as analyze_posts_batch. In-process, only one batch of docs
+    is alive at a time, so callers that write rows out as they go stay at
+    O(batch_size) memory. With a worker pool, chunk results are yielded in
+    order as they complete.
     """
+    executor = _get_executor()
+
+    # Inputs that fit in one batch aren't worth a round-trip to a worker
+    if executor is not None and isinstance(texts, (list, tuple)) and len(texts) <= batch_size:
+        executor = None
+
+    if executor is None:
+        docs = nlp.pipe(texts, batch_size=batch_size, disable=_METRICS_DISABLED)
+        for batch in _batched(docs, batch_size):
+            yield from _score_docs(batch)
+        return
+
+    chunks = _batched(texts, batch_size)
+    for chunk_results in executor.map(_analyze_chunk, chunks, repeat(batch_size)):
+        yield from chunk_results
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Yield consecutive lists of up to size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _analyze_chunk(texts: list[str], batch_size: int) -> list[dict]:
+    """Analyze one shard of texts in the current process (worker entry point)."""
+    return _score_docs(list(nlp.pipe(texts, batch_size=batch_size, disable=_METRICS_DISABLED)))
+
+
+def _score_docs(docs: list[Doc]) -> list[dict]:
+    """Compute metrics for one batch of parsed docs."""
+    stripped = [doc.text.strip() for doc in docs]
+
+    # Tone for the whole batch: VADER per text, labels in one vectorized pass
+    compounds = np.fromiter(
+        (_vader_compound(text) if text else 0.0 for text in stripped),
+        dtype=np.float64,
+        count=len(docs),
+    )
+    tones = _tone_labels(compounds)
+
     results = []
 
-    for doc in nlp.pipe(texts, batch_size=batch_size):
+    for doc, text, compound, tone in zip(docs, stripped, compounds.tolist(), tones):
         # Handle empty/None texts gracefully
-        if not doc.text.strip():
+        if not text:
             results.append({
                 "formality_score": None,
                 "tone": "neutral",
@@ -189,16 +329,16 @@ def analyze_posts_batch(texts: list[str], batch_size: int = 100) -> list[dict]:
                 "sentence_length_std": None,
                 "vocabulary_complexity": None,
                 "num_sentences": 0,
+                **score_text_signals(""),
             })
         else:
+            rhythm = _rhythm_metrics(doc)
             results.append({
-                "formality_score": doc._.formality_score,
-                "tone": doc._.tone,
-                "tone_compound": doc._.tone_compound,
-                "avg_sentence_length": doc._.avg_sentence_length,
-                "sentence_length_std": doc._.sentence_length_std,
-                "vocabulary_complexity": doc._.vocabulary_complexity,
-                "num_sentences": doc._.num_sentences,
+                "formality_score": _formality_score(doc, text, rhythm["num_sentences"]),
+                "tone": tone,
+                "tone_compound": compound,
+                **rhythm,
+                **score_text_signals(doc.text),
             })
 
     return results
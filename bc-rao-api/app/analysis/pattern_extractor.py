@@ -5,7 +5,168 @@ Detects promotional content, self-referential patterns, link spam,
 low-effort posts, and other patterns that communities typically reject.
 """
 
+import heapq
+import random
 import re
+from bisect import bisect_left
+from typing import Iterator, Optional
+
+
+class _RepeatedPhraseMatch:
+    """Minimal match object for _RepeatedPhraseDetector (group/start/end/span)."""
+
+    __slots__ = ("string", "_start", "_end")
+
+    def __init__(self, string: str, start: int, end: int):
+        self.string = string
+        self._start = start
+        self._end = end
+
+    def group(self, index: int = 0) -> str:
+        if index != 0:
+            raise IndexError("no such group")
+        return self.string[self._start:self._end]
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+    def span(self) -> tuple[int, int]:
+        return self._start, self._end
+
+
+class _RepeatedPhraseDetector:
+    """
+    Drop-in replacement for the repetitive-phrase regex (.{10,}?)\\1{2,}.
+
+    The backreference regex backtracks over every start position and every
+    phrase length, which blows up on long posts. This finds the same matches
+    (leftmost start, shortest phrase, greedy repetition, no newlines inside
+    the phrase) from the stretches where text[j] == text[j + d]: a phrase of
+    length d at i repeats r times exactly when such a stretch for d covers
+    [i, i + (r - 1) * d). A stretch that long fully covers one of the blocks
+    [m * d, (m + 1) * d), so only n / d blocks per d are probed, each in O(1)
+    with prefix hashes, for O(n log n) work overall.
+    """
+
+    pattern = r'(.{10,}?)\1{2,}'
+    flags = 0
+
+    def __init__(self, min_length: int = 10, min_repeats: int = 3):
+        self.min_length = min_length
+        self.min_repeats = min_repeats
+
+    def search(self, text: str) -> Optional[_RepeatedPhraseMatch]:
+        return next(self.finditer(text), None)
+
+    def finditer(self, text: str) -> Iterator[_RepeatedPhraseMatch]:
+        n = len(text)
+        if n < self.min_length * self.min_repeats:
+            return
+
+        # Valid starts per phrase length, as (first, last, d, stretch end)
+        starts = sorted(self._phrase_starts(text))
+        active: list[tuple[int, int, int]] = []
+        next_start = 0
+        i = 0
+        while True:
+            while next_start < len(starts) and starts[next_start][0] <= i:
+                _, last, d, stretch_end = starts[next_start]
+                heapq.heappush(active, (d, last, stretch_end))
+                next_start += 1
+            while active and active[0][1] < i:
+                heapq.heappop(active)
+
+            if not active:
+                if next_start == len(starts):
+                    return
+                i = max(i, starts[next_start][0])
+                continue
+
+            # Shortest phrase starting at i, repeated as far as it goes
+            d, _, stretch_end = active[0]
+            end = i + ((stretch_end - i) // d + 1) * d
+            yield _RepeatedPhraseMatch(text, i, end)
+            i = end
+
+    def _phrase_starts(self, text: str) -> Iterator[tuple[int, int, int, int]]:
+        """Start ranges of phrases of each length d repeated min_repeats+ times."""
+        n = len(text)
+        span = self.min_repeats - 1
+        hashes = _PrefixHashes(text)
+        newlines = [j for j, c in enumerate(text) if c == "\n"]
+
+        for d in range(self.min_length, n // self.min_repeats + 1):
+            j = 0
+            while j + 2 * d <= n:
+                if not (
+                    text[j] == text[j + d]
+                    and text[j + d - 1] == text[j + 2 * d - 1]
+                    and hashes.equal(j, j + d, d)
+                ):
+                    j += d
+                    continue
+
+                # Maximal stretch [a, b) with text[x] == text[x + d]
+                a = j - hashes.common_suffix(j, j + d, j)
+                b = j + d + hashes.common_prefix(j + d, j + 2 * d, n - j - 2 * d)
+                if b - a >= span * d:
+                    # The stretch is d-periodic, so any newline in it is in every phrase
+                    nl = bisect_left(newlines, a)
+                    if nl == len(newlines) or newlines[nl] >= a + d:
+                        yield a, b - span * d, d, b
+                j += (b - j) // d * d + d
+
+
+class _PrefixHashes:
+    """Polynomial prefix hashes for O(1) substring equality checks."""
+
+    _MOD = (1 << 61) - 1
+    # Random per process, so colliding texts can't be crafted ahead of time
+    _BASE = random.randrange(1 << 20, _MOD - 1)
+
+    def __init__(self, text: str):
+        mod, base = self._MOD, self._BASE
+        prefix = [0] * (len(text) + 1)
+        powers = [1] * (len(text) + 1)
+        for j, c in enumerate(text):
+            prefix[j + 1] = (prefix[j] * base + ord(c)) % mod
+            powers[j + 1] = powers[j] * base % mod
+        self._prefix = prefix
+        self._powers = powers
+
+    def _hash(self, start: int, length: int) -> int:
+        return (self._prefix[start + length] - self._prefix[start] * self._powers[length]) % self._MOD
+
+    def equal(self, x: int, y: int, length: int) -> bool:
+        return self._hash(x, length) == self._hash(y, length)
+
+    def common_prefix(self, x: int, y: int, limit: int) -> int:
+        """Length of the longest common prefix of text[x:] and text[y:], up to limit."""
+        return self._longest(lambda length: self.equal(x, y, length), limit)
+
+    def common_suffix(self, x: int, y: int, limit: int) -> int:
+        """Length of the longest common suffix of text[:x] and text[:y], up to limit."""
+        return self._longest(lambda length: self.equal(x - length, y - length, length), limit)
+
+    @staticmethod
+    def _longest(matches, limit: int) -> int:
+        # Gallop, then binary search: O(log L) for a common part of length L
+        low, step = 0, 1
+        while low + step <= limit and matches(low + step):
+            low += step
+            step *= 2
+        high = min(low + step, limit + 1)
+        while high - low > 1:
+            mid = (low + high) // 2
+            if matches(mid):
+                low = mid
+            else:
+                high = mid
+        return low
+
 
 # Pattern categories with compiled regex patterns
 PATTERN_CATEGORIES = {
@@ -51,7 +212,7 @@ PATTERN_CATEGORIES = {
     "Spam indicators": [
         re.compile(r'[!]{3,}'),  # Excessive exclamation
         re.compile(r'[A-Z\s]{20,}'),  # ALL CAPS sections
-        re.compile(r'(.{10,}?)\1{2,}'),  # Repetitive phrases (3+ times)
+        _RepeatedPhraseDetector(),  # Repetitive phrases (3+ times)
         re.compile(r'^.{500,}$(?!\n)', re.MULTILINE),  # Wall of text (500+ chars no paragraphs)
         re.compile(r'[\U0001F300-\U0001F9FF]{5,}'),  # Excessive emojis (5+)
     ],
@@ -63,10 +224,73 @@ PATTERN_CATEGORIES = {
 }
 
 
+# Flattened (category, pattern) table built once at import. The index into
+# this list is the pattern id used by the single-pass scan below.
+_PATTERN_TABLE = [
+    (category, pattern)
+    for category, patterns in PATTERN_CATEGORIES.items()
+    for pattern in patterns
+]
+
+_BACKREFERENCE = re.compile(r'\\[1-9]')
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+def _scoped(pattern: re.Pattern) -> str:
+    """Wrap a compiled pattern's source so its flags survive alternation."""
+    flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+    return f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})"
+
+
+def _is_mergeable(pattern) -> bool:
+    """Whether a pattern can be folded into a category's union prefilter."""
+    return isinstance(pattern, re.Pattern) and not _BACKREFERENCE.search(pattern.pattern)
+
+
+def _build_category_scans() -> list[tuple[str, "re.Pattern | None", list, list]]:
+    """
+    Group pattern ids per category behind a union-regex prefilter.
+
+    A text that misses the union cannot match any pattern merged into it, so
+    the category's patterns only run on texts the union hit. Patterns with
+    backreferences cannot be merged (group numbers shift) and non-regex
+    detectors have no source to merge; both always run.
+    """
+    scans = []
+    for category in PATTERN_CATEGORIES:
+        members = [
+            (pattern_id, pattern)
+            for pattern_id, (pattern_category, pattern) in enumerate(_PATTERN_TABLE)
+            if pattern_category == category
+        ]
+        ungated = [(i, p) for i, p in members if not _is_mergeable(p)]
+        merged = [p for i, p in members if _is_mergeable(p)]
+        prefilter = re.compile("|".join(_scoped(p) for p in merged)) if merged else None
+        scans.append((category, prefilter, members, ungated))
+    return scans
+
+
+# (category, prefilter, all [(id, pattern)], always-run [(id, pattern)])
+_CATEGORY_SCANS = _build_category_scans()
+
+
+def _severity_for_percentage(percentage: float) -> str:
+    """Map share of posts matching a pattern to a severity label."""
+    if percentage > 20:
+        return "high"
+    if percentage >= 10:
+        return "medium"
+    return "low"
+
+
 def extract_forbidden_patterns(texts: list[str]) -> dict:
     """
     Scan texts for forbidden patterns and categorize them.
 
+    Each text is visited once: per category a union prefilter decides whether
+    the individual patterns need to run, and hits are dispatched to
+    per-pattern counters and per-category post sets.
+
     Args:
         texts: List of post texts to analyze
 
@@ -81,42 +305,33 @@ def extract_forbidden_patterns(texts: list[str]) -> dict:
             "detected_patterns": [],
         }
 
-    # Track matches per category
-    category_matches = {category: 0 for category in PATTERN_CATEGORIES}
-    pattern_details = []
-
     total_posts = len(texts)
+    matches_in_posts = [0] * len(_PATTERN_TABLE)
+    matched_posts = {category: set() for category in PATTERN_CATEGORIES}
 
-    for category, patterns in PATTERN_CATEGORIES.items():
-        matched_posts = set()
-
-        for pattern in patterns:
-            matches_in_posts = 0
-
-            for i, text in enumerate(texts):
+    for i, text in enumerate(texts):
+        for category, prefilter, members, ungated in _CATEGORY_SCANS:
+            candidates = members if prefilter and prefilter.search(text) else ungated
+            for pattern_id, pattern in candidates:
                 if pattern.search(text):
-                    matches_in_posts += 1
-                    matched_posts.add(i)
-
-            if matches_in_posts > 0:
-                # Calculate severity based on percentage of posts
-                percentage = (matches_in_posts / total_posts) * 100
+                    matches_in_posts[pattern_id] += 1
+                    matched_posts[category].add(i)
 
-                if percentage > 20:
-                    severity = "high"
-                elif percentage >= 10:
-                    severity = "medium"
-                else:
-                    severity = "low"
-
-                pattern_details.append({
-                    "category": category,
-                    "pattern_description": pattern.pattern[:50],  # First 50 chars of regex
-                    "match_count": matches_in_posts,
-                    "severity": severity,
-                })
+    pattern_details = []
+    for pattern_id, (category, pattern) in enumerate(_PATTERN_TABLE):
+        count = matches_in_posts[pattern_id]
+        if count > 0:
+            # Severity based on percentage of posts
+            pattern_details.append({
+                "category": category,
+                "pattern_description": pattern.pattern[:50],  # First 50 chars of regex
+                "match_count": count,
+                "severity": _severity_for_percentage((count / total_posts) * 100),
+            })
 
-        category_matches[category] = len(matched_posts)
+    category_matches = {
+        category: len(posts) for category, posts in matched_posts.items()
+    }
 
     # Sort pattern details by match count (descending)
     pattern_details.sort(key=lambda x: x["match_count"], reverse=True)
@@ -143,8 +358,9 @@ def check_post_penalties(text: str) -> list[dict]:
     penalties = []
     seen_phrases = set()
 
-    for category, patterns in PATTERN_CATEGORIES.items():
-        for pattern in patterns:
+    for category, prefilter, members, ungated in _CATEGORY_SCANS:
+        candidates = members if prefilter and prefilter.search(text) else ungated
+        for _, pattern in candidates:
             for match in pattern.finditer(text):
                 # Extract actual matched text (not the regex pattern)
                 phrase = match.group(0)
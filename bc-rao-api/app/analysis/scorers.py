@@ -5,7 +5,9 @@ Calculates how well a post matches community behavioral patterns and
 quantifies community sensitivity to marketing content.
 """
 
+import heapq
 import re
+from bisect import bisect_left
 from typing import Optional
 
 # Compiled regex patterns for vulnerability detection
@@ -36,10 +38,50 @@ JARGON_PATTERNS = [
     re.compile(r'\bgrowth hack\w*\b', re.IGNORECASE),
 ]
 
+# Score buckets. Vulnerability: 0 matches = 0, 1-3 = 3, 4-6 = 5, 7-10 = 7
+# (past 10 the score ramps toward 10). Jargon and link ladders are indexed by
+# match count, capped at the last entry.
+_VULNERABILITY_BOUNDS = (0, 3, 6, 10)
+_VULNERABILITY_SCORES = (0.0, 3.0, 5.0, 7.0)
+_JARGON_LADDER = ((0.0, "none"), (3.0, "low"), (5.0, "medium"), (8.0, "high"))
+_LINK_LADDER = ((0.0, "none"), (3.0, "low"), (6.0, "medium"), (9.0, "high"))
+
+# Literal roots: every case-insensitive JARGON_PATTERNS match contains one of
+# these (lowercased). ROI is the only case-sensitive pattern.
+_JARGON_ROOTS = (
+    "synerg", "leverage", "paradigm", "disrupt", "innovate", "game-changer",
+    "thought leader", "best-in-class", "reach out", "circle back", "touch base",
+    "revolutionary", "cutting-edge", "scalable", "growth hack",
+)
+
 # URL detection pattern
 URL_PATTERN = re.compile(r'https?://\S+|www\.\S+', re.IGNORECASE)
 
 
+def _scoped(pattern: re.Pattern) -> str:
+    """Wrap a compiled pattern's source so its case flag survives alternation."""
+    if pattern.flags & re.IGNORECASE:
+        return f"(?i:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
+
+
+# Fused jargon + URL scan used by calculate_post_score. Every alternative sits
+# inside a zero-width lookahead, so each start position is tried once and no
+# hit consumes text another pattern could match (e.g. jargon inside a URL).
+# Group "j<i>" is JARGON_PATTERNS[i]; group "url" is URL_PATTERN.
+_PENALTY_SCAN = re.compile(
+    "(?=" + "|".join(
+        [f"(?P<j{i}>{_scoped(p)})" for i, p in enumerate(JARGON_PATTERNS)]
+        + [f"(?P<url>{_scoped(URL_PATTERN)})"]
+    ) + ")"
+)
+
+# All vulnerability markers in one alternation. The four pattern sets match
+# disjoint whole words or "?", so one pass counts exactly what four findall
+# calls did.
+_VULNERABILITY_SCAN = re.compile("|".join(_scoped(p) for p in VULNERABILITY_PATTERNS))
+
+
 def calculate_vulnerability_weight(text: str) -> float:
     """
     Calculate vulnerability/authenticity score based on personal language.
@@ -55,23 +97,19 @@ def calculate_vulnerability_weight(text: str) -> float:
     if not text:
         return 0.0
 
-    matches = 0
-    for pattern in VULNERABILITY_PATTERNS:
-        matches += len(pattern.findall(text))
-
-    # Scale: 0 matches = 0, 1-3 = 3, 4-6 = 5, 7-10 = 7, 10+ = 9-10
-    if matches == 0:
-        score = 0.0
-    elif matches <= 3:
-        score = 3.0
-    elif matches <= 6:
-        score = 5.0
-    elif matches <= 10:
-        score = 7.0
-    else:
-        score = min(10.0, 7.0 + (matches - 10) * 0.3)
+    return _vulnerability_score(_count_vulnerability_markers(text))
 
-    return round(score, 2)
+
+def _count_vulnerability_markers(text: str) -> int:
+    """Count personal, question, emotional, and storytelling markers."""
+    return sum(1 for _ in _VULNERABILITY_SCAN.finditer(text))
+
+
+def _vulnerability_score(matches: int) -> float:
+    """Map a vulnerability marker count to its 0-10 score."""
+    if matches > 10:
+        return round(min(10.0, 7.0 + (matches - 10) * 0.3), 2)
+    return _VULNERABILITY_SCORES[bisect_left(_VULNERABILITY_BOUNDS, matches)]
 
 
 def calculate_rhythm_adherence(
@@ -143,37 +181,46 @@ def calculate_marketing_jargon_penalty(text: str) -> tuple[float, list[dict]]:
         - penalty_score: 0-10 (higher = worse, more jargon)
         - penalty_phrases: List of {phrase, severity, category} dicts
     """
-    if not text:
+    if not text or not _may_contain_jargon(text):
         return 0.0, []
 
+    return _jargon_penalty_from_matches(
+        [match.group(0) for pattern in JARGON_PATTERNS for match in pattern.finditer(text)]
+    )
+
+
+def _may_contain_jargon(text: str) -> bool:
+    """
+    Literal prescreen for JARGON_PATTERNS using C-level substring search.
+
+    Only applied to ASCII text: with Unicode, re.IGNORECASE also folds
+    characters such as U+017F or U+0130 onto ASCII letters, which
+    str.lower() does not, so non-ASCII text always goes to the regexes.
+    """
+    if not text.isascii():
+        return True
+    if "ROI" in text:
+        return True
+    lowered = text.lower()
+    return any(root in lowered for root in _JARGON_ROOTS)
+
+
+def _jargon_penalty_from_matches(phrases: list[str]) -> tuple[float, list[dict]]:
+    """Score jargon hits (in JARGON_PATTERNS order) after case-insensitive dedupe."""
     matches = []
     seen_phrases = set()
 
-    for pattern in JARGON_PATTERNS:
-        for match in pattern.finditer(text):
-            phrase = match.group(0)
-            if phrase.lower() not in seen_phrases:
-                seen_phrases.add(phrase.lower())
-                matches.append(phrase)
+    for phrase in phrases:
+        if phrase.lower() not in seen_phrases:
+            seen_phrases.add(phrase.lower())
+            matches.append(phrase)
 
     num_matches = len(matches)
 
     # Calculate penalty: 0 = none, 1 = 3, 2 = 5, 3 = 8, 4+ = 9-10
-    if num_matches == 0:
-        penalty = 0.0
-        severity = "none"
-    elif num_matches == 1:
-        penalty = 3.0
-        severity = "low"
-    elif num_matches == 2:
-        penalty = 5.0
-        severity = "medium"
-    elif num_matches == 3:
-        penalty = 8.0
-        severity = "high"
-    else:
+    penalty, severity = _JARGON_LADDER[min(num_matches, 3)]
+    if num_matches > 3:
         penalty = min(10.0, 8.0 + (num_matches - 3) * 0.5)
-        severity = "high"
 
     penalty_phrases = [
         {"phrase": phrase, "severity": severity, "category": "Promotional"}
@@ -198,22 +245,24 @@ def calculate_link_density_penalty(text: str) -> tuple[float, list[dict]]:
     if not text:
         return 0.0, []
 
-    links = URL_PATTERN.findall(text)
+    # Most posts have no links; skip the regex walk unless a URL marker exists
+    if not _may_contain_url(text):
+        return _link_penalty_from_matches([])
+
+    return _link_penalty_from_matches(URL_PATTERN.findall(text))
+
+
+def _may_contain_url(text: str) -> bool:
+    """Cheap substring prescreen: every URL_PATTERN match contains '://' or 'www.'."""
+    return "://" in text or "www." in text.lower()
+
+
+def _link_penalty_from_matches(links: list[str]) -> tuple[float, list[dict]]:
+    """Score URL hits by count."""
     num_links = len(links)
 
     # Calculate penalty: 0 links = 0, 1 = 3, 2 = 6, 3+ = 9
-    if num_links == 0:
-        penalty = 0.0
-        severity = "none"
-    elif num_links == 1:
-        penalty = 3.0
-        severity = "low"
-    elif num_links == 2:
-        penalty = 6.0
-        severity = "medium"
-    else:
-        penalty = 9.0
-        severity = "high"
+    penalty, severity = _LINK_LADDER[min(num_links, 3)]
 
     penalty_phrases = [
         {"phrase": link, "severity": severity, "category": "Link patterns"}
@@ -223,6 +272,48 @@ def calculate_link_density_penalty(text: str) -> tuple[float, list[dict]]:
     return round(penalty, 2), penalty_phrases
 
 
+def _scan_penalties(text: str) -> tuple[float, list[dict], float, list[dict]]:
+    """
+    Compute jargon and link penalties with one pass over the text.
+
+    Equivalent to calling calculate_marketing_jargon_penalty and
+    calculate_link_density_penalty separately: hits are filtered per pattern
+    to finditer's non-overlapping semantics and jargon phrases are reported
+    in JARGON_PATTERNS order.
+    """
+    if not text:
+        return 0.0, [], 0.0, []
+
+    # Most posts contain no jargon root; then only the URL regex can hit
+    if not _may_contain_jargon(text):
+        link_penalty, link_phrases = calculate_link_density_penalty(text)
+        return 0.0, [], link_penalty, link_phrases
+
+    jargon_hits: list[list[str]] = [[] for _ in JARGON_PATTERNS]
+    jargon_ends = [0] * len(JARGON_PATTERNS)
+    links = []
+    link_end = 0
+
+    for match in _PENALTY_SCAN.finditer(text):
+        name = match.lastgroup
+        start = match.start(name)
+        if name == "url":
+            if start >= link_end:
+                link_end = match.end(name)
+                links.append(match.group(name))
+        else:
+            i = int(name[1:])
+            if start >= jargon_ends[i]:
+                jargon_ends[i] = match.end(name)
+                jargon_hits[i].append(match.group(name))
+
+    jargon_penalty, jargon_phrases = _jargon_penalty_from_matches(
+        [phrase for hits in jargon_hits for phrase in hits]
+    )
+    link_penalty, link_phrases = _link_penalty_from_matches(links)
+    return jargon_penalty, jargon_phrases, link_penalty, link_phrases
+
+
 def calculate_burstiness_score(
     post_sentence_length_std: Optional[float],
     post_avg_sentence_length: Optional[float],
@@ -264,6 +355,36 @@ def calculate_burstiness_score(
         return round(min(10.0, 6.0 + (post_cv - 0.3) * 6.67), 2)  # 6-10 range for good CV
 
 
+# Scores that depend only on the post text (not on the community profile)
+TEXT_SIGNAL_KEYS = (
+    "vulnerability_weight",
+    "marketing_jargon_penalty",
+    "link_density_penalty",
+    "penalty_phrases",
+)
+
+
+def score_text_signals(text: str) -> dict:
+    """
+    Compute the text-only scoring signals in one place.
+
+    analyze_posts_batch attaches these to its results so the regex work
+    happens alongside the NLP pass (and in its worker processes, when
+    enabled); calculate_post_score then reuses them instead of rescanning.
+
+    Returns:
+        Dict keyed by TEXT_SIGNAL_KEYS
+    """
+    jargon_penalty, jargon_phrases, link_penalty, link_phrases = _scan_penalties(text)
+
+    return {
+        "vulnerability_weight": calculate_vulnerability_weight(text),
+        "marketing_jargon_penalty": jargon_penalty,
+        "link_density_penalty": link_penalty,
+        "penalty_phrases": jargon_phrases + link_phrases,
+    }
+
+
 def calculate_post_score(post_data: dict, community_avg: dict) -> dict:
     """
     Calculate comprehensive post success score.
@@ -271,7 +392,9 @@ def calculate_post_score(post_data: dict, community_avg: dict) -> dict:
     Args:
         post_data: Post's NLP results + engagement data
             Required keys: raw_text
-            Optional: formality_score, avg_sentence_length, sentence_length_std
+            Optional: formality_score, avg_sentence_length, sentence_length_std,
+            and the TEXT_SIGNAL_KEYS from score_text_signals (reused when all
+            are present, otherwise computed from raw_text)
         community_avg: Community average profile
             Optional: avg_sentence_length, sentence_length_std, formality_level
 
@@ -286,10 +409,13 @@ def calculate_post_score(post_data: dict, community_avg: dict) -> dict:
         - total_score (0-10)
         - penalty_phrases (list of dicts)
     """
-    text = post_data.get("raw_text", "")
+    if all(key in post_data for key in TEXT_SIGNAL_KEYS):
+        signals = post_data
+    else:
+        signals = score_text_signals(post_data.get("raw_text", ""))
 
     # Calculate positive factors
-    vulnerability = calculate_vulnerability_weight(text)
+    vulnerability = signals["vulnerability_weight"]
     rhythm = calculate_rhythm_adherence(
         post_data.get("avg_sentence_length"),
         post_data.get("sentence_length_std"),
@@ -306,12 +432,10 @@ def calculate_post_score(post_data: dict, community_avg: dict) -> dict:
         community_avg.get("burstiness_cv"),
     )
 
-    # Calculate penalties
-    jargon_penalty, jargon_phrases = calculate_marketing_jargon_penalty(text)
-    link_penalty, link_phrases = calculate_link_density_penalty(text)
-
-    # Combined penalty phrases
-    penalty_phrases = jargon_phrases + link_phrases
+    # Penalties (jargon + links from a single fused scan over the text)
+    jargon_penalty = signals["marketing_jargon_penalty"]
+    link_penalty = signals["link_density_penalty"]
+    penalty_phrases = list(signals["penalty_phrases"])
 
     # Total score formula (with burstiness)
     total = (
@@ -338,6 +462,22 @@ def calculate_post_score(post_data: dict, community_avg: dict) -> dict:
     }
 
 
+def _has_jargon(post: dict) -> bool:
+    """Whether a post carries a jargon penalty, reusing calculate_post_score output."""
+    penalty = post.get("marketing_jargon_penalty")
+    if penalty is None:
+        penalty = calculate_marketing_jargon_penalty(post.get("raw_text", ""))[0]
+    return penalty > 0
+
+
+def _has_links(post: dict) -> bool:
+    """Whether a post carries a link penalty, reusing calculate_post_score output."""
+    penalty = post.get("link_density_penalty")
+    if penalty is None:
+        penalty = calculate_link_density_penalty(post.get("raw_text", ""))[0]
+    return penalty > 0
+
+
 def calculate_isc_score(posts_data: list[dict]) -> float:
     """
     Calculate ISC (Intrinsic Sensitivity Coefficient) for a community.
@@ -348,7 +488,10 @@ def calculate_isc_score(posts_data: list[dict]) -> float:
     Args:
         posts_data: List of post dicts with NLP + engagement data
             Each dict should have: raw_text, formality_score, avg_sentence_length,
-            vulnerability_weight (calculated), total_score (calculated)
+            vulnerability_weight (calculated), total_score (calculated).
+            marketing_jargon_penalty / link_density_penalty from
+            calculate_post_score are reused when present; otherwise the
+            penalties are recomputed from raw_text.
 
     Returns:
         ISC score (1.0 to 10.0)
@@ -359,17 +502,23 @@ def calculate_isc_score(posts_data: list[dict]) -> float:
     if len(posts_data) < 10:
         raise ValueError(f"Insufficient data: need at least 10 posts, got {len(posts_data)}")
 
-    # Sort posts by total_score
-    sorted_posts = sorted(posts_data, key=lambda p: p.get("total_score", 0), reverse=True)
+    # Pull the aggregated fields into columns once; everything below works
+    # on post indices and list lookups instead of repeated dict gets.
+    n = len(posts_data)
+    scores = [p.get("total_score", 0) for p in posts_data]
+    vulnerability = [p.get("vulnerability_weight", 0) for p in posts_data]
 
-    # Split into top 25% and bottom 25%
-    top_quartile_size = max(1, len(sorted_posts) // 4)
-    top_posts = sorted_posts[:top_quartile_size]
-    bottom_posts = sorted_posts[-top_quartile_size:]
+    # Select top 25% and bottom 25% by total_score without a full sort.
+    # Both selections match slicing a stable descending sort, ties included:
+    # nlargest is documented as sorted(..., reverse=True)[:n], and the tail of
+    # that sort is nsmallest over the reversed input, read back in reverse.
+    top_quartile_size = max(1, n // 4)
+    top_idx = heapq.nlargest(top_quartile_size, range(n), key=scores.__getitem__)
+    bottom_idx = heapq.nsmallest(top_quartile_size, reversed(range(n)), key=scores.__getitem__)[::-1]
 
     # Factor 1: Jargon sensitivity (0-10)
-    top_jargon = sum(1 for p in top_posts if calculate_marketing_jargon_penalty(p.get("raw_text", ""))[0] > 0)
-    bottom_jargon = sum(1 for p in bottom_posts if calculate_marketing_jargon_penalty(p.get("raw_text", ""))[0] > 0)
+    top_jargon = sum(1 for i in top_idx if _has_jargon(posts_data[i]))
+    bottom_jargon = sum(1 for i in bottom_idx if _has_jargon(posts_data[i]))
 
     if bottom_jargon > 0:
         jargon_ratio = top_jargon / bottom_jargon
@@ -378,8 +527,8 @@ def calculate_isc_score(posts_data: list[dict]) -> float:
         jargon_sensitivity = 5.0  # Default if no jargon in bottom quartile
 
     # Factor 2: Link sensitivity (0-10)
-    top_links = sum(1 for p in top_posts if calculate_link_density_penalty(p.get("raw_text", ""))[0] > 0)
-    bottom_links = sum(1 for p in bottom_posts if calculate_link_density_penalty(p.get("raw_text", ""))[0] > 0)
+    top_links = sum(1 for i in top_idx if _has_links(posts_data[i]))
+    bottom_links = sum(1 for i in bottom_idx if _has_links(posts_data[i]))
 
     if bottom_links > 0:
         link_ratio = top_links / bottom_links
@@ -388,25 +537,27 @@ def calculate_isc_score(posts_data: list[dict]) -> float:
         link_sensitivity = 5.0  # Default if no links in bottom quartile
 
     # Factor 3: Vulnerability preference (0-10)
-    top_vulnerability = sum(p.get("vulnerability_weight", 0) for p in top_posts) / len(top_posts)
-    bottom_vulnerability = sum(p.get("vulnerability_weight", 0) for p in bottom_posts) / len(bottom_posts)
+    top_vulnerability = sum(vulnerability[i] for i in top_idx) / len(top_idx)
+    bottom_vulnerability = sum(vulnerability[i] for i in bottom_idx) / len(bottom_idx)
 
     vulnerability_diff = top_vulnerability - bottom_vulnerability
     vulnerability_preference = max(0.0, min(10.0, 5.0 + vulnerability_diff))
 
     # Factor 4: Depth correlation (0-10)
     # Check if higher comment count correlates with authenticity
-    posts_with_comments = [p for p in posts_data if p.get("comment_count", 0) > 0]
+    comment_counts = [p.get("comment_count", 0) for p in posts_data]
+    with_comments = [i for i in range(n) if comment_counts[i] > 0]
 
-    if len(posts_with_comments) >= 5:
-        # Sort by comment count
-        by_comments = sorted(posts_with_comments, key=lambda p: p.get("comment_count", 0), reverse=True)
-        top_discussed = by_comments[:len(by_comments) // 4] if len(by_comments) >= 4 else by_comments[:2]
+    if len(with_comments) >= 5:
+        # Most-discussed quarter (stable, same as sorting by comment count)
+        top_discussed = heapq.nlargest(
+            len(with_comments) // 4, with_comments, key=comment_counts.__getitem__
+        )
 
         # Calculate average authenticity (formality_match + vulnerability) of top-discussed
         authenticity_scores = [
-            (p.get("formality_match", 5) + p.get("vulnerability_weight", 0)) / 2
-            for p in top_discussed
+            (posts_data[i].get("formality_match", 5) + vulnerability[i]) / 2
+            for i in top_discussed
         ]
         avg_authenticity = sum(authenticity_scores) / len(authenticity_scores)
 
@@ -8,12 +8,98 @@ SpaCy capabilities already loaded but previously unused.
 Zero API cost - all processing is local using the existing en_core_web_md model.
 """
 
+import copy
+import hashlib
+import math
+import os
 import re
-import statistics
-from collections import Counter
+from collections import Counter, OrderedDict
+from heapq import nlargest
+from itertools import chain
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+from spacy.attrs import IDX, IS_ALPHA, IS_STOP, LEMMA, LENGTH, LOWER, ORTH, POS, SENT_START
+from spacy.symbols import VERB
+
 from app.analysis.nlp_pipeline import nlp
+from app.config import settings
+
+# spaCy worker processes for nlp.pipe. Past ~4 workers fork/IPC overhead
+# outweighs the gain on 50-100 post batches. Smaller batches keep several
+# workers fed; 50 is best single-process.
+_PIPE_N_PROCESS = max(1, min(settings.STYLE_EXTRACTOR_NPROC, 4, os.cpu_count() or 1))
+_PIPE_BATCH_SIZE = 25 if _PIPE_N_PROCESS > 1 else 50
+
+# Recent fingerprints keyed by a digest of the input texts. Analysis reruns and
+# generation retries for a campaign repeat the same inputs; hits skip SpaCy.
+_STYLE_CACHE_SIZE = 64
+_style_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+# Token attribute columns read with Doc.to_array instead of per-token access
+_VOCAB_ATTRS = [IS_ALPHA, IS_STOP, LENGTH, LEMMA, LOWER, ORTH]
+_STRUCTURE_ATTRS = [IS_ALPHA, POS, SENT_START, IDX, LENGTH]
+
+# Common Unicode emoji ranges (inclusive code points)
+_EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F680, 0x1F6FF),  # transport & map
+    (0x1F1E0, 0x1F1FF),  # flags
+    (0x2702, 0x27B0),  # dingbats
+    (0xFE00, 0xFE0F),  # variation selectors
+    (0x1F900, 0x1F9FF),  # supplemental symbols
+)
+
+# Emoji regex, one match per run of consecutive emoji
+_EMOJI_RE = re.compile(
+    "[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _EMOJI_RANGES) + "]+",
+    flags=re.UNICODE,
+)
+
+
+def _build_emoji_table() -> np.ndarray:
+    """Boolean lookup by code point; the final entry is a False sentinel."""
+    table = np.zeros(max(hi for _, hi in _EMOJI_RANGES) + 2, dtype=bool)
+    for lo, hi in _EMOJI_RANGES:
+        table[lo:hi + 1] = True
+    return table
+
+
+_EMOJI_TABLE = _build_emoji_table()
+
+# Below this length the regex beats the array setup cost
+_EMOJI_TABLE_MIN_LENGTH = 512
+
+# Formatting conventions
+_TLDR_RE = re.compile(r"tl;?dr|TL;?DR", re.IGNORECASE)
+_EDIT_RE = re.compile(r"^(?:EDIT|UPDATE|ETA)\s*:", re.MULTILINE)
+_LINK_RE = re.compile(r"https?://\S+")
+_CODE_RE = re.compile(r"```|    \S")  # fenced or indented code
+
+# Imperfections
+# Parenthetical regex: 5+ chars inside parens (filters emoticons/short asides)
+_PARENTHETICAL_RE = re.compile(r'\([^)]{5,}\)')
+# Self-correction markers
+_SELF_CORRECTION_RE = re.compile(
+    r'\b(?:I mean|actually|wait|edit:|update:|sorry,? I meant)\b',
+    re.IGNORECASE,
+)
+# Mid-sentence dash interruptions (space-dash-space or em-dash)
+_DASH_RE = re.compile(r'\s[-\u2013\u2014]{1,2}\s')
+
+# Literals every match of a regex must contain, checked with `in` before the
+# regex runs. Case-insensitive ones are checked against _fold_case(text).
+_TLDR_LITERALS = ("tl",)
+_SELF_CORRECTION_LITERALS = ("i mean", "actually", "wait", "edit:", "update:", "sorry")
+_EDIT_LITERALS = ("EDIT", "UPDATE", "ETA")
+_CODE_LITERALS = ("```", "    ")
+_DASH_LITERALS = ("-", "\u2013", "\u2014")
+
+# Non-ASCII letters IGNORECASE matches to an ASCII letter that str.lower()
+# doesn't map to it: dotless i and long s (re's extra cases), and dotted
+# capital I, whose full lowercase is two code points.
+_IGNORECASE_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
 
 
 def extract_community_style(
@@ -40,205 +126,516 @@ def extract_community_style(
 
     top_texts = top_texts or texts[:20]
 
-    # Process all texts through SpaCy
-    docs = list(nlp.pipe(texts, batch_size=50))
-    top_docs = list(nlp.pipe(top_texts, batch_size=50))
+    key = _style_cache_key(texts, top_texts)
+    cached = _style_cache.get(key)
+    if cached is None:
+        cached = _compute_community_style(texts, top_texts)
+        _style_cache[key] = cached
+        if len(_style_cache) > _STYLE_CACHE_SIZE:
+            _style_cache.popitem(last=False)
+    else:
+        _style_cache.move_to_end(key)
+
+    # Callers own their copy; the cached dict must never be mutated
+    return copy.deepcopy(cached)
+
+
+def _style_cache_key(texts: List[str], top_texts: List[str]) -> bytes:
+    """
+    Digest of both text lists.
+
+    Every text is length-prefixed, so no choice of separators inside the
+    texts can make two different inputs hash the same byte stream.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for group in (texts, top_texts):
+        digest.update(len(group).to_bytes(8, "little"))
+        for text in group:
+            encoded = text.encode("utf-8", "surrogatepass")
+            digest.update(len(encoded).to_bytes(8, "little"))
+            digest.update(encoded)
+    return digest.digest()
+
+
+def _compute_community_style(texts: List[str], top_texts: List[str]) -> Dict[str, Any]:
+    """
+    Build the style fingerprint (uncached body of extract_community_style).
+
+    Docs are consumed as SpaCy streams them: each one updates the
+    vocabulary and structure accumulators (and, for top posts, yields its
+    noun phrases) and is then dropped, so only one batch of docs is alive
+    at a time.
+    """
+    extra_texts, top_indices = _plan_parse(texts, top_texts)
+    wanted_top = set(top_indices)
+
+    vocabulary = _VocabularyAccumulator()
+    structure = _StructureAccumulator()
+    noun_phrases = {}
+
+    docs = nlp.pipe(
+        chain(texts, extra_texts),
+        batch_size=_PIPE_BATCH_SIZE,
+        n_process=_PIPE_N_PROCESS,
+    )
+    for i, doc in enumerate(docs):
+        if i < len(texts):
+            vocabulary.update(doc)
+            structure.update(doc, texts[i])
+        if i in wanted_top:
+            noun_phrases[i] = _noun_phrases(doc)
+
+    # One pass over the raw text of each post for all character/regex counts
+    text_stats = _text_stat_means(texts)
 
-    vocabulary = _extract_vocabulary(docs, top_docs)
-    structure = _extract_structure(docs, texts)
-    punctuation = _extract_punctuation(docs, texts)
-    formatting = _extract_formatting(texts)
-    openings = _extract_openings(top_texts)
-    imperfections = _extract_imperfections(docs, texts)
+    structure_metrics, imperfections = structure.finalize(text_stats)
 
     return {
-        "vocabulary": vocabulary,
-        "structure": structure,
-        "punctuation": punctuation,
-        "formatting": formatting,
-        "openings": openings,
+        "vocabulary": vocabulary.finalize([noun_phrases[i] for i in top_indices]),
+        "structure": structure_metrics,
+        "punctuation": _extract_punctuation(text_stats),
+        "formatting": _extract_formatting(text_stats),
+        "openings": _extract_openings(top_texts),
         "imperfections": imperfections,
     }
 
 
-def _extract_vocabulary(docs, top_docs) -> Dict[str, Any]:
-    """Extract vocabulary patterns using SpaCy token analysis."""
-    # All-posts lemma frequency (non-stop, alphabetic tokens)
-    lemma_counter = Counter()
-    oov_counter = Counter()
-    word_lengths = []
-
-    for doc in docs:
-        for token in doc:
-            if token.is_alpha and not token.is_stop and len(token.text) > 2:
-                lemma_counter[token.lemma_.lower()] += 1
-                word_lengths.append(len(token.text))
-            # OOV tokens = likely slang, jargon, abbreviations
-            if token.is_oov and token.is_alpha and len(token.text) > 1:
-                oov_counter[token.text.lower()] += 1
-
-    # Top-posts noun phrases (what the community talks about)
-    noun_phrase_counter = Counter()
-    for doc in top_docs:
-        for chunk in doc.noun_chunks:
-            # Skip very short or very long phrases
-            phrase = chunk.text.lower().strip()
-            if 2 < len(phrase) < 60 and len(phrase.split()) <= 5:
-                noun_phrase_counter[phrase] += 1
-
-    # Filter OOV to those appearing 2+ times (reduces noise)
-    filtered_oov = {k: v for k, v in oov_counter.items() if v >= 2}
-
-    # Calculate stop word ratio (higher = more casual)
-    total_tokens = sum(1 for doc in docs for token in doc if token.is_alpha)
-    stop_tokens = sum(1 for doc in docs for token in doc if token.is_stop)
-    stop_ratio = stop_tokens / total_tokens if total_tokens > 0 else 0.0
+def _plan_parse(texts: List[str], top_texts: List[str]) -> tuple[List[str], List[int]]:
+    """
+    Decide what SpaCy parses: texts plus any top texts not already among them.
 
-    return {
-        "top_terms": [t for t, _ in lemma_counter.most_common(30)],
-        "top_noun_phrases": [p for p, _ in noun_phrase_counter.most_common(20)],
-        "oov_tokens": [t for t, _ in sorted(filtered_oov.items(), key=lambda x: -x[1])[:20]],
-        "avg_word_length": round(statistics.mean(word_lengths), 1) if word_lengths else 0.0,
-        "stop_word_ratio": round(stop_ratio, 3),
-    }
+    Top texts are normally a subset of texts (a prefix by default, or the
+    highest-scoring posts), so their docs are reused instead of parsing
+    those posts a second time.
+
+    Returns:
+        Tuple of (extra texts to parse after texts, stream index of each top text)
+    """
+    index_of = {}
+    for i, text in enumerate(texts):
+        index_of.setdefault(text, i)
+
+    extra_texts = []
+    for text in top_texts:
+        if text not in index_of:
+            index_of[text] = len(texts) + len(extra_texts)
+            extra_texts.append(text)
+
+    return extra_texts, [index_of[text] for text in top_texts]
+
+
+def _noun_phrases(doc) -> List[str]:
+    """Noun phrases of one top post, skipping very short or very long ones."""
+    phrases = []
+    for chunk in doc.noun_chunks:
+        phrase = chunk.text.lower().strip()
+        if 2 < len(phrase) < 60 and len(phrase.split()) <= 5:
+            phrases.append(phrase)
+    return phrases
+
+
+class _VocabularyAccumulator:
+    """
+    Vocabulary patterns using SpaCy token analysis, fed one doc at a time.
 
+    Token flags, lengths and string hashes are read per doc with
+    Doc.to_array and filtered with NumPy masks; only the filtered hash
+    columns are kept, and strings are resolved once per distinct hash.
+    """
+
+    def __init__(self):
+        self.lemma_ids = []
+        self.word_lengths = []
+        self.oov_candidates = []
+        self.total_tokens = 0
+        self.stop_tokens = 0
+
+    def update(self, doc) -> None:
+        attrs = doc.to_array(_VOCAB_ATTRS)
+        is_alpha = attrs[:, 0] == 1
+        is_stop = attrs[:, 1] == 1
+        length = attrs[:, 2]
+
+        # Stop word ratio counts (higher = more casual)
+        self.total_tokens += int(np.count_nonzero(is_alpha))
+        self.stop_tokens += int(np.count_nonzero(is_stop))
+
+        # All-posts lemma frequency (non-stop, alphabetic tokens)
+        content = is_alpha & ~is_stop & (length > 2)
+        self.lemma_ids.append(attrs[content, 3])
+        self.word_lengths.append(length[content])
+
+        # OOV tokens = likely slang, jargon, abbreviations
+        self.oov_candidates.append(attrs[is_alpha & (length > 1)][:, 4:6])
+
+    def finalize(self, top_noun_phrases: List[List[str]]) -> Dict[str, Any]:
+        """
+        Args:
+            top_noun_phrases: Noun phrases of each top post, in top post order
+        """
+        lemma_counter = _count_strings(_concatenate(self.lemma_ids), str.lower)
+        oov_counter = _count_strings(_oov_lower_ids(_concatenate(self.oov_candidates, width=2)))
+        word_lengths = _concatenate(self.word_lengths)
+
+        # Top-posts noun phrases (what the community talks about)
+        noun_phrase_counter = Counter(chain.from_iterable(top_noun_phrases))
+
+        # OOV tokens appearing 2+ times (reduces noise), most frequent first.
+        # nlargest is stable like sorted(), so ties keep first-seen order.
+        top_oov = nlargest(
+            20,
+            ((token, count) for token, count in oov_counter.items() if count >= 2),
+            key=lambda item: item[1],
+        )
+
+        stop_ratio = self.stop_tokens / self.total_tokens if self.total_tokens > 0 else 0.0
+
+        return {
+            "top_terms": [t for t, _ in lemma_counter.most_common(30)],
+            "top_noun_phrases": [p for p, _ in noun_phrase_counter.most_common(20)],
+            "oov_tokens": [t for t, _ in top_oov],
+            "avg_word_length": round(int(word_lengths.sum()) / word_lengths.size, 1) if word_lengths.size else 0.0,
+            "stop_word_ratio": round(stop_ratio, 3),
+        }
+
+
+def _concatenate(arrays: List[np.ndarray], width: Optional[int] = None) -> np.ndarray:
+    """np.concatenate that also accepts an empty list of to_array outputs."""
+    if arrays:
+        return np.concatenate(arrays)
+    return np.empty((0, width) if width else 0, dtype=np.uint64)
+
+
+def _oov_lower_ids(candidates: np.ndarray) -> np.ndarray:
+    """
+    LOWER hashes of the (LOWER, ORTH) rows whose ORTH has no vector.
+
+    Same test as Token.is_oov, but done once per distinct ORTH hash.
+    """
+    if not candidates.size:
+        return candidates[:, 0]
+
+    orths, inverse = np.unique(candidates[:, 1], return_inverse=True)
+    vectors = nlp.vocab.vectors
+    has_vector = np.fromiter((int(orth) in vectors for orth in orths), dtype=bool, count=orths.size)
+    return candidates[~has_vector[inverse.ravel()], 0]
+
+
+def _count_strings(ids: np.ndarray, normalize=None) -> Counter:
+    """
+    Count string hashes as strings, optionally normalized.
+
+    Keys are inserted in order of first occurrence, as counting token by
+    token would, so most_common ties rank the same way.
+    """
+    counter = Counter()
+    if not ids.size:
+        return counter
+
+    unique_ids, first_seen, counts = np.unique(ids, return_index=True, return_counts=True)
+    strings = nlp.vocab.strings
+    for i in np.argsort(first_seen, kind="stable").tolist():
+        string = strings[int(unique_ids[i])]
+        counter[normalize(string) if normalize else string] += int(counts[i])
+    return counter
 
-def _extract_structure(docs, texts: List[str]) -> Dict[str, Any]:
-    """Extract structural patterns using SpaCy sentence analysis."""
-    paragraph_counts = []
-    paragraph_lengths = []  # sentences per paragraph
-    word_counts = []
-    question_sentences = 0
-    imperative_sentences = 0
-    total_sentences = 0
 
-    for doc, text in zip(docs, texts):
+class _StructureAccumulator:
+    """
+    Structural patterns and imperfection metrics, fed one doc at a time.
+
+    Structure covers paragraphs, post length, questions and imperatives.
+    Imperfections characterize human-like writing: fragment ratio (verbless
+    sentences) plus the parenthetical, self-correction and dash rates from
+    the raw-text scan. These metrics tell the generation LLM how messy to
+    write to match the community. Every sentence is visited once for both.
+    """
+
+    def __init__(self):
+        self.paragraph_counts = []
+        self.paragraph_lengths = []  # sentences per paragraph
+        self.word_counts = []
+        self.question_sentences = 0
+        self.imperative_sentences = 0
+        self.total_sentences = 0
+        self.fragment_count = 0
+        self.fragment_candidates = 0  # sentences with 2+ alphabetic tokens
+
+    def update(self, doc, text: str) -> None:
         # Paragraph analysis (from raw text)
         paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-        paragraph_counts.append(len(paragraphs))
+        self.paragraph_counts.append(len(paragraphs))
 
         # Word count per post
-        words = [t for t in doc if t.is_alpha]
-        word_counts.append(len(words))
+        attrs = doc.to_array(_STRUCTURE_ATTRS)
+        is_alpha = attrs[:, 0] == 1
+        self.word_counts.append(int(np.count_nonzero(is_alpha)))
 
         # Sentence-level analysis
-        sentences = list(doc.sents)
-        total_sentences += len(sentences)
+        starts, ends = _sentence_bounds(doc, attrs)
+        num_sentences = int(starts.size)
+        self.total_sentences += num_sentences
 
         # Sentences per paragraph (approximate)
         if paragraphs:
-            paragraph_lengths.append(len(sentences) / len(paragraphs))
-
-        for sent in sentences:
-            sent_text = sent.text.strip()
-            # Question detection
-            if sent_text.endswith("?"):
-                question_sentences += 1
-            # Imperative detection (starts with verb)
-            tokens = [t for t in sent if t.is_alpha]
-            if tokens and tokens[0].pos_ == "VERB":
-                imperative_sentences += 1
+            self.paragraph_lengths.append(num_sentences / len(paragraphs))
+
+        if not num_sentences:
+            return
+
+        # Question detection on each sentence's text, sliced by character offset
+        doc_text = doc.text
+        last = ends - 1
+        char_starts = attrs[starts, 3].tolist()
+        char_ends = (attrs[last, 3] + attrs[last, 4]).tolist()
+        self.question_sentences += sum(
+            1 for start, end in zip(char_starts, char_ends)
+            if doc_text[start:end].rstrip().endswith("?")
+        )
+
+        imperatives, candidates, fragments = _sentence_verb_counts(attrs, is_alpha, starts, ends)
+        self.imperative_sentences += imperatives
+        self.fragment_candidates += candidates
+        self.fragment_count += fragments
+
+    def finalize(self, text_stats: Dict[str, float]) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Args:
+            text_stats: Per-post raw-text averages from _text_stat_means
+
+        Returns:
+            Tuple of (structure dict, imperfections dict)
+        """
+        paragraph_counts = self.paragraph_counts
+        paragraph_lengths = self.paragraph_lengths
+        word_counts = self.word_counts
+        total_sentences = self.total_sentences
+
+        structure = {
+            "avg_paragraph_count": round(sum(paragraph_counts) / len(paragraph_counts), 1) if paragraph_counts else 0.0,
+            "avg_paragraph_length_sentences": round(math.fsum(paragraph_lengths) / len(paragraph_lengths), 1) if paragraph_lengths else 0.0,
+            "avg_post_word_count": round(sum(word_counts) / len(word_counts)) if word_counts else 0,
+            "post_word_count_std": round(_int_stdev(word_counts)) if len(word_counts) > 1 else 0,
+            "question_sentence_ratio": round(self.question_sentences / total_sentences, 3) if total_sentences > 0 else 0.0,
+            "imperative_ratio": round(self.imperative_sentences / total_sentences, 3) if total_sentences > 0 else 0.0,
+        }
+        imperfections = {
+            "fragment_ratio": round(self.fragment_count / self.fragment_candidates, 3) if self.fragment_candidates > 0 else 0.0,
+            "parenthetical_frequency": round(text_stats["parentheticals"], 2),
+            "self_correction_rate": round(text_stats["self_corrections"], 2),
+            "dash_interruption_rate": round(text_stats["dashes"], 2),
+        }
+        return structure, imperfections
 
-    return {
-        "avg_paragraph_count": round(statistics.mean(paragraph_counts), 1) if paragraph_counts else 0.0,
-        "avg_paragraph_length_sentences": round(statistics.mean(paragraph_lengths), 1) if paragraph_lengths else 0.0,
-        "avg_post_word_count": round(statistics.mean(word_counts)) if word_counts else 0,
-        "post_word_count_std": round(statistics.stdev(word_counts)) if len(word_counts) > 1 else 0,
-        "question_sentence_ratio": round(question_sentences / total_sentences, 3) if total_sentences > 0 else 0.0,
-        "imperative_ratio": round(imperative_sentences / total_sentences, 3) if total_sentences > 0 else 0.0,
-    }
 
+def _int_stdev(values: List[int]) -> float:
+    """
+    Sample standard deviation of integers.
 
-def _extract_punctuation(docs, texts: List[str]) -> Dict[str, Any]:
-    """Extract punctuation and special character patterns."""
-    exclamation_counts = []
-    question_counts = []
-    ellipsis_counts = []
-    parenthetical_counts = []
-    emoji_counts = []
-
-    # Emoji regex (common Unicode emoji ranges)
-    emoji_pattern = re.compile(
-        "[\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002702-\U000027B0"  # dingbats
-        "\U0000FE00-\U0000FE0F"  # variation selectors
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "]+", flags=re.UNICODE
+    The sum of squared deviations is computed exactly in integer arithmetic
+    (n * sum(x^2) - sum(x)^2), so the only rounding is the final division
+    and square root.
+    """
+    n = len(values)
+    total = sum(values)
+    squares = sum(x * x for x in values)
+    return math.sqrt((n * squares - total * total) / (n * (n - 1)))
+
+
+def _sentence_bounds(doc, attrs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Token start and end of every sentence, as doc.sents would yield them.
+
+    A sentence starts at token 0 and at every later token whose SENT_START
+    is 1, without creating Span objects. Custom sentence hooks (and docs
+    without sentence boundaries, which raise) go through doc.sents.
+    """
+    if "sents" in doc.user_hooks or not doc.has_annotation("SENT_START"):
+        sentences = list(doc.sents)
+        starts = np.fromiter((sent.start for sent in sentences), dtype=np.int64, count=len(sentences))
+        ends = np.fromiter((sent.end for sent in sentences), dtype=np.int64, count=len(sentences))
+        return starts, ends
+
+    if not len(doc):
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    starts = np.flatnonzero(attrs[:, 2] == 1)
+    if not starts.size or starts[0] != 0:
+        starts = np.concatenate(([0], starts))
+    ends = np.append(starts[1:], len(doc))
+    return starts, ends
+
+
+def _sentence_verb_counts(
+    attrs: np.ndarray,
+    is_alpha: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+) -> tuple[int, int, int]:
+    """
+    Per-doc verb counts over sentence spans, from one _STRUCTURE_ATTRS array.
+
+    Returns:
+        (imperatives: first alphabetic token is a VERB,
+         fragment candidates: 2+ alphabetic tokens (single-word and
+         punctuation-only sentences are skipped),
+         fragments: candidates with no VERB token at all)
+    """
+    is_verb = attrs[:, 1] == VERB
+
+    # Alphabetic and verb tokens per sentence from prefix sums
+    alpha_prefix = np.concatenate(([0], np.cumsum(is_alpha)))
+    verb_prefix = np.concatenate(([0], np.cumsum(is_verb)))
+    alpha_per_sentence = alpha_prefix[ends] - alpha_prefix[starts]
+    verbs_per_sentence = verb_prefix[ends] - verb_prefix[starts]
+
+    # Index of each sentence's first alphabetic token, if it lies inside the sentence
+    alpha_positions = np.flatnonzero(is_alpha)
+    first = np.searchsorted(alpha_positions, starts)
+    has_alpha = alpha_per_sentence > 0
+    imperatives = int(np.count_nonzero(is_verb[alpha_positions[first[has_alpha]]]))
+
+    candidates = alpha_per_sentence > 1
+    fragments = candidates & (verbs_per_sentence == 0)
+    return imperatives, int(np.count_nonzero(candidates)), int(np.count_nonzero(fragments))
+
+
+# Columns of the per-post count matrix built by _text_stat_means
+_TEXT_STAT_COLUMNS = (
+    "exclamations",
+    "questions",
+    "ellipses",
+    "open_parens",
+    "emoji",
+    "has_tldr",
+    "has_edit",
+    "has_links",
+    "has_code",
+    "line_breaks",
+    "parentheticals",
+    "self_corrections",
+    "dashes",
+)
+
+
+def _scan_text(text: str) -> tuple:
+    """
+    Collect every raw-text count the punctuation, formatting and
+    imperfection metrics need, in one visit per post.
+
+    Values are ordered as _TEXT_STAT_COLUMNS (flags as 0/1). Single
+    characters use str.count: a few vectorized count scans beat building a
+    character histogram (str.translate or a NumPy byte bincount) for posts
+    under a few thousand words. Each regex runs at most once, and only when
+    the text contains a literal every match needs (emoji are never ASCII,
+    parentheticals need "(", links need "://"). The regexes stay separate
+    rather than merged into one alternation, so overlapping markers (e.g.
+    "EDIT:" is both an edit note and a self-correction) are still counted
+    by each metric.
+    """
+    is_ascii = text.isascii()
+    folded = _fold_case(text, is_ascii)
+    open_parens = text.count("(")
+    return (
+        text.count("!"),
+        text.count("?"),
+        text.count("...") + text.count("\u2026"),
+        open_parens,
+        0 if is_ascii else _count_emoji_runs(text),
+        _contains_any(folded, _TLDR_LITERALS) and _TLDR_RE.search(text) is not None,
+        _contains_any(text, _EDIT_LITERALS) and _EDIT_RE.search(text) is not None,
+        "://" in text and _LINK_RE.search(text) is not None,
+        _contains_any(text, _CODE_LITERALS) and _CODE_RE.search(text) is not None,
+        text.count("\n"),
+        len(_PARENTHETICAL_RE.findall(text)) if open_parens else 0,
+        len(_SELF_CORRECTION_RE.findall(text)) if _contains_any(folded, _SELF_CORRECTION_LITERALS) else 0,
+        len(_DASH_RE.findall(text)) if _contains_any(text, _DASH_LITERALS) else 0,
     )
 
-    for text in texts:
-        exclamation_counts.append(text.count("!"))
-        question_counts.append(text.count("?"))
-        ellipsis_counts.append(text.count("...") + text.count("\u2026"))
-        parenthetical_counts.append(text.count("("))
-        emoji_counts.append(len(emoji_pattern.findall(text)))
 
-    n = len(texts)
-    return {
-        "exclamation_per_post": round(sum(exclamation_counts) / n, 2) if n else 0.0,
-        "question_mark_per_post": round(sum(question_counts) / n, 2) if n else 0.0,
-        "ellipsis_per_post": round(sum(ellipsis_counts) / n, 2) if n else 0.0,
-        "emoji_per_post": round(sum(emoji_counts) / n, 2) if n else 0.0,
-        "parenthetical_per_post": round(sum(parenthetical_counts) / n, 2) if n else 0.0,
-    }
+def _count_emoji_runs(text: str) -> int:
+    """
+    Number of _EMOJI_RE matches (runs of consecutive emoji) in text.
 
+    Long texts are decoded to a code point array and classified with one
+    table lookup; code points past the table clamp to its False sentinel.
+    """
+    if len(text) < _EMOJI_TABLE_MIN_LENGTH:
+        return len(_EMOJI_RE.findall(text))
 
-def _extract_formatting(texts: List[str]) -> Dict[str, Any]:
-    """Extract formatting conventions from raw text."""
-    n = len(texts)
-    if not n:
-        return {
-            "has_tldr_ratio": 0.0,
-            "has_edit_ratio": 0.0,
-            "has_links_ratio": 0.0,
-            "has_code_blocks_ratio": 0.0,
-            "avg_line_breaks": 0.0,
-        }
+    code_points = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    is_emoji = _EMOJI_TABLE[np.minimum(code_points, _EMOJI_TABLE.size - 1)]
+    run_starts = np.count_nonzero(is_emoji[1:] & ~is_emoji[:-1])
+    return int(run_starts) + int(is_emoji[0])
+
+
+def _contains_any(text: str, literals: tuple) -> bool:
+    """Whether text contains any of the literals."""
+    return any(literal in text for literal in literals)
 
-    tldr_pattern = re.compile(r"tl;?dr|TL;?DR", re.IGNORECASE)
-    edit_pattern = re.compile(r"^(?:EDIT|UPDATE|ETA)\s*:", re.MULTILINE)
-    link_pattern = re.compile(r"https?://\S+")
-    code_pattern = re.compile(r"```|    \S")  # fenced or indented code
 
-    has_tldr = sum(1 for t in texts if tldr_pattern.search(t))
-    has_edit = sum(1 for t in texts if edit_pattern.search(t))
-    has_links = sum(1 for t in texts if link_pattern.search(t))
-    has_code = sum(1 for t in texts if code_pattern.search(t))
-    line_breaks = [t.count("\n") for t in texts]
+def _fold_case(text: str, is_ascii: bool) -> str:
+    """
+    Lowercase text so an IGNORECASE match of an ASCII literal becomes a
+    plain substring of the result.
+    """
+    if is_ascii:
+        return text.lower()
+    return text.translate(_IGNORECASE_FOLDS).lower()
+
 
+def _text_stat_means(texts: List[str]) -> Dict[str, float]:
+    """
+    Per-post average of every _TEXT_STAT_COLUMNS count (a ratio for flags).
+
+    The scans fill an N x columns integer matrix and one column-wise mean
+    produces all averages; integer sums are exact, so each mean equals
+    sum / N as computed per metric before.
+    """
+    if not texts:
+        return dict.fromkeys(_TEXT_STAT_COLUMNS, 0.0)
+
+    counts = np.array([_scan_text(text) for text in texts], dtype=np.int64)
+    return dict(zip(_TEXT_STAT_COLUMNS, counts.mean(axis=0).tolist()))
+
+
+def _extract_punctuation(text_stats: Dict[str, float]) -> Dict[str, Any]:
+    """Extract punctuation and special character patterns."""
     return {
-        "has_tldr_ratio": round(has_tldr / n, 3),
-        "has_edit_ratio": round(has_edit / n, 3),
-        "has_links_ratio": round(has_links / n, 3),
-        "has_code_blocks_ratio": round(has_code / n, 3),
-        "avg_line_breaks": round(statistics.mean(line_breaks), 1) if line_breaks else 0.0,
+        "exclamation_per_post": round(text_stats["exclamations"], 2),
+        "question_mark_per_post": round(text_stats["questions"], 2),
+        "ellipsis_per_post": round(text_stats["ellipses"], 2),
+        "emoji_per_post": round(text_stats["emoji"], 2),
+        "parenthetical_per_post": round(text_stats["open_parens"], 2),
+    }
+
+
+def _extract_formatting(text_stats: Dict[str, float]) -> Dict[str, Any]:
+    """Extract formatting conventions from raw text."""
+    return {
+        "has_tldr_ratio": round(text_stats["has_tldr"], 3),
+        "has_edit_ratio": round(text_stats["has_edit"], 3),
+        "has_links_ratio": round(text_stats["has_links"], 3),
+        "has_code_blocks_ratio": round(text_stats["has_code"], 3),
+        "avg_line_breaks": round(text_stats["line_breaks"], 1),
     }
 
 
 def _extract_openings(top_texts: List[str]) -> Dict[str, Any]:
-    """Extract opening patterns from top-performing posts."""
-    opening_words = Counter()
+    """
+    Extract opening patterns from top-performing posts.
 
-    for text in top_texts:
-        text = text.strip()
-        if not text:
-            continue
-        # Get first 3-5 words as a pattern
-        words = text.split()[:4]
-        if len(words) >= 2:
-            pattern = " ".join(words)
-            # Normalize: replace specific nouns/names with "..."
-            opening_words[pattern] += 1
-
-    # Group similar openings (first 2 words match)
+    Openings are grouped by their first two words, so only those are split
+    off each post (maxsplit stops at the third word instead of splitting
+    the whole post).
+    """
     grouped = Counter()
-    for pattern, count in opening_words.items():
-        words = pattern.split()
-        prefix = " ".join(words[:2]) + " ..."
-        grouped[prefix] += count
+
+    for text in top_texts:
+        words = text.split(maxsplit=2)[:2]
+        if len(words) == 2:
+            grouped[" ".join(words) + " ..."] += 1
 
     top_patterns = [
         {"pattern": p, "count": c}
@@ -251,64 +648,6 @@ def _extract_openings(top_texts: List[str]) -> Dict[str, Any]:
     }
 
 
-def _extract_imperfections(docs, texts: List[str]) -> Dict[str, Any]:
-    """
-    Extract imperfection metrics that characterize human-like writing.
-
-    Measures fragment ratio (verbless sentences), parenthetical asides,
-    self-correction markers, and dash interruptions. These metrics tell
-    the generation LLM how messy to write to match the community.
-
-    Args:
-        docs: SpaCy Doc objects for each text
-        texts: Raw post texts
-
-    Returns:
-        Dict with fragment_ratio, parenthetical_frequency,
-        self_correction_rate, dash_interruption_rate
-    """
-    # Parenthetical regex: 5+ chars inside parens (filters emoticons/short asides)
-    parenthetical_pattern = re.compile(r'\([^)]{5,}\)')
-    # Self-correction markers
-    self_correction_pattern = re.compile(
-        r'\b(?:I mean|actually|wait|edit:|update:|sorry,? I meant)\b',
-        re.IGNORECASE,
-    )
-    # Mid-sentence dash interruptions (space-dash-space or em-dash)
-    dash_pattern = re.compile(r'\s[-\u2013\u2014]{1,2}\s')
-
-    fragment_count = 0
-    total_sentences = 0
-    parenthetical_counts = []
-    self_correction_counts = []
-    dash_counts = []
-
-    for doc, text in zip(docs, texts):
-        # Fragment detection: sentences without a VERB POS tag
-        for sent in doc.sents:
-            tokens = [t for t in sent if t.is_alpha]
-            # Skip single-word sentences and punctuation-only sentences
-            if len(tokens) <= 1:
-                continue
-            total_sentences += 1
-            has_verb = any(t.pos_ == "VERB" for t in sent)
-            if not has_verb:
-                fragment_count += 1
-
-        # Per-post counts for averaging
-        parenthetical_counts.append(len(parenthetical_pattern.findall(text)))
-        self_correction_counts.append(len(self_correction_pattern.findall(text)))
-        dash_counts.append(len(dash_pattern.findall(text)))
-
-    n = len(texts)
-    return {
-        "fragment_ratio": round(fragment_count / total_sentences, 3) if total_sentences > 0 else 0.0,
-        "parenthetical_frequency": round(sum(parenthetical_counts) / n, 2) if n > 0 else 0.0,
-        "self_correction_rate": round(sum(self_correction_counts) / n, 2) if n > 0 else 0.0,
-        "dash_interruption_rate": round(sum(dash_counts) / n, 2) if n > 0 else 0.0,
-    }
-
-
 def _empty_style() -> Dict[str, Any]:
     """Return empty style structure for edge cases."""
     return {
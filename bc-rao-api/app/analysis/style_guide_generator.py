@@ -10,6 +10,8 @@ Cost: ~$0.003 per subreddit (Haiku at $0.0005/1K tokens).
 
 import json
 import logging
+import re
+from bisect import bisect_left
 from typing import List, Dict, Any, Optional
 
 from app.inference.client import InferenceClient
@@ -17,6 +19,19 @@ from app.utils.errors import AppError
 
 logger = logging.getLogger(__name__)
 
+# Formality labels by stop-word ratio: a ratio above the i-th bound (and not
+# above the next) gets label i + 1.
+_FORMALITY_BOUNDS = (0.38, 0.43, 0.48)
+_FORMALITY_LABELS = (
+    "Formal/technical (low stop-word ratio)",
+    "Moderate formality",
+    "Casual conversational",
+    "Very casual (high stop-word ratio indicates informal writing)",
+)
+
+# Outermost JSON object in an LLM response: first "{" through last "}"
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 # Default empty style guide returned on failure
 EMPTY_STYLE_GUIDE: Dict[str, Any] = {
     "voice_description": "",
@@ -195,14 +210,8 @@ def _describe_formality_from_metrics(style_metrics: Dict[str, Any]) -> str:
     vocab = style_metrics.get("vocabulary", {})
     stop_ratio = vocab.get("stop_word_ratio", 0.4)
 
-    if stop_ratio > 0.48:
-        return "Very casual (high stop-word ratio indicates informal writing)"
-    elif stop_ratio > 0.43:
-        return "Casual conversational"
-    elif stop_ratio > 0.38:
-        return "Moderate formality"
-    else:
-        return "Formal/technical (low stop-word ratio)"
+    # bisect_left: a ratio equal to a bound stays in the lower bucket
+    return _FORMALITY_LABELS[bisect_left(_FORMALITY_BOUNDS, stop_ratio)]
 
 
 def _parse_style_guide_json(content: str) -> Dict[str, Any]:
@@ -222,22 +231,18 @@ def _parse_style_guide_json(content: str) -> Dict[str, Any]:
         content = content[:-3]
     content = content.strip()
 
-    # Try direct JSON parse
-    try:
-        parsed = json.loads(content)
-        return _validate_style_guide(parsed)
-    except json.JSONDecodeError:
-        pass
-
-    # Try extracting JSON from surrounding text
-    try:
-        start = content.index("{")
-        end = content.rindex("}") + 1
-        parsed = json.loads(content[start:end])
-        return _validate_style_guide(parsed)
-    except (ValueError, json.JSONDecodeError):
-        logger.warning(f"Failed to parse style guide JSON. Raw content: {content[:200]}")
-        return EMPTY_STYLE_GUIDE.copy()
+    # A bare object spans the whole content, and an object wrapped in prose
+    # spans first "{" to last "}"; one search covers both cases.
+    match = _JSON_OBJ_RE.search(content)
+    if match:
+        try:
+            parsed = json.loads(match.group(0))
+            return _validate_style_guide(parsed)
+        except json.JSONDecodeError:
+            pass
+
+    logger.warning(f"Failed to parse style guide JSON. Raw content: {content[:200]}")
+    return EMPTY_STYLE_GUIDE.copy()
 
 
 def _validate_style_guide(parsed: Dict[str, Any]) -> Dict[str, Any]:
@@ -7,34 +7,42 @@ Endpoints:
 - GET /campaigns/{campaign_id}/community-profile: Get single community profile
 - GET /campaigns/{campaign_id}/community-profiles: Get all profiles for comparison
 - GET /campaigns/{campaign_id}/scoring-breakdown: Get detailed post scoring
+- POST /campaigns/{campaign_id}/scoring-breakdowns: Get scoring for up to 100 posts at once
 - GET /campaigns/{campaign_id}/analyzed-posts: Get posts with scores and filtering
 - GET /campaigns/{campaign_id}/forbidden-patterns: Get blacklist patterns
 - POST /campaigns/{campaign_id}/forbidden-patterns: Add custom pattern
 """
-import asyncio
-import json
 from typing import Optional, Dict, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Body
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status, Body
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from app.workers.task_runner import generate_task_id, run_analysis_background_task, get_task_state
-from app.services.analysis_service import AnalysisService
+from app.workers.task_runner import (
+    generate_task_id,
+    run_analysis_background_task,
+    spawn_background,
+)
+from app.services.analysis_service import AnalysisService, get_analysis_service
+from app.services.stream_hub import task_event_stream
 from app.models.analysis import (
     CommunityProfileResponse,
     CommunityProfileListResponse,
     PostScoreBreakdown,
+    BatchBreakdownRequest,
     BlacklistResponse,
+    AnalyzedPostSortField,
+    SortDirection,
 )
-from app.dependencies import get_current_user
-from app.integrations.supabase_client import get_supabase_client
-from app.utils.errors import AppError, ErrorCode
+from app.dependencies import campaign_data_etag, campaign_owner_plan, get_current_user, post_data_etag
+from app.utils.errors import AppError
+from app.utils.responses import ORJSONResponse, stream_json_list
+from app.utils.sse import sse_response
 
 
 # Analysis endpoints under /analysis prefix for SSE, rest under /campaigns for REST
-router = APIRouter(prefix="/analysis", tags=["analysis"])
+router = APIRouter(prefix="/analysis", tags=["analysis"], default_response_class=ORJSONResponse)
 
 
 class TriggerAnalysisRequest(BaseModel):
@@ -59,7 +67,8 @@ class AddPatternRequest(BaseModel):
 async def trigger_analysis(
     campaign_id: UUID,
     request: TriggerAnalysisRequest = Body(default=TriggerAnalysisRequest()),
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    user_plan: str = Depends(campaign_owner_plan)
 ) -> TriggerAnalysisResponse:
     """
     Trigger asynchronous analysis pipeline for a campaign.
@@ -74,6 +83,8 @@ async def trigger_analysis(
         campaign_id: Campaign UUID
         request: Request body with force_refresh flag
         user: Current authenticated user from JWT
+        user_plan: User's plan for style guide cost tracking, resolved
+            together with the ownership check
 
     Returns:
         202 Accepted with task_id and status="started"
@@ -83,33 +94,9 @@ async def trigger_analysis(
     """
     user_id = user["sub"]
 
-    # Validate campaign exists and belongs to user
-    supabase = get_supabase_client()
-    response = supabase.table("campaigns").select("id, user_id").eq("id", str(campaign_id)).eq("user_id", user_id).execute()
-    campaign = response.data[0] if response.data else None
-
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "code": ErrorCode.RESOURCE_NOT_FOUND,
-                "message": "Campaign not found or access denied",
-                "details": {"campaign_id": str(campaign_id)}
-            }
-        )
-
-    # Get user plan for style guide cost tracking
-    user_plan = "trial"
-    try:
-        sub_resp = supabase.table("subscriptions").select("plan").eq("user_id", user_id).execute()
-        if sub_resp.data:
-            user_plan = sub_resp.data[0].get("plan", "trial")
-    except Exception:
-        pass  # Default to trial if lookup fails
-
     # Run analysis as background task
     task_id = generate_task_id()
-    asyncio.create_task(
+    spawn_background(
         run_analysis_background_task(
             task_id, str(campaign_id), request.force_refresh,
             user_id=user_id, plan=user_plan,
@@ -123,12 +110,14 @@ async def trigger_analysis(
 
 
 @router.get("/{task_id}/progress")
-async def stream_progress(task_id: str):
+async def stream_progress(task_id: str, accept_encoding: Optional[str] = Header(None)):
     """
     Stream real-time analysis progress via Server-Sent Events (SSE).
 
-    Polls task state from Redis every 500ms and yields SSE events with progress data.
-    No authentication required - task_id acts as bearer token (unguessable UUID).
+    Subscribes to the task's updates through the shared StreamHub and yields
+    an SSE event for each published state change; streams watching the same
+    task share one Redis subscription. No authentication required - task_id
+    acts as bearer token (unguessable UUID).
 
     SSE format:
     - event: progress | started | pending | success | error | done
@@ -136,66 +125,20 @@ async def stream_progress(task_id: str):
 
     Args:
         task_id: Task UUID from trigger_analysis response
+        accept_encoding: Accept-Encoding header; gzip compresses the stream
 
     Returns:
         StreamingResponse with text/event-stream media type
     """
-
-    async def progress_stream():
-        """Generator function for SSE stream. Reads task state from Redis."""
-        last_state = None
-        last_meta = None
-        heartbeat_counter = 0
-
-        while True:
-            task = get_task_state(task_id)
-            state = task["state"]
-            meta = task["meta"]
-
-            state_changed = (state != last_state or meta != last_meta)
-            last_state = state
-            last_meta = meta
-
-            if state == "SUCCESS":
-                yield f"event: success\ndata: {json.dumps(meta)}\n\n"
-                yield f"event: done\ndata: {{}}\n\n"
-                break
-            elif state == "FAILURE":
-                yield f"event: error\ndata: {json.dumps(meta)}\n\n"
-                yield f"event: done\ndata: {{}}\n\n"
-                break
-            elif state_changed:
-                if state == "PROGRESS":
-                    yield f"event: progress\ndata: {json.dumps(meta)}\n\n"
-                elif state == "STARTED":
-                    yield f"event: started\ndata: {json.dumps({'state': 'started'})}\n\n"
-                elif state == "PENDING":
-                    yield f"event: pending\ndata: {json.dumps({'state': 'pending'})}\n\n"
-                heartbeat_counter = 0
-            else:
-                heartbeat_counter += 1
-                if heartbeat_counter >= 10:
-                    yield f": keepalive\n\n"
-                    heartbeat_counter = 0
-
-            await asyncio.sleep(1.5)
-
-    return StreamingResponse(
-        progress_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"  # Disable NGINX buffering for real-time streaming
-        }
-    )
+    return sse_response(task_event_stream(task_id), accept_encoding)
 
 
-@router.get("/campaigns/{campaign_id}/community-profile")
+@router.get("/campaigns/{campaign_id}/community-profile", dependencies=[Depends(campaign_data_etag)])
 async def get_community_profile(
     campaign_id: UUID,
     subreddit: str = Query(..., description="Subreddit name"),
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: AnalysisService = Depends(get_analysis_service)
 ):
     """
     Get single community profile by subreddit.
@@ -207,6 +150,7 @@ async def get_community_profile(
         campaign_id: Campaign UUID
         subreddit: Subreddit name (required)
         user: Current authenticated user from JWT
+        service: Shared AnalysisService
 
     Returns:
         200 OK with CommunityProfileResponse
@@ -214,25 +158,8 @@ async def get_community_profile(
     Raises:
         404: Profile not found for subreddit
     """
-    user_id = user["sub"]
-
-    # Validate campaign ownership
-    supabase = get_supabase_client()
-    campaign_response = supabase.table("campaigns").select("id").eq("id", str(campaign_id)).eq("user_id", user_id).execute()
-
-    if not campaign_response.data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "code": ErrorCode.RESOURCE_NOT_FOUND,
-                "message": "Campaign not found or access denied",
-                "details": {"campaign_id": str(campaign_id)}
-            }
-        )
-
-    service = AnalysisService()
     try:
-        profile = await service.get_community_profile(str(campaign_id), subreddit)
+        profile = await service.get_community_profile(str(campaign_id), user["sub"], subreddit)
         return profile
     except AppError as e:
         raise HTTPException(
@@ -245,10 +172,11 @@ async def get_community_profile(
         )
 
 
-@router.get("/campaigns/{campaign_id}/community-profiles")
+@router.get("/campaigns/{campaign_id}/community-profiles", dependencies=[Depends(campaign_data_etag)])
 async def get_community_profiles(
     campaign_id: UUID,
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: AnalysisService = Depends(get_analysis_service)
 ):
     """
     Get all community profiles for a campaign.
@@ -258,37 +186,34 @@ async def get_community_profiles(
     Args:
         campaign_id: Campaign UUID
         user: Current authenticated user from JWT
+        service: Shared AnalysisService
 
     Returns:
         200 OK with CommunityProfileListResponse
-    """
-    user_id = user["sub"]
-
-    # Validate campaign ownership
-    supabase = get_supabase_client()
-    campaign_response = supabase.table("campaigns").select("id").eq("id", str(campaign_id)).eq("user_id", user_id).execute()
 
-    if not campaign_response.data:
+    Raises:
+        404: Campaign not found or access denied
+    """
+    try:
+        profiles = await service.get_community_profiles(str(campaign_id), user["sub"])
+        return {"profiles": profiles}
+    except AppError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=e.status_code,
             detail={
-                "code": ErrorCode.RESOURCE_NOT_FOUND,
-                "message": "Campaign not found or access denied",
-                "details": {"campaign_id": str(campaign_id)}
+                "code": e.code,
+                "message": e.message,
+                "details": e.details
             }
         )
 
-    service = AnalysisService()
-    profiles = await service.get_community_profiles(str(campaign_id))
 
-    return {"profiles": profiles}
-
-
-@router.get("/campaigns/{campaign_id}/scoring-breakdown")
+@router.get("/campaigns/{campaign_id}/scoring-breakdown", dependencies=[Depends(post_data_etag)])
 async def get_scoring_breakdown(
     campaign_id: UUID,
-    post_id: str = Query(..., description="Post UUID"),
-    user: Dict[str, Any] = Depends(get_current_user)
+    post_id: UUID = Query(..., description="Post UUID"),
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: AnalysisService = Depends(get_analysis_service)
 ):
     """
     Get detailed scoring breakdown for a post.
@@ -297,36 +222,61 @@ async def get_scoring_breakdown(
     total score, and penalty phrases for inline highlighting.
 
     Args:
-        campaign_id: Campaign UUID (for context)
+        campaign_id: Campaign UUID (the post must belong to it)
         post_id: Post UUID (required)
         user: Current authenticated user from JWT
+        service: Shared AnalysisService
 
     Returns:
         200 OK with PostScoreBreakdown
 
     Raises:
-        404: Post not found
+        404: Campaign not found, or post not found in the campaign
     """
-    user_id = user["sub"]
-
-    # Validate campaign ownership
-    supabase = get_supabase_client()
-    campaign_response = supabase.table("campaigns").select("id").eq("id", str(campaign_id)).eq("user_id", user_id).execute()
-
-    if not campaign_response.data:
+    try:
+        breakdown = await service.get_scoring_breakdown(str(campaign_id), user["sub"], str(post_id))
+        return breakdown
+    except AppError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=e.status_code,
             detail={
-                "code": ErrorCode.RESOURCE_NOT_FOUND,
-                "message": "Campaign not found or access denied",
-                "details": {"campaign_id": str(campaign_id)}
+                "code": e.code,
+                "message": e.message,
+                "details": e.details
             }
         )
 
-    service = AnalysisService()
+
+@router.post("/campaigns/{campaign_id}/scoring-breakdowns")
+async def get_scoring_breakdowns(
+    campaign_id: UUID,
+    request: BatchBreakdownRequest,
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: AnalysisService = Depends(get_analysis_service)
+):
+    """
+    Get scoring breakdowns for several posts in one request.
+
+    Batch counterpart of GET /scoring-breakdown for pages that show many
+    posts: one ownership check and one query instead of one per post.
+
+    Args:
+        campaign_id: Campaign UUID (the posts must belong to it)
+        request: BatchBreakdownRequest with up to 100 post_ids
+        user: Current authenticated user from JWT
+        service: Shared AnalysisService
+
+    Returns:
+        200 OK with {post_id: PostScoreBreakdown}; ids not found in the
+        campaign are omitted
+
+    Raises:
+        404: Campaign not found or access denied
+        422: Empty post_ids or more than 100
+    """
     try:
-        breakdown = await service.get_scoring_breakdown(post_id)
-        return breakdown
+        post_ids = [str(post_id) for post_id in dict.fromkeys(request.post_ids)]
+        return await service.get_scoring_breakdowns(str(campaign_id), user["sub"], post_ids)
     except AppError as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -342,11 +292,13 @@ async def get_scoring_breakdown(
 async def get_analyzed_posts(
     campaign_id: UUID,
     subreddit: Optional[str] = Query(None, description="Filter by subreddit"),
-    sort_by: str = Query("total_score", description="Sort field"),
-    sort_dir: str = Query("desc", description="Sort direction (asc/desc)"),
+    sort_by: AnalyzedPostSortField = Query("total_score", description="Sort field"),
+    sort_dir: SortDirection = Query("desc", description="Sort direction (asc/desc)"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: AnalysisService = Depends(get_analysis_service),
+    cache_headers: Dict[str, str] = Depends(campaign_data_etag)
 ):
     """
     Get paginated list of analyzed posts with filtering and sorting.
@@ -357,49 +309,59 @@ async def get_analyzed_posts(
     Args:
         campaign_id: Campaign UUID
         subreddit: Optional subreddit filter
-        sort_by: Sort field (total_score, vulnerability_weight, rhythm_adherence, etc.)
+        sort_by: Sort field (total_score, vulnerability_weight, rhythm_adherence,
+            formality_match, marketing_jargon_penalty, created_at)
         sort_dir: Sort direction (asc or desc)
         page: Page number (1-indexed)
         per_page: Items per page (max 100)
         user: Current authenticated user from JWT
+        service: Shared AnalysisService
+        cache_headers: ETag/Cache-Control headers from campaign_data_etag
 
     Returns:
-        200 OK with posts, total, page, per_page
-    """
-    user_id = user["sub"]
+        200 OK with posts, total, page, per_page (streamed one post at a time)
 
-    # Validate campaign ownership
-    supabase = get_supabase_client()
-    campaign_response = supabase.table("campaigns").select("id").eq("id", str(campaign_id)).eq("user_id", user_id).execute()
-
-    if not campaign_response.data:
+    Raises:
+        404: Campaign not found or access denied
+        422: Unknown sort_by or sort_dir
+    """
+    try:
+        result = await service.get_analyzed_posts(
+            campaign_id=str(campaign_id),
+            user_id=user["sub"],
+            subreddit=subreddit,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            page=page,
+            per_page=per_page
+        )
+    except AppError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=e.status_code,
             detail={
-                "code": ErrorCode.RESOURCE_NOT_FOUND,
-                "message": "Campaign not found or access denied",
-                "details": {"campaign_id": str(campaign_id)}
+                "code": e.code,
+                "message": e.message,
+                "details": e.details
             }
         )
 
-    service = AnalysisService()
-    result = await service.get_analyzed_posts(
-        campaign_id=str(campaign_id),
-        subreddit=subreddit,
-        sort_by=sort_by,
-        sort_dir=sort_dir,
-        page=page,
-        per_page=per_page
+    # Encode post by post instead of materializing the whole body
+    return StreamingResponse(
+        stream_json_list(
+            "posts", result["posts"],
+            total=result["total"], page=result["page"], per_page=result["per_page"],
+        ),
+        media_type="application/json",
+        headers=cache_headers,
     )
 
-    return result
-
 
 @router.get("/campaigns/{campaign_id}/forbidden-patterns")
 async def get_forbidden_patterns(
     campaign_id: UUID,
     subreddit: Optional[str] = Query(None, description="Filter by subreddit"),
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: AnalysisService = Depends(get_analysis_service)
 ):
     """
     Get forbidden patterns aggregated by category.
@@ -411,40 +373,38 @@ async def get_forbidden_patterns(
         campaign_id: Campaign UUID
         subreddit: Optional subreddit filter
         user: Current authenticated user from JWT
+        service: Shared AnalysisService
 
     Returns:
         200 OK with BlacklistResponse (patterns, total, categories)
-    """
-    user_id = user["sub"]
-
-    # Validate campaign ownership
-    supabase = get_supabase_client()
-    campaign_response = supabase.table("campaigns").select("id").eq("id", str(campaign_id)).eq("user_id", user_id).execute()
 
-    if not campaign_response.data:
+    Raises:
+        404: Campaign not found or access denied
+    """
+    try:
+        result = await service.get_forbidden_patterns(
+            campaign_id=str(campaign_id),
+            user_id=user["sub"],
+            subreddit=subreddit
+        )
+        return result
+    except AppError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=e.status_code,
             detail={
-                "code": ErrorCode.RESOURCE_NOT_FOUND,
-                "message": "Campaign not found or access denied",
-                "details": {"campaign_id": str(campaign_id)}
+                "code": e.code,
+                "message": e.message,
+                "details": e.details
             }
         )
 
-    service = AnalysisService()
-    result = await service.get_forbidden_patterns(
-        campaign_id=str(campaign_id),
-        subreddit=subreddit
-    )
-
-    return result
-
 
 @router.post("/campaigns/{campaign_id}/forbidden-patterns", status_code=status.HTTP_201_CREATED)
 async def add_custom_pattern(
     campaign_id: UUID,
     request: AddPatternRequest,
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: AnalysisService = Depends(get_analysis_service)
 ):
     """
     Add custom forbidden pattern.
@@ -458,6 +418,7 @@ async def add_custom_pattern(
         campaign_id: Campaign UUID
         request: AddPatternRequest with category, pattern, optional subreddit
         user: Current authenticated user from JWT
+        service: Shared AnalysisService
 
     Returns:
         201 Created with pattern entry
@@ -467,7 +428,6 @@ async def add_custom_pattern(
     """
     user_id = user["sub"]
 
-    service = AnalysisService()
     try:
         pattern = await service.add_custom_pattern(
             campaign_id=str(campaign_id),
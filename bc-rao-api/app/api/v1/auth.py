@@ -2,7 +2,8 @@
 Authentication endpoints for signup, login, token refresh, and user profile.
 Integrates with Supabase Auth for secure user management.
 """
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, status
 from app.models.auth import (
     SignupRequest,
     LoginRequest,
@@ -11,7 +12,7 @@ from app.models.auth import (
     LoginResponse,
     UserProfile
 )
-from app.services.auth_service import AuthService
+from app.services.auth_service import AuthService, get_auth_service
 from app.dependencies import get_current_user
 
 
@@ -19,7 +20,10 @@ router = APIRouter()
 
 
 @router.post("/signup", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
-async def signup(request: SignupRequest):
+async def signup(
+    request: SignupRequest,
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """
     Register a new user account.
 
@@ -29,6 +33,7 @@ async def signup(request: SignupRequest):
 
     Args:
         request: Signup credentials (email, password, full_name)
+        auth_service: Shared AuthService
 
     Returns:
         AuthResponse with user_id and JWT tokens
@@ -36,7 +41,6 @@ async def signup(request: SignupRequest):
     Raises:
         AppError: If email already exists or signup fails
     """
-    auth_service = AuthService()
     user_id, access_token, refresh_token = auth_service.signup(
         email=request.email,
         password=request.password,
@@ -51,12 +55,16 @@ async def signup(request: SignupRequest):
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest):
+async def login(
+    request: LoginRequest,
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """
     Authenticate user with email and password.
 
     Args:
         request: Login credentials (email, password)
+        auth_service: Shared AuthService
 
     Returns:
         LoginResponse with JWT tokens and user info
@@ -64,7 +72,6 @@ async def login(request: LoginRequest):
     Raises:
         AppError: If credentials are invalid
     """
-    auth_service = AuthService()
     access_token, refresh_token, user = auth_service.login(
         email=request.email,
         password=request.password
@@ -78,12 +85,19 @@ async def login(request: LoginRequest):
 
 
 @router.post("/refresh", response_model=AuthResponse)
-async def refresh(request: RefreshRequest):
+async def refresh(
+    request: RefreshRequest,
+    auth_service: AuthService = Depends(get_auth_service),
+    authorization: Optional[str] = Header(None)
+):
     """
     Refresh access token using refresh token.
 
     Args:
         request: Refresh token
+        auth_service: Shared AuthService
+        authorization: Optional "Bearer <old access token>", dropped from
+            the token verification cache once replaced
 
     Returns:
         AuthResponse with new token pair
@@ -91,13 +105,15 @@ async def refresh(request: RefreshRequest):
     Raises:
         AppError: If refresh token is invalid or expired
     """
-    auth_service = AuthService()
     access_token, refresh_token = auth_service.refresh(
         refresh_token=request.refresh_token
     )
 
+    from app.utils.security import forget_jwt, verify_jwt
+    if authorization and authorization.lower().startswith("bearer "):
+        forget_jwt(authorization[7:])
+
     # Extract user_id from new access token
-    from app.utils.security import verify_jwt
     payload = verify_jwt(access_token)
     user_id = payload.get("sub")
 
@@ -109,7 +125,10 @@ async def refresh(request: RefreshRequest):
 
 
 @router.get("/me", response_model=UserProfile)
-async def get_me(current_user: dict = Depends(get_current_user)):
+async def get_me(
+    current_user: dict = Depends(get_current_user),
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """
     Get current user's profile and subscription information.
 
@@ -117,6 +136,7 @@ async def get_me(current_user: dict = Depends(get_current_user)):
 
     Args:
         current_user: Decoded JWT payload from get_current_user dependency
+        auth_service: Shared AuthService
 
     Returns:
         UserProfile with plan and trial info
@@ -124,7 +144,6 @@ async def get_me(current_user: dict = Depends(get_current_user)):
     Raises:
         AppError: If user not found or unauthorized
     """
-    auth_service = AuthService()
     user_id = current_user.get("sub")
     profile = auth_service.get_me(user_id=user_id)
 
@@ -2,6 +2,9 @@
 Campaign endpoints for CRUD operations.
 All endpoints require JWT authentication.
 """
+import asyncio
+import logging
+
 from fastapi import APIRouter, Depends, status
 from app.models.campaign import (
     CampaignCreate,
@@ -10,8 +13,13 @@ from app.models.campaign import (
     CampaignWithStats,
     CampaignListResponse
 )
-from app.services.campaign_service import CampaignService
+from app.services.auth_cache import owner_plan_key
+from app.services.campaign_service import CampaignService, get_campaign_service
 from app.dependencies import get_current_user
+from app.integrations.redis_client import get_general_client
+from app.workers.task_runner import data_version_key
+
+logger = logging.getLogger(__name__)
 
 
 router = APIRouter()
@@ -20,7 +28,8 @@ router = APIRouter()
 @router.post("/", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
 async def create_campaign(
     campaign_data: CampaignCreate,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Create a new campaign.
@@ -30,6 +39,7 @@ async def create_campaign(
     Args:
         campaign_data: Campaign creation data
         current_user: Decoded JWT payload from get_current_user dependency
+        service: Shared CampaignService
 
     Returns:
         Created campaign data
@@ -37,14 +47,16 @@ async def create_campaign(
     Raises:
         AppError: If campaign creation fails
     """
-    service = CampaignService()
     user_id = current_user.get("sub")
-    campaign = service.create(user_id=user_id, campaign_data=campaign_data)
+    campaign = await asyncio.to_thread(service.create, user_id=user_id, campaign_data=campaign_data)
     return CampaignResponse(**campaign)
 
 
 @router.get("/", response_model=CampaignListResponse)
-async def list_campaigns(current_user: dict = Depends(get_current_user)):
+async def list_campaigns(
+    current_user: dict = Depends(get_current_user),
+    service: CampaignService = Depends(get_campaign_service)
+):
     """
     List all campaigns for the authenticated user.
 
@@ -52,6 +64,7 @@ async def list_campaigns(current_user: dict = Depends(get_current_user)):
 
     Args:
         current_user: Decoded JWT payload from get_current_user dependency
+        service: Shared CampaignService
 
     Returns:
         List of campaigns with total count
@@ -59,9 +72,8 @@ async def list_campaigns(current_user: dict = Depends(get_current_user)):
     Raises:
         AppError: If listing fails
     """
-    service = CampaignService()
     user_id = current_user.get("sub")
-    campaigns = service.list_for_user(user_id=user_id)
+    campaigns = await asyncio.to_thread(service.list_for_user, user_id=user_id)
     return CampaignListResponse(
         campaigns=[CampaignResponse(**c) for c in campaigns],
         total=len(campaigns)
@@ -71,7 +83,8 @@ async def list_campaigns(current_user: dict = Depends(get_current_user)):
 @router.get("/{campaign_id}", response_model=CampaignWithStats)
 async def get_campaign(
     campaign_id: str,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Get a single campaign by ID with statistics.
@@ -81,6 +94,7 @@ async def get_campaign(
     Args:
         campaign_id: ID of the campaign
         current_user: Decoded JWT payload from get_current_user dependency
+        service: Shared CampaignService
 
     Returns:
         Campaign data with statistics
@@ -88,9 +102,8 @@ async def get_campaign(
     Raises:
         AppError: If campaign not found or access denied
     """
-    service = CampaignService()
     user_id = current_user.get("sub")
-    campaign = service.get_by_id(user_id=user_id, campaign_id=campaign_id)
+    campaign = await asyncio.to_thread(service.get_by_id, user_id=user_id, campaign_id=campaign_id)
     return CampaignWithStats(**campaign)
 
 
@@ -98,7 +111,8 @@ async def get_campaign(
 async def update_campaign(
     campaign_id: str,
     update_data: CampaignUpdate,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Update a campaign.
@@ -109,6 +123,7 @@ async def update_campaign(
         campaign_id: ID of the campaign
         update_data: Campaign update data
         current_user: Decoded JWT payload from get_current_user dependency
+        service: Shared CampaignService
 
     Returns:
         Updated campaign data
@@ -116,16 +131,16 @@ async def update_campaign(
     Raises:
         AppError: If campaign not found or update fails
     """
-    service = CampaignService()
     user_id = current_user.get("sub")
-    campaign = service.update(user_id=user_id, campaign_id=campaign_id, update_data=update_data)
+    campaign = await asyncio.to_thread(service.update, user_id=user_id, campaign_id=campaign_id, update_data=update_data)
     return CampaignResponse(**campaign)
 
 
 @router.delete("/{campaign_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_campaign(
     campaign_id: str,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    service: CampaignService = Depends(get_campaign_service)
 ):
     """
     Delete a campaign.
@@ -135,6 +150,7 @@ async def delete_campaign(
     Args:
         campaign_id: ID of the campaign
         current_user: Decoded JWT payload from get_current_user dependency
+        service: Shared CampaignService
 
     Returns:
         No content (204)
@@ -142,6 +158,16 @@ async def delete_campaign(
     Raises:
         AppError: If campaign not found or deletion fails
     """
-    service = CampaignService()
     user_id = current_user.get("sub")
-    service.delete(user_id=user_id, campaign_id=campaign_id)
+    await asyncio.to_thread(service.delete, user_id=user_id, campaign_id=campaign_id)
+
+    # Drop the data version so analysis ETags issued for this campaign stop
+    # matching, and the cached ownership so triggers re-check it
+    try:
+        await get_general_client().delete(
+            data_version_key(campaign_id), owner_plan_key(campaign_id, user_id)
+        )
+    except Exception as e:
+        # The delete itself succeeded; a stale ownership entry still
+        # expires after OWNERSHIP_CACHE_TTL_SECONDS
+        logger.warning(f"Cache invalidation failed for deleted campaign {campaign_id}: {e}")
@@ -8,20 +8,24 @@ Endpoints:
 - GET /campaigns/{campaign_id}/posts/{post_id}: Get post detail for modal
 - GET /campaigns/{campaign_id}/collection-stats: Get aggregated statistics
 """
-import asyncio
-import json
 from typing import Optional, Dict, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 from fastapi.responses import StreamingResponse
 
-from app.workers.task_runner import generate_task_id, run_collection_background, get_task_state
+from app.workers.task_runner import (
+    generate_task_id,
+    run_collection_background,
+    spawn_background,
+)
 from app.services.collection_service import CollectionService
+from app.services.stream_hub import task_event_stream
 from app.models.raw_posts import RawPostListResponse, RawPostResponse
-from app.dependencies import get_current_user
-from app.integrations.supabase_client import get_supabase_client
-from app.utils.errors import AppError, ErrorCode
+from app.dependencies import campaign_owner_plan, get_current_user, post_data_etag
+from app.utils.errors import AppError
+from app.utils.responses import ORJSONResponse, stream_json_list
+from app.utils.sse import sse_response
 
 
 # All collection endpoints under /collection prefix
@@ -31,12 +35,14 @@ router = APIRouter(prefix="/collection", tags=["collection"])
 @router.post("/campaigns/{campaign_id}/collect", status_code=status.HTTP_202_ACCEPTED)
 async def trigger_collection(
     campaign_id: UUID,
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    plan: str = Depends(campaign_owner_plan)
 ):
     """
     Trigger asynchronous collection pipeline for a campaign.
 
-    Validates campaign exists and belongs to user, then queues Celery task.
+    Validates campaign exists and belongs to user, then starts the pipeline
+    as a tracked background task.
     Returns task_id for progress monitoring via SSE endpoint.
 
     Billing limits NOT enforced here (deferred to Phase 6).
@@ -44,6 +50,7 @@ async def trigger_collection(
     Args:
         campaign_id: Campaign UUID
         user: Current authenticated user from JWT
+        plan: User's plan, resolved together with the ownership check
 
     Returns:
         202 Accepted with task_id and status="queued"
@@ -53,27 +60,9 @@ async def trigger_collection(
     """
     user_id = user["sub"]
 
-    # Validate campaign exists and belongs to user
-    supabase = get_supabase_client()
-    response = supabase.table("campaigns").select("id, user_id").eq("id", str(campaign_id)).eq("user_id", user_id).execute()
-    campaign = response.data[0] if response.data else None
-
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "code": ErrorCode.RESOURCE_NOT_FOUND,
-                "message": "Campaign not found or access denied",
-                "details": {"campaign_id": str(campaign_id)}
-            }
-        )
-
-    # User plan — defaults to "trial" until billing (Phase 6) is implemented
-    plan = "trial"
-
     # Run collection as background task
     task_id = generate_task_id()
-    asyncio.create_task(
+    spawn_background(
         run_collection_background(task_id, str(campaign_id), user_id, plan)
     )
 
@@ -84,11 +73,12 @@ async def trigger_collection(
 
 
 @router.get("/{task_id}/progress")
-async def stream_progress(task_id: str):
+async def stream_progress(task_id: str, accept_encoding: Optional[str] = Header(None)):
     """
     Stream real-time collection progress via Server-Sent Events (SSE).
 
-    Polls Celery task state every 500ms and yields SSE events with progress data.
+    Subscribes to the task's updates through the shared StreamHub and yields
+    an SSE event for each published state change, like the analysis stream.
     No authentication required - task_id acts as bearer token (unguessable UUID).
 
     SSE format:
@@ -96,65 +86,19 @@ async def stream_progress(task_id: str):
     - data: JSON payload with state details
 
     Args:
-        task_id: Celery task UUID from trigger_collection response
+        task_id: Task UUID from trigger_collection response
+        accept_encoding: Accept-Encoding header; gzip compresses the stream
 
     Returns:
         StreamingResponse with text/event-stream media type
     """
-
-    async def progress_stream():
-        """Generator function for SSE stream. Reads task state from Redis."""
-        last_state = None
-        last_meta = None
-        heartbeat_counter = 0
-
-        while True:
-            task = get_task_state(task_id)
-            state = task["state"]
-            meta = task["meta"]
-
-            # Only send events when state or data changes, or as heartbeat
-            state_changed = (state != last_state or meta != last_meta)
-            last_state = state
-            last_meta = meta
-
-            if state == "SUCCESS":
-                yield f"event: success\ndata: {json.dumps(meta)}\n\n"
-                yield f"event: done\ndata: {{}}\n\n"
-                break
-            elif state == "FAILURE":
-                yield f"event: error\ndata: {json.dumps(meta)}\n\n"
-                yield f"event: done\ndata: {{}}\n\n"
-                break
-            elif state_changed:
-                if state == "PROGRESS":
-                    yield f"event: progress\ndata: {json.dumps(meta)}\n\n"
-                elif state == "STARTED":
-                    yield f"event: started\ndata: {json.dumps({'state': 'started'})}\n\n"
-                elif state == "PENDING":
-                    yield f"event: pending\ndata: {json.dumps({'state': 'pending'})}\n\n"
-                heartbeat_counter = 0
-            else:
-                # Send SSE keepalive comment every ~15s to prevent proxy timeouts
-                heartbeat_counter += 1
-                if heartbeat_counter >= 10:  # 10 * 1.5s = 15s
-                    yield f": keepalive\n\n"
-                    heartbeat_counter = 0
-
-            await asyncio.sleep(1.5)
-
-    return StreamingResponse(
-        progress_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"  # Disable NGINX buffering for real-time streaming
-        }
-    )
+    return sse_response(task_event_stream(task_id), accept_encoding)
 
 
-@router.get("/campaigns/{campaign_id}/posts", response_model=RawPostListResponse)
+@router.get(
+    "/campaigns/{campaign_id}/posts",
+    responses={200: {"model": RawPostListResponse}}
+)
 async def get_posts(
     campaign_id: UUID,
     archetype: Optional[str] = Query(None, description="Filter by archetype"),
@@ -163,13 +107,18 @@ async def get_posts(
     max_score: Optional[float] = Query(None, description="Maximum success_score"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (replaces page)"),
     user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
     Get paginated list of collected posts with optional filters.
 
     Supports filtering by archetype, subreddit, and success score range.
-    Results ordered by success_score DESC, then collected_at DESC.
+    Results ordered by success_score DESC (unscored last), then collected_at DESC.
+
+    Every page carries next_cursor; passing it back as ?cursor= fetches the
+    following page by keyset instead of offset, without the exact total
+    (page numbers remain supported for existing clients).
 
     Args:
         campaign_id: Campaign UUID
@@ -179,44 +128,75 @@ async def get_posts(
         max_score: Maximum success_score (inclusive)
         page: Page number (1-indexed)
         per_page: Items per page (max 100)
+        cursor: Opaque cursor from a previous page's next_cursor
         user: Current authenticated user from JWT
 
     Returns:
-        RawPostListResponse with posts, total, page, per_page
+        RawPostListResponse body with posts, total (None in cursor mode),
+        page, per_page, next_cursor, streamed post by post
+
+    Raises:
+        400: Malformed cursor
+        404: Campaign not found or access denied
     """
     user_id = user["sub"]
 
     service = CollectionService()
-    result = await service.get_posts(
-        campaign_id=str(campaign_id),
-        user_id=user_id,
-        archetype=archetype,
-        subreddit=subreddit,
-        min_score=min_score,
-        max_score=max_score,
-        page=page,
-        per_page=per_page
-    )
+    try:
+        result = await service.get_posts(
+            campaign_id=str(campaign_id),
+            user_id=user_id,
+            archetype=archetype,
+            subreddit=subreddit,
+            min_score=min_score,
+            max_score=max_score,
+            page=page,
+            per_page=per_page,
+            cursor=cursor
+        )
+    except AppError as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={
+                "code": e.code,
+                "message": e.message,
+                "details": e.details
+            }
+        )
 
-    return result
+    # Encode post by post instead of materializing the whole body
+    return StreamingResponse(
+        stream_json_list(
+            "posts", result["posts"],
+            total=result["total"], page=result["page"], per_page=result["per_page"],
+            next_cursor=result["next_cursor"],
+        ),
+        media_type="application/json",
+    )
 
 
-@router.get("/campaigns/{campaign_id}/posts/{post_id}", response_model=RawPostResponse)
+@router.get(
+    "/campaigns/{campaign_id}/posts/{post_id}",
+    responses={200: {"model": RawPostResponse}}
+)
 async def get_post_detail(
     campaign_id: UUID,
     post_id: UUID,
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    cache_headers: Dict[str, str] = Depends(post_data_etag)
 ):
     """
     Get detailed information for a single post (for modal display).
 
     Args:
-        campaign_id: Campaign UUID (for context, not used in query)
+        campaign_id: Campaign UUID the post must belong to
         post_id: Post UUID
         user: Current authenticated user from JWT
+        cache_headers: ETag headers from post_data_etag
 
     Returns:
-        RawPostResponse with full post details
+        RawPostResponse body with full post details (the stored row,
+        encoded with orjson without a validation pass)
 
     Raises:
         404: Post not found or not owned by user
@@ -227,9 +207,10 @@ async def get_post_detail(
     try:
         result = await service.get_post_detail(
             post_id=str(post_id),
+            campaign_id=str(campaign_id),
             user_id=user_id
         )
-        return result
+        return ORJSONResponse(content=result, headers=cache_headers)
     except AppError as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -261,13 +242,26 @@ async def get_collection_stats(
         - by_archetype: {archetype: count}
         - by_subreddit: {subreddit: count}
         - avg_success_score: Average success score
+
+    Raises:
+        404: Campaign not found or not owned by user
     """
     user_id = user["sub"]
 
     service = CollectionService()
-    stats = await service.get_collection_stats(
-        campaign_id=str(campaign_id),
-        user_id=user_id
-    )
+    try:
+        stats = await service.get_collection_stats(
+            campaign_id=str(campaign_id),
+            user_id=user_id
+        )
+    except AppError as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={
+                "code": e.code,
+                "message": e.message,
+                "details": e.details
+            }
+        )
 
     return stats
@@ -10,16 +10,20 @@ Endpoints:
 - DELETE /drafts/{draft_id}: Delete draft
 """
 import asyncio
-import json
-from typing import Optional, Dict, Any
+import time
+from typing import Callable, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 
-from app.workers.task_runner import generate_task_id, get_task_state
-from app.generation.generation_service import GenerationService
+from app.workers.task_runner import (
+    generate_task_id,
+    spawn_background,
+    update_task_state,
+)
+from app.generation.generation_service import DRAFT_COLUMNS, GenerationService, get_generation_service
+from app.services.stream_hub import task_event_stream
 from app.models.draft import (
     GenerateDraftRequest,
     DraftResponse,
@@ -27,14 +31,24 @@ from app.models.draft import (
     UpdateDraftRequest,
     RegenerateDraftRequest,
 )
+from app.config import settings
 from app.dependencies import get_current_user
-from app.integrations.supabase_client import get_supabase_client
+from app.services.auth_cache import cache_owner_plan, get_cached_owner_plan
+from app.services.draft_counter import cache_draft_count, get_cached_draft_count
+from app.integrations.supabase_client import get_async_supabase_client
 from app.utils.errors import AppError, ErrorCode
+from app.utils.sse import sse_response
 
 
 # Draft endpoints under /drafts prefix (except generate which is under /campaigns)
 router = APIRouter()
 
+# Caps concurrent generations and regenerations (LLM calls, NLP scoring)
+_generation_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_GENERATIONS)
+
+# Minimum seconds between two chunk events of a streamed draft
+DRAFT_PREVIEW_INTERVAL_SECONDS = 0.2
+
 
 # Plan limits for draft generation (from system spec)
 PLAN_LIMITS = {
@@ -44,34 +58,75 @@ PLAN_LIMITS = {
 }
 
 
-async def check_monthly_draft_limit(user_id: str, plan: str) -> None:
+async def check_draft_quota(
+    user_id: str,
+    campaign_id: Optional[str] = None,
+    draft_id: Optional[str] = None
+) -> str:
     """
-    Check if user has exceeded monthly draft generation limit.
+    Check ownership and the monthly draft generation limit.
+
+    Ownership of the campaign (generation) or draft (regeneration), the
+    user's plan and this month's draft count come from one RPC
+    (get_draft_quota, migration 010). The count is kept in a Redis counter
+    (app.services.draft_counter) and only taken by the RPC when the counter
+    isn't seeded; a generation whose counter and campaign ownership are
+    both cached skips the RPC.
 
     Args:
         user_id: User UUID
-        plan: User plan tier (trial, starter, growth)
+        campaign_id: Campaign the draft is generated for (optional)
+        draft_id: Draft being regenerated (optional)
+
+    Returns:
+        Plan tier of the user (trial, starter, growth)
 
     Raises:
-        HTTPException: 403 if monthly limit exceeded
+        HTTPException: 404 if the campaign or draft isn't owned by the user,
+            403 if monthly limit exceeded
     """
-    # Growth plan has unlimited drafts
-    limit = PLAN_LIMITS[plan]["drafts_month"]
-    if limit == -1:
-        return
-
-    # Count drafts generated this month
-    supabase = get_supabase_client()
-    now = datetime.utcnow()
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-    count_response = supabase.table("generated_drafts").select(
-        "id", count="exact"
-    ).eq("user_id", user_id).gte("created_at", month_start.isoformat()).execute()
+    current_count = await get_cached_draft_count(user_id)
+    plan = None
+    if campaign_id is not None and current_count is not None:
+        plan = await get_cached_owner_plan(campaign_id, user_id)
+
+    if plan is None:
+        now = datetime.utcnow()
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+        supabase = await get_async_supabase_client()
+        response = await supabase.rpc("get_draft_quota", {
+            "p_user_id": user_id,
+            "p_month_start": month_start.isoformat(),
+            "p_campaign_id": campaign_id,
+            "p_draft_id": draft_id,
+            "p_count": current_count is None,
+        }).execute()
+
+        if response.data is None:
+            if campaign_id is not None:
+                message, details = "Campaign not found or access denied", {"campaign_id": campaign_id}
+            else:
+                message, details = "Draft not found", {"draft_id": draft_id}
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "code": ErrorCode.RESOURCE_NOT_FOUND,
+                    "message": message,
+                    "details": details
+                }
+            )
 
-    current_count = count_response.count or 0
+        plan = response.data["plan"]
+        if campaign_id is not None:
+            await cache_owner_plan(campaign_id, user_id, plan)
+        if current_count is None:
+            current_count = response.data["drafts_this_month"]
+            await cache_draft_count(user_id, current_count)
 
-    if current_count >= limit:
+    # Growth plan has unlimited drafts
+    limit = PLAN_LIMITS[plan]["drafts_month"]
+    if limit != -1 and current_count >= limit:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={
@@ -85,6 +140,8 @@ async def check_monthly_draft_limit(user_id: str, plan: str) -> None:
             }
         )
 
+    return plan
+
 
 @router.post("/campaigns/{campaign_id}/drafts/generate", status_code=status.HTTP_202_ACCEPTED)
 async def trigger_generation(
@@ -112,32 +169,12 @@ async def trigger_generation(
     """
     user_id = user["sub"]
 
-    # Validate campaign exists and belongs to user
-    supabase = get_supabase_client()
-    response = supabase.table("campaigns").select("id, user_id").eq("id", str(campaign_id)).eq("user_id", user_id).execute()
-    campaign = response.data[0] if response.data else None
-
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "code": ErrorCode.RESOURCE_NOT_FOUND,
-                "message": "Campaign not found or access denied",
-                "details": {"campaign_id": str(campaign_id)}
-            }
-        )
-
-    # Fetch user plan from subscriptions table
-    supabase = get_supabase_client()
-    subscription_response = supabase.table("subscriptions").select("plan").eq("user_id", user_id).execute()
-    plan = subscription_response.data[0]["plan"] if subscription_response.data else "trial"
-
-    # Check monthly draft limit
-    await check_monthly_draft_limit(user_id, plan)
+    # Campaign ownership, plan and monthly draft limit in one round-trip
+    plan = await check_draft_quota(user_id, campaign_id=str(campaign_id))
 
     # Run generation as background task
     task_id = generate_task_id()
-    asyncio.create_task(
+    spawn_background(
         run_generation_background(
             task_id=task_id,
             campaign_id=str(campaign_id),
@@ -162,7 +199,9 @@ async def run_generation_background(
 ):
     """
     Run draft generation pipeline as an asyncio background task.
-    Stores progress in Redis for SSE streaming.
+    Stores progress in Redis for SSE streaming. At most
+    MAX_CONCURRENT_GENERATIONS generations and regenerations execute at
+    once; the rest wait their turn and show as PENDING meanwhile.
 
     Args:
         task_id: Task UUID for Redis state tracking
@@ -171,8 +210,6 @@ async def run_generation_background(
         plan: User plan tier
         request: GenerateDraftRequest with generation parameters
     """
-    from app.workers.task_runner import update_task_state
-
     def emit_progress(message: str):
         """Helper to emit progress status events."""
         update_task_state(task_id, "PROGRESS", {
@@ -180,79 +217,91 @@ async def run_generation_background(
             "message": message
         })
 
-    try:
-        update_task_state(task_id, "STARTED", {"state": "started"})
-
-        service = GenerationService()
+    async with _generation_slots:
+        try:
+            update_task_state(task_id, "STARTED", {"state": "started"})
 
-        # Emit progress events during generation
-        emit_progress("Loading community profile...")
-        await asyncio.sleep(0.1)  # Allow progress to be captured
+            service = get_generation_service()
 
-        emit_progress("Checking ISC gating...")
-        await asyncio.sleep(0.1)
+            emit_progress("Generating draft...")
 
-        emit_progress("Building prompt...")
-        await asyncio.sleep(0.1)
+            # Call generation service, streaming the LLM's text as chunks
+            draft = await service.generate_draft(
+                campaign_id=campaign_id,
+                user_id=user_id,
+                plan=plan,
+                request=request,
+                on_token=_draft_preview(task_id)
+            )
 
-        emit_progress("Generating draft via LLM...")
+            # Plain dict: update_task_state's orjson encodes the UUIDs and
+            # datetimes natively, in the same pass as the rest of the state
+            draft_dict = draft.model_dump()
 
-        # Call generation service
-        draft = await service.generate_draft(
-            campaign_id=campaign_id,
-            user_id=user_id,
-            plan=plan,
-            request=request
-        )
+            update_task_state(task_id, "SUCCESS", {
+                "type": "complete",
+                "draft": draft_dict
+            })
 
-        emit_progress("Validating against blacklist...")
-        await asyncio.sleep(0.1)
+        except AppError as e:
+            # User-facing errors (ISC gating blocks, plan limits, etc.)
+            update_task_state(task_id, "FAILURE", {
+                "type": "error",
+                "message": e.message,
+                "code": e.code,
+                "details": e.details
+            })
+        except Exception as e:
+            # System errors
+            update_task_state(task_id, "FAILURE", {
+                "type": "error",
+                "message": f"Generation failed: {str(e)}",
+                "code": ErrorCode.INTERNAL_ERROR
+            })
 
-        emit_progress("Scoring draft...")
-        await asyncio.sleep(0.1)
 
-        emit_progress("Saving draft...")
-        await asyncio.sleep(0.1)
+def _draft_preview(task_id: str) -> Callable[[str], None]:
+    """
+    on_token callback publishing the draft text generated so far.
 
-        # Convert DraftResponse to dict for JSON serialization
-        draft_dict = draft.model_dump(mode="json")
+    Each chunk event carries the whole text, so a client joining late or a
+    coalesced stream still shows all of it; events are at most one per
+    DRAFT_PREVIEW_INTERVAL_SECONDS. The success event carries the final
+    (humanized) draft.
+    """
+    parts = []
+    next_at = 0.0
 
-        update_task_state(task_id, "SUCCESS", {
-            "type": "complete",
-            "draft": draft_dict
-        })
+    def on_token(token: str):
+        nonlocal next_at
+        parts.append(token)
+        now = time.monotonic()
+        if now >= next_at:
+            next_at = now + DRAFT_PREVIEW_INTERVAL_SECONDS
+            update_task_state(task_id, "PROGRESS", {
+                "type": "chunk",
+                "content": "".join(parts)
+            })
 
-    except AppError as e:
-        # User-facing errors (ISC gating blocks, plan limits, etc.)
-        update_task_state(task_id, "FAILURE", {
-            "type": "error",
-            "message": e.message,
-            "code": e.code,
-            "details": e.details
-        })
-    except Exception as e:
-        # System errors
-        update_task_state(task_id, "FAILURE", {
-            "type": "error",
-            "message": f"Generation failed: {str(e)}",
-            "code": ErrorCode.INTERNAL_ERROR
-        })
+    return on_token
 
 
 @router.get("/campaigns/{campaign_id}/drafts/generate/stream/{task_id}")
 async def stream_generation_progress(
     campaign_id: UUID,
-    task_id: str
+    task_id: str,
+    accept_encoding: Optional[str] = Header(None)
 ):
     """
     Stream real-time generation progress via Server-Sent Events (SSE).
 
-    Polls task state every 500ms and yields SSE events with progress data.
+    Subscribes to the task's updates through the shared StreamHub and yields
+    an SSE event for each published state change, like the analysis stream.
     No authentication required - task_id acts as bearer token (unguessable UUID).
 
     SSE events:
-    - status: {"type": "status", "message": "Loading community profile..."}
-    - chunk: {"type": "chunk", "content": "..."} (for future streaming)
+    - status: {"type": "status", "message": "Generating draft..."}
+    - chunk: {"type": "chunk", "content": "..."} (LLM text generated so far)
     - complete: {"type": "complete", "draft": DraftResponse}
     - error: {"type": "error", "message": "..."}
     - done: Final event signaling stream close
@@ -260,59 +309,13 @@ async def stream_generation_progress(
     Args:
         campaign_id: Campaign UUID (context only, not validated)
         task_id: Task UUID from trigger_generation response
+        accept_encoding: Accept-Encoding header; gzip compresses the stream
 
     Returns:
         StreamingResponse with text/event-stream media type
     """
 
-    async def progress_stream():
-        """Generator function for SSE stream. Reads task state from Redis."""
-        last_state = None
-        last_meta = None
-        heartbeat_counter = 0
-
-        while True:
-            task = get_task_state(task_id)
-            state = task["state"]
-            meta = task["meta"]
-
-            state_changed = (state != last_state or meta != last_meta)
-            last_state = state
-            last_meta = meta
-
-            if state == "SUCCESS":
-                yield f"event: success\ndata: {json.dumps(meta)}\n\n"
-                yield f"event: done\ndata: {{}}\n\n"
-                break
-            elif state == "FAILURE":
-                yield f"event: error\ndata: {json.dumps(meta)}\n\n"
-                yield f"event: done\ndata: {{}}\n\n"
-                break
-            elif state_changed:
-                if state == "PROGRESS":
-                    yield f"event: progress\ndata: {json.dumps(meta)}\n\n"
-                elif state == "STARTED":
-                    yield f"event: started\ndata: {json.dumps({'state': 'started'})}\n\n"
-                elif state == "PENDING":
-                    yield f"event: pending\ndata: {json.dumps({'state': 'pending'})}\n\n"
-                heartbeat_counter = 0
-            else:
-                heartbeat_counter += 1
-                if heartbeat_counter >= 10:  # 10 * 1.5s = 15s
-                    yield f": keepalive\n\n"
-                    heartbeat_counter = 0
-
-            await asyncio.sleep(1.5)
-
-    return StreamingResponse(
-        progress_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"  # Disable NGINX buffering for real-time streaming
-        }
-    )
+    return sse_response(task_event_stream(task_id), accept_encoding)
 
 
 @router.get("/campaigns/{campaign_id}/drafts", response_model=DraftListResponse)
@@ -322,7 +325,8 @@ async def get_drafts(
     subreddit: Optional[str] = Query(None, description="Filter by subreddit"),
     limit: int = Query(20, ge=1, le=100, description="Max results"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: GenerationService = Depends(get_generation_service)
 ):
     """
     Get paginated list of drafts for a campaign with optional filters.
@@ -337,13 +341,13 @@ async def get_drafts(
         limit: Max results to return (max 100)
         offset: Pagination offset
         user: Current authenticated user from JWT
+        service: Shared GenerationService
 
     Returns:
         DraftListResponse with drafts and total count
     """
     user_id = user["sub"]
 
-    service = GenerationService()
     result = await service.get_drafts(
         campaign_id=str(campaign_id),
         user_id=user_id,
@@ -376,8 +380,8 @@ async def get_draft(
     """
     user_id = user["sub"]
 
-    supabase = get_supabase_client()
-    response = supabase.table("generated_drafts").select("*").eq(
+    supabase = await get_async_supabase_client()
+    response = await supabase.table("generated_drafts").select(DRAFT_COLUMNS).eq(
         "id", str(draft_id)
     ).eq("user_id", user_id).execute()
 
@@ -391,33 +395,15 @@ async def get_draft(
             }
         )
 
-    draft = response.data[0]
-    return DraftResponse(
-        id=draft["id"],
-        campaign_id=draft["campaign_id"],
-        subreddit=draft["subreddit"],
-        archetype=draft["archetype"],
-        title=draft.get("title"),
-        body=draft["body"],
-        vulnerability_score=draft["vulnerability_score"],
-        rhythm_match_score=draft["rhythm_match_score"],
-        blacklist_violations=draft["blacklist_violations"],
-        model_used=draft["model_used"],
-        token_count=draft["token_count"],
-        token_cost_usd=draft["token_cost_usd"],
-        generation_params=draft.get("generation_params", {}),
-        status=draft["status"],
-        user_edits=draft.get("user_edits"),
-        created_at=draft["created_at"],
-        updated_at=draft["updated_at"],
-    )
+    return DraftResponse.model_validate(response.data[0])
 
 
 @router.patch("/drafts/{draft_id}", response_model=DraftResponse)
 async def update_draft(
     draft_id: UUID,
     update: UpdateDraftRequest,
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: GenerationService = Depends(get_generation_service)
 ):
     """
     Update draft status or user edits.
@@ -428,6 +414,7 @@ async def update_draft(
         draft_id: Draft UUID
         update: UpdateDraftRequest with status and/or user_edits
         user: Current authenticated user from JWT
+        service: Shared GenerationService
 
     Returns:
         Updated DraftResponse
@@ -437,7 +424,6 @@ async def update_draft(
     """
     user_id = user["sub"]
 
-    service = GenerationService()
     try:
         result = await service.update_draft(
             draft_id=str(draft_id),
@@ -465,7 +451,7 @@ async def regenerate_draft(
     """
     Regenerate a draft with optional user feedback.
 
-    Checks monthly draft limit, then queues regeneration task.
+    Checks draft ownership and monthly draft limit, then queues regeneration task.
     Preserves original draft parameters and appends feedback to context.
 
     Args:
@@ -478,21 +464,17 @@ async def regenerate_draft(
 
     Raises:
         403: Monthly draft limit exceeded
-        404: Original draft not found
+        404: Original draft not found or not owned by user
     """
     user_id = user["sub"]
 
-    # Fetch user plan from subscriptions table
-    supabase = get_supabase_client()
-    subscription_response = supabase.table("subscriptions").select("plan").eq("user_id", user_id).execute()
-    plan = subscription_response.data[0]["plan"] if subscription_response.data else "trial"
-
-    # Check monthly draft limit (regeneration counts toward limit)
-    await check_monthly_draft_limit(user_id, plan)
+    # Draft ownership, plan and monthly draft limit (regeneration counts
+    # toward it) in one round-trip
+    plan = await check_draft_quota(user_id, draft_id=str(draft_id))
 
     # Run regeneration as background task
     task_id = generate_task_id()
-    asyncio.create_task(
+    spawn_background(
         run_regeneration_background(
             task_id=task_id,
             draft_id=str(draft_id),
@@ -517,7 +499,8 @@ async def run_regeneration_background(
 ):
     """
     Run draft regeneration pipeline as an asyncio background task.
-    Stores progress in Redis for SSE streaming.
+    Stores progress in Redis for SSE streaming. Shares the generation
+    concurrency cap (MAX_CONCURRENT_GENERATIONS).
 
     Args:
         task_id: Task UUID for Redis state tracking
@@ -526,8 +509,6 @@ async def run_regeneration_background(
         plan: User plan tier
         feedback: Optional user feedback to incorporate
     """
-    from app.workers.task_runner import update_task_state
-
     def emit_progress(message: str):
         """Helper to emit progress status events."""
         update_task_state(task_id, "PROGRESS", {
@@ -535,63 +516,54 @@ async def run_regeneration_background(
             "message": message
         })
 
-    try:
-        update_task_state(task_id, "STARTED", {"state": "started"})
-
-        service = GenerationService()
-
-        # Emit progress events during regeneration
-        emit_progress("Loading original draft...")
-        await asyncio.sleep(0.1)
-
-        emit_progress("Incorporating feedback...")
-        await asyncio.sleep(0.1)
+    async with _generation_slots:
+        try:
+            update_task_state(task_id, "STARTED", {"state": "started"})
 
-        emit_progress("Regenerating draft...")
-
-        # Call regeneration service
-        draft = await service.regenerate_draft(
-            draft_id=draft_id,
-            user_id=user_id,
-            plan=plan,
-            feedback=feedback
-        )
+            service = get_generation_service()
 
-        emit_progress("Validating regenerated draft...")
-        await asyncio.sleep(0.1)
+            emit_progress("Regenerating draft...")
 
-        emit_progress("Saving draft...")
-        await asyncio.sleep(0.1)
+            # Call regeneration service, streaming the LLM's text as chunks
+            draft = await service.regenerate_draft(
+                draft_id=draft_id,
+                user_id=user_id,
+                plan=plan,
+                feedback=feedback,
+                on_token=_draft_preview(task_id)
+            )
 
-        # Convert DraftResponse to dict for JSON serialization
-        draft_dict = draft.model_dump(mode="json")
+            # Plain dict: update_task_state's orjson encodes the UUIDs and
+            # datetimes natively, in the same pass as the rest of the state
+            draft_dict = draft.model_dump()
 
-        update_task_state(task_id, "SUCCESS", {
-            "type": "complete",
-            "draft": draft_dict
-        })
+            update_task_state(task_id, "SUCCESS", {
+                "type": "complete",
+                "draft": draft_dict
+            })
 
-    except AppError as e:
-        # User-facing errors
-        update_task_state(task_id, "FAILURE", {
-            "type": "error",
-            "message": e.message,
-            "code": e.code,
-            "details": e.details
-        })
-    except Exception as e:
-        # System errors
-        update_task_state(task_id, "FAILURE", {
-            "type": "error",
-            "message": f"Regeneration failed: {str(e)}",
-            "code": ErrorCode.INTERNAL_ERROR
-        })
+        except AppError as e:
+            # User-facing errors
+            update_task_state(task_id, "FAILURE", {
+                "type": "error",
+                "message": e.message,
+                "code": e.code,
+                "details": e.details
+            })
+        except Exception as e:
+            # System errors
+            update_task_state(task_id, "FAILURE", {
+                "type": "error",
+                "message": f"Regeneration failed: {str(e)}",
+                "code": ErrorCode.INTERNAL_ERROR
+            })
 
 
 @router.delete("/drafts/{draft_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_draft(
     draft_id: UUID,
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: GenerationService = Depends(get_generation_service)
 ):
     """
     Delete a draft.
@@ -599,6 +571,7 @@ async def delete_draft(
     Args:
         draft_id: Draft UUID
         user: Current authenticated user from JWT
+        service: Shared GenerationService
 
     Returns:
         204 No Content
@@ -608,7 +581,6 @@ async def delete_draft(
     """
     user_id = user["sub"]
 
-    service = GenerationService()
     try:
         await service.delete_draft(
             draft_id=str(draft_id),
@@ -3,38 +3,47 @@ Monitoring API endpoints for post registration and shadowban tracking.
 
 Endpoints:
 - POST /register: Register a post for monitoring
+- POST /register/batch: Register several posts for monitoring at once
 - GET /posts: List monitored posts for a campaign
 - GET /dashboard: Aggregate monitoring stats
 - GET /{shadow_id}: Single monitored post detail
 - GET /stream/{task_id}: Stream monitoring check progress via SSE
 """
-import asyncio
-import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Body, Depends, HTTPException, Header, Query, Response, status
 
-from app.workers.task_runner import generate_task_id, get_task_state, update_task_state
-from app.services.monitoring_service import MonitoringService
+from app.workers.task_runner import (
+    generate_task_id,
+    spawn_background,
+    update_task_state,
+)
+from app.services.monitoring_service import MonitoringService, get_monitoring_service
+from app.services.stream_hub import task_event_stream
 from app.models.monitoring import (
     RegisterPostRequest,
     RegisterPostResponse,
     ShadowEntry,
+    MonitoredPostsResponse,
     MonitoringDashboardStats,
 )
 from app.dependencies import get_current_user
 from app.utils.errors import ErrorCode
+from app.utils.sse import sse_response
 
 
 router = APIRouter()
 
+# Most posts accepted by one batch registration
+MAX_BATCH_REGISTRATIONS = 50
+
 
 @router.post("/register", status_code=status.HTTP_201_CREATED, response_model=RegisterPostResponse)
 async def register_post_for_monitoring(
     request: RegisterPostRequest,
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: MonitoringService = Depends(get_monitoring_service)
 ):
     """
     Register a posted draft for monitoring.
@@ -45,6 +54,7 @@ async def register_post_for_monitoring(
     Args:
         request: RegisterPostRequest with post_url and campaign_id
         user: Current authenticated user from JWT
+        service: Shared MonitoringService
 
     Returns:
         201 Created with RegisterPostResponse
@@ -56,7 +66,6 @@ async def register_post_for_monitoring(
     user_id = user["sub"]
 
     try:
-        service = MonitoringService()
         result = service.register_post(
             user_id=user_id,
             campaign_id=str(request.campaign_id),
@@ -67,7 +76,7 @@ async def register_post_for_monitoring(
         shadow_id = str(result.id)
         check_task_id = generate_task_id()
 
-        asyncio.create_task(
+        spawn_background(
             run_monitoring_check_background(check_task_id, shadow_id)
         )
 
@@ -100,11 +109,66 @@ async def register_post_for_monitoring(
             )
 
 
-@router.get("/posts")
+@router.post("/register/batch", status_code=status.HTTP_201_CREATED, response_model=List[RegisterPostResponse])
+async def register_posts_for_monitoring(
+    requests: List[RegisterPostRequest] = Body(..., min_length=1, max_length=MAX_BATCH_REGISTRATIONS),
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: MonitoringService = Depends(get_monitoring_service)
+):
+    """
+    Register several posted drafts for monitoring at once.
+
+    Creates all shadow_table entries with one lookup per kind and a single
+    insert (MonitoringService.register_posts_bulk), then starts every first
+    check in the background. The checks run concurrently, capped at
+    MAX_CONCURRENT_MONITORING_CHECKS like every other monitoring check.
+
+    Args:
+        requests: RegisterPostRequest per post (at most MAX_BATCH_REGISTRATIONS)
+        user: Current authenticated user from JWT
+        service: Shared MonitoringService
+
+    Returns:
+        201 Created with a RegisterPostResponse per post, in request order
+
+    Raises:
+        400: Invalid or repeated URL
+        409: A post is already registered for this user
+    """
+    user_id = user["sub"]
+
+    try:
+        results = service.register_posts_bulk(
+            user_id=user_id,
+            posts=[(str(request.campaign_id), request.post_url) for request in requests]
+        )
+    except ValueError as e:
+        code, status_code = ErrorCode.VALIDATION_ERROR, status.HTTP_400_BAD_REQUEST
+        if "already registered" in str(e):
+            code, status_code = ErrorCode.DUPLICATE_RESOURCE, status.HTTP_409_CONFLICT
+        raise HTTPException(
+            status_code=status_code,
+            detail={
+                "code": code,
+                "message": str(e),
+                "details": {"post_urls": [request.post_url for request in requests]}
+            }
+        )
+
+    for result in results:
+        spawn_background(
+            run_monitoring_check_background(generate_task_id(), str(result.id))
+        )
+
+    return results
+
+
+@router.get("/posts", response_model=MonitoredPostsResponse)
 async def get_monitored_posts(
     campaign_id: UUID = Query(..., description="Campaign UUID"),
     status_filter: Optional[str] = Query(None, description="Filter by status", alias="status"),
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: MonitoringService = Depends(get_monitoring_service)
 ):
     """
     List monitored posts for a campaign.
@@ -115,24 +179,24 @@ async def get_monitored_posts(
         campaign_id: Campaign UUID (required)
         status_filter: Optional status_vida filter
         user: Current authenticated user from JWT
+        service: Shared MonitoringService
 
     Returns:
-        200 OK with {"posts": list[ShadowEntry], "total": int}
+        200 OK with MonitoredPostsResponse ({"posts": list[ShadowEntry], "total": int})
     """
     user_id = user["sub"]
 
     try:
-        service = MonitoringService()
         posts = service.get_monitored_posts(
             user_id=user_id,
             campaign_id=str(campaign_id),
             status=status_filter
         )
 
-        return {
-            "posts": [post.model_dump(mode="json") for post in posts],
-            "total": len(posts)
-        }
+        # Serialized to JSON bytes in one pydantic-core call, instead of a
+        # model_dump per post plus a second encoding pass by FastAPI
+        body = MonitoredPostsResponse(posts=posts, total=len(posts)).model_dump_json()
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(
@@ -147,7 +211,8 @@ async def get_monitored_posts(
 @router.get("/dashboard", response_model=MonitoringDashboardStats)
 async def get_monitoring_dashboard(
     campaign_id: UUID = Query(..., description="Campaign UUID"),
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: MonitoringService = Depends(get_monitoring_service)
 ):
     """
     Get monitoring dashboard statistics.
@@ -157,6 +222,7 @@ async def get_monitoring_dashboard(
     Args:
         campaign_id: Campaign UUID (required)
         user: Current authenticated user from JWT
+        service: Shared MonitoringService
 
     Returns:
         200 OK with MonitoringDashboardStats
@@ -164,7 +230,6 @@ async def get_monitoring_dashboard(
     user_id = user["sub"]
 
     try:
-        service = MonitoringService()
         stats = service.get_dashboard_stats(
             user_id=user_id,
             campaign_id=str(campaign_id)
@@ -185,7 +250,8 @@ async def get_monitoring_dashboard(
 @router.get("/{shadow_id}", response_model=ShadowEntry)
 async def get_shadow_entry_detail(
     shadow_id: UUID,
-    user: Dict[str, Any] = Depends(get_current_user)
+    user: Dict[str, Any] = Depends(get_current_user),
+    service: MonitoringService = Depends(get_monitoring_service)
 ):
     """
     Get single monitored post detail.
@@ -195,6 +261,7 @@ async def get_shadow_entry_detail(
     Args:
         shadow_id: Shadow entry UUID
         user: Current authenticated user from JWT
+        service: Shared MonitoringService
 
     Returns:
         200 OK with ShadowEntry
@@ -205,7 +272,6 @@ async def get_shadow_entry_detail(
     user_id = user["sub"]
 
     try:
-        service = MonitoringService()
         entry = service.get_shadow_entry(
             shadow_id=str(shadow_id),
             user_id=user_id
@@ -226,12 +292,14 @@ async def get_shadow_entry_detail(
 
 @router.get("/stream/{task_id}")
 async def stream_monitoring_progress(
-    task_id: str
+    task_id: str,
+    accept_encoding: Optional[str] = Header(None)
 ):
     """
     Stream monitoring check progress via Server-Sent Events (SSE).
 
-    Polls task state every 500ms and yields SSE events with progress data.
+    Subscribes to the task's updates through the shared StreamHub and yields
+    an SSE event for each published state change, like the analysis stream.
     No authentication required - task_id acts as bearer token (unguessable UUID).
 
     SSE events:
@@ -243,59 +311,13 @@ async def stream_monitoring_progress(
 
     Args:
         task_id: Task UUID from registration response
+        accept_encoding: Accept-Encoding header; gzip compresses the stream
 
     Returns:
         StreamingResponse with text/event-stream media type
     """
 
-    async def progress_stream():
-        """Generator function for SSE stream. Reads task state from Redis."""
-        last_state = None
-        last_meta = None
-        heartbeat_counter = 0
-
-        while True:
-            task = get_task_state(task_id)
-            state = task["state"]
-            meta = task["meta"]
-
-            state_changed = (state != last_state or meta != last_meta)
-            last_state = state
-            last_meta = meta
-
-            if state == "SUCCESS":
-                yield f"event: success\ndata: {json.dumps(meta)}\n\n"
-                yield f"event: done\ndata: {{}}\n\n"
-                break
-            elif state == "FAILURE":
-                yield f"event: error\ndata: {json.dumps(meta)}\n\n"
-                yield f"event: done\ndata: {{}}\n\n"
-                break
-            elif state_changed:
-                if state == "PROGRESS":
-                    yield f"event: progress\ndata: {json.dumps(meta)}\n\n"
-                elif state == "STARTED":
-                    yield f"event: started\ndata: {json.dumps({'state': 'started'})}\n\n"
-                elif state == "PENDING":
-                    yield f"event: pending\ndata: {json.dumps({'state': 'pending'})}\n\n"
-                heartbeat_counter = 0
-            else:
-                heartbeat_counter += 1
-                if heartbeat_counter >= 10:  # 10 * 1.5s = 15s
-                    yield f": keepalive\n\n"
-                    heartbeat_counter = 0
-
-            await asyncio.sleep(1.5)
-
-    return StreamingResponse(
-        progress_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"  # Disable NGINX buffering for real-time streaming
-        }
-    )
+    return sse_response(task_event_stream(task_id), accept_encoding)
 
 
 async def run_monitoring_check_background(task_id: str, shadow_id: str):
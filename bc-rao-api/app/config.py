@@ -20,6 +20,12 @@ class Settings(BaseSettings):
     SUPABASE_ANON_KEY: str = ""
     SUPABASE_SERVICE_ROLE_KEY: str = ""
     SUPABASE_JWT_SECRET: str = ""
+    # Seconds a verified access token is trusted before asking Supabase again
+    JWT_CACHE_TTL_SECONDS: float = 60.0
+    # Verified tokens remembered per process
+    JWT_CACHE_MAX_SIZE: int = 10000
+    # Seconds a confirmed campaign owner's plan is served from Redis
+    OWNERSHIP_CACHE_TTL_SECONDS: int = 60
 
     # OpenRouter
     OPENROUTER_API_KEY: str = ""
@@ -28,11 +34,20 @@ class Settings(BaseSettings):
     # Apify
     APIFY_API_TOKEN: str = ""
     APIFY_REDDIT_ACTOR_ID: str = ""
+    # Collection runs allowed at once per process; further triggers queue up
+    MAX_CONCURRENT_COLLECTIONS: int = 2
 
     # Celery / Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     CELERY_BROKER_URL: str = ""
     CELERY_RESULT_BACKEND: str = ""
+    # Pool for short commands (state reads); fail fast when saturated
+    REDIS_GENERAL_POOL_MAX: int = 20
+    # Pool for Pub/Sub subscriptions: one connection per streamed task
+    REDIS_BLOCKING_POOL_MAX: int = 100
+    # Seconds to wait for a free pooled connection / for a command reply
+    REDIS_POOL_TIMEOUT: float = 0.5
+    REDIS_SOCKET_TIMEOUT: float = 0.5
 
     @property
     def celery_broker(self) -> str:
@@ -42,6 +57,18 @@ class Settings(BaseSettings):
     def celery_backend(self) -> str:
         return self.CELERY_RESULT_BACKEND or self.REDIS_URL
 
+    # NLP
+    # Worker processes for analyze_posts_batch (0 or 1 = run in-process)
+    NLP_PROCESS_WORKERS: int = 0
+    # spaCy n_process for style extraction (1 = single process, capped at 4)
+    STYLE_EXTRACTOR_NPROC: int = 1
+    # Analysis runs allowed at once per process; further triggers queue up
+    MAX_CONCURRENT_ANALYSES: int = 2
+    # Draft generations allowed at once per process; further triggers queue up
+    MAX_CONCURRENT_GENERATIONS: int = 4
+    # Monitoring checks (Reddit requests) allowed at once per process
+    MAX_CONCURRENT_MONITORING_CHECKS: int = 10
+
     # Email
     RESEND_API_KEY: str = ""
     EMAIL_FROM: str = "noreply@bcrao.app"
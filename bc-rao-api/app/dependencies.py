@@ -2,13 +2,20 @@
 FastAPI dependencies for authentication and authorization.
 Used across protected endpoints via Depends().
 """
+import logging
 from typing import Dict, Any
-from fastapi import Depends, HTTPException, status
+from uuid import UUID
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.integrations.supabase_client import get_async_supabase_client
+from app.services.auth_cache import cache_owner_plan, get_cached_owner_plan
+from app.utils.http_cache import CACHE_CONTROL, etag_matches, get_data_version, make_etag
 from app.utils.security import verify_jwt
 from app.utils.errors import AppError, ErrorCode
 
 
+logger = logging.getLogger(__name__)
+
 # HTTPBearer scheme for JWT tokens in Authorization header
 security = HTTPBearer()
 
@@ -47,3 +54,122 @@ async def get_current_user(
                 "details": e.details
             }
         )
+
+
+async def campaign_owner_plan(
+    campaign_id: UUID,
+    user: Dict[str, Any] = Depends(get_current_user)
+) -> str:
+    """
+    Dependency checking campaign ownership and returning the user's plan.
+
+    Both come from one RPC (get_campaign_owner_plan, migration 007) instead
+    of a campaigns query plus a subscriptions query, and a confirmed result
+    is cached in Redis for OWNERSHIP_CACHE_TTL_SECONDS so repeated triggers
+    skip Supabase.
+
+    Args:
+        campaign_id: Campaign UUID from the path
+        user: Decoded JWT payload from get_current_user
+
+    Returns:
+        Plan tier of the user (trial, starter, growth)
+
+    Raises:
+        HTTPException: 404 if the campaign doesn't exist or isn't owned by the user
+    """
+    key = str(campaign_id)
+    plan = await get_cached_owner_plan(key, user["sub"])
+
+    if plan is None:
+        supabase = await get_async_supabase_client()
+        response = await supabase.rpc(
+            "get_campaign_owner_plan", {"p_campaign_id": key, "p_user_id": user["sub"]}
+        ).execute()
+
+        if response.data is None:
+            raise _campaign_not_found(key)
+
+        plan = response.data
+        await cache_owner_plan(key, user["sub"], plan)
+
+    return plan
+
+
+def _campaign_not_found(campaign_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": ErrorCode.RESOURCE_NOT_FOUND,
+            "message": "Campaign not found or access denied",
+            "details": {"campaign_id": campaign_id}
+        }
+    )
+
+
+async def campaign_data_etag(
+    campaign_id: UUID,
+    request: Request,
+    response: Response,
+    user: Dict[str, Any] = Depends(get_current_user)
+) -> Dict[str, str]:
+    """
+    Dependency adding ETag validation to a read-only campaign analysis endpoint.
+
+    Answers 304 Not Modified (before the endpoint runs, so without any
+    Supabase query) when If-None-Match carries the current ETag; otherwise
+    sets ETag and Cache-Control on the endpoint's response. If Redis is
+    unavailable the endpoint is served normally, without an ETag.
+
+    Returns:
+        The caching headers, for endpoints that build their own Response
+        (headers set here only apply to returned data, not to Responses)
+
+    Raises:
+        HTTPException: 304 if the client's cached copy is current
+    """
+    return await _conditional_get(str(campaign_id), user["sub"], request, response)
+
+
+async def post_data_etag(
+    campaign_id: UUID,
+    post_id: UUID,
+    request: Request,
+    response: Response,
+    user: Dict[str, Any] = Depends(get_current_user)
+) -> Dict[str, str]:
+    """
+    Dependency adding ETag validation to a single-post read of a campaign
+    (post_id from the path or the query string).
+
+    Same as campaign_data_etag (the campaign's data version covers its
+    posts, whose scores change when analysis runs), with the ETag bound to
+    the post.
+
+    Raises:
+        HTTPException: 304 if the client's cached copy is current
+    """
+    return await _conditional_get(str(campaign_id), user["sub"], request, response, str(post_id))
+
+
+async def _conditional_get(
+    campaign_id: str,
+    user_id: str,
+    request: Request,
+    response: Response,
+    resource: str = ""
+) -> Dict[str, str]:
+    try:
+        version = await get_data_version(campaign_id)
+    except Exception as e:
+        logger.warning(f"Skipping ETag for campaign {campaign_id}: {e}")
+        return {}
+
+    etag = make_etag(campaign_id, user_id, version, resource)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return headers
@@ -15,18 +15,19 @@ Pipeline flow:
 """
 
 import logging
-from typing import Optional, List
+from typing import Callable, Optional, List
 from uuid import UUID
 from datetime import datetime
 
-from app.integrations.supabase_client import get_supabase_client
+from app.integrations.supabase_client import get_async_supabase_client
 from app.inference.client import InferenceClient
 from app.generation.prompt_builder import PromptBuilder
 from app.generation.humanizer import humanize_text, intensity_from_formality
 from app.generation.isc_gating import validate_generation_request
 from app.generation.blacklist_validator import validate_draft, detect_ai_patterns
 from app.analysis.nlp_pipeline import analyze_posts_batch
-from app.analysis.scorers import calculate_post_score
+from app.analysis.scorers import TEXT_SIGNAL_KEYS, calculate_post_score
+from app.services.draft_counter import increment_draft_count, invalidate_draft_count
 from app.models.draft import (
     GenerateDraftRequest,
     DraftResponse,
@@ -38,12 +39,18 @@ from app.utils.errors import AppError, ErrorCode
 
 logger = logging.getLogger(__name__)
 
+# generated_drafts columns returned by DraftResponse (everything but user_id)
+DRAFT_COLUMNS = (
+    "id, campaign_id, subreddit, archetype, title, body, vulnerability_score, "
+    "rhythm_match_score, blacklist_violations, model_used, token_count, "
+    "token_cost_usd, generation_params, status, user_edits, created_at, updated_at"
+)
+
 
 class GenerationService:
     """Service for generating, scoring, and managing drafts."""
 
     def __init__(self):
-        self.supabase = get_supabase_client()
         self.prompt_builder = PromptBuilder()
 
     async def generate_draft(
@@ -52,6 +59,7 @@ class GenerationService:
         user_id: str,
         plan: str,
         request: GenerateDraftRequest,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> DraftResponse:
         """
         Generate a new draft using the full pipeline.
@@ -72,6 +80,8 @@ class GenerationService:
             user_id: User UUID
             plan: User plan (trial, starter, growth)
             request: GenerateDraftRequest with subreddit, archetype, context, account_status
+            on_token: Optional callback receiving the LLM's text as it streams
+                (before humanization; the stored draft is the final text)
 
         Returns:
             DraftResponse with generated draft and scores
@@ -79,12 +89,14 @@ class GenerationService:
         Raises:
             AppError: If ISC gating blocks request or generation fails
         """
+        supabase = await get_async_supabase_client()
+
         # Step 1: Load community profile (optional - gracefully handle absence)
         profile = None
         isc_score = 5.0  # Default for generic prompts
 
         try:
-            profile_response = self.supabase.table("community_profiles").select("*").eq(
+            profile_response = await supabase.table("community_profiles").select("*").eq(
                 "campaign_id", campaign_id
             ).eq("subreddit", request.subreddit).execute()
 
@@ -104,7 +116,7 @@ class GenerationService:
         # forbidden_pattern (text), category (text), failure_type (enum), confidence (float)
         blacklist_patterns = []
         try:
-            blacklist_response = self.supabase.table("syntax_blacklist").select(
+            blacklist_response = await supabase.table("syntax_blacklist").select(
                 "forbidden_pattern, category, failure_type, confidence"
             ).eq("campaign_id", campaign_id).eq("subreddit", request.subreddit).execute()
 
@@ -171,6 +183,7 @@ class GenerationService:
                 user_id=user_id,
                 plan=plan,
                 campaign_id=campaign_id,
+                on_token=on_token,
             )
 
             generated_text = inference_result["content"]
@@ -241,6 +254,8 @@ class GenerationService:
                 "formality_score": nlp_result.get("formality_score"),
                 "avg_sentence_length": nlp_result.get("avg_sentence_length"),
                 "sentence_length_std": nlp_result.get("sentence_length_std"),
+                # Text-only signals already computed during the NLP pass
+                **{key: nlp_result[key] for key in TEXT_SIGNAL_KEYS if key in nlp_result},
             }
 
             score_breakdown = calculate_post_score(post_data, community_avg)
@@ -285,7 +300,7 @@ class GenerationService:
         }
 
         try:
-            insert_response = self.supabase.table("generated_drafts").insert(draft_data).execute()
+            insert_response = await supabase.table("generated_drafts").insert(draft_data).execute()
             stored_draft = insert_response.data[0]
         except Exception as e:
             raise AppError(
@@ -295,26 +310,11 @@ class GenerationService:
                 status_code=500
             )
 
+        # Count it toward the monthly limit (see check_draft_quota)
+        await increment_draft_count(user_id)
+
         # Step 11: Return DraftResponse
-        return DraftResponse(
-            id=stored_draft["id"],
-            campaign_id=stored_draft["campaign_id"],
-            subreddit=stored_draft["subreddit"],
-            archetype=stored_draft["archetype"],
-            title=stored_draft.get("title"),
-            body=stored_draft["body"],
-            vulnerability_score=stored_draft["vulnerability_score"],
-            rhythm_match_score=stored_draft["rhythm_match_score"],
-            blacklist_violations=stored_draft["blacklist_violations"],
-            model_used=stored_draft["model_used"],
-            token_count=stored_draft["token_count"],
-            token_cost_usd=stored_draft["token_cost_usd"],
-            generation_params=stored_draft["generation_params"],
-            status=stored_draft["status"],
-            user_edits=stored_draft.get("user_edits"),
-            created_at=stored_draft["created_at"],
-            updated_at=stored_draft["updated_at"],
-        )
+        return DraftResponse.model_validate(stored_draft)
 
     async def get_drafts(
         self,
@@ -339,8 +339,9 @@ class GenerationService:
         Returns:
             DraftListResponse with drafts and total count
         """
-        query = self.supabase.table("generated_drafts").select(
-            "*", count="exact"
+        supabase = await get_async_supabase_client()
+        query = supabase.table("generated_drafts").select(
+            DRAFT_COLUMNS, count="exact"
         ).eq("campaign_id", campaign_id).eq("user_id", user_id)
 
         if status:
@@ -356,32 +357,10 @@ class GenerationService:
 
         query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
 
-        response = query.execute()
-
-        drafts = [
-            DraftResponse(
-                id=d["id"],
-                campaign_id=d["campaign_id"],
-                subreddit=d["subreddit"],
-                archetype=d["archetype"],
-                title=d.get("title"),
-                body=d["body"],
-                vulnerability_score=d["vulnerability_score"],
-                rhythm_match_score=d["rhythm_match_score"],
-                blacklist_violations=d["blacklist_violations"],
-                model_used=d["model_used"],
-                token_count=d["token_count"],
-                token_cost_usd=d["token_cost_usd"],
-                generation_params=d["generation_params"],
-                status=d["status"],
-                user_edits=d.get("user_edits"),
-                created_at=d["created_at"],
-                updated_at=d["updated_at"],
-            )
-            for d in response.data
-        ]
+        response = await query.execute()
 
-        return DraftListResponse(drafts=drafts, total=response.count)
+        # Validated in one pydantic-core call rather than field by field
+        return DraftListResponse.model_validate({"drafts": response.data, "total": response.count})
 
     async def update_draft(
         self,
@@ -404,7 +383,8 @@ class GenerationService:
             AppError: If draft not found or access denied
         """
         # Verify ownership
-        draft_response = self.supabase.table("generated_drafts").select("*").eq(
+        supabase = await get_async_supabase_client()
+        draft_response = await supabase.table("generated_drafts").select(DRAFT_COLUMNS).eq(
             "id", draft_id
         ).eq("user_id", user_id).execute()
 
@@ -425,34 +405,14 @@ class GenerationService:
 
         if not update_data:
             # No changes, return existing draft
-            return DraftResponse(**draft_response.data[0])
+            return DraftResponse.model_validate(draft_response.data[0])
 
         # Update draft
-        update_response = self.supabase.table("generated_drafts").update(
+        update_response = await supabase.table("generated_drafts").update(
             update_data
         ).eq("id", draft_id).execute()
 
-        updated_draft = update_response.data[0]
-
-        return DraftResponse(
-            id=updated_draft["id"],
-            campaign_id=updated_draft["campaign_id"],
-            subreddit=updated_draft["subreddit"],
-            archetype=updated_draft["archetype"],
-            title=updated_draft.get("title"),
-            body=updated_draft["body"],
-            vulnerability_score=updated_draft["vulnerability_score"],
-            rhythm_match_score=updated_draft["rhythm_match_score"],
-            blacklist_violations=updated_draft["blacklist_violations"],
-            model_used=updated_draft["model_used"],
-            token_count=updated_draft["token_count"],
-            token_cost_usd=updated_draft["token_cost_usd"],
-            generation_params=updated_draft["generation_params"],
-            status=updated_draft["status"],
-            user_edits=updated_draft.get("user_edits"),
-            created_at=updated_draft["created_at"],
-            updated_at=updated_draft["updated_at"],
-        )
+        return DraftResponse.model_validate(update_response.data[0])
 
     async def regenerate_draft(
         self,
@@ -460,6 +420,7 @@ class GenerationService:
         user_id: str,
         plan: str,
         feedback: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> DraftResponse:
         """
         Regenerate a draft with optional user feedback.
@@ -471,6 +432,7 @@ class GenerationService:
             user_id: User UUID
             plan: User plan
             feedback: Optional user feedback to incorporate
+            on_token: Optional callback receiving the LLM's text as it streams
 
         Returns:
             New DraftResponse with regenerated content
@@ -479,7 +441,8 @@ class GenerationService:
             AppError: If original draft not found
         """
         # Load original draft
-        draft_response = self.supabase.table("generated_drafts").select("*").eq(
+        supabase = await get_async_supabase_client()
+        draft_response = await supabase.table("generated_drafts").select("*").eq(
             "id", draft_id
         ).eq("user_id", user_id).execute()
 
@@ -513,6 +476,7 @@ class GenerationService:
             user_id=user_id,
             plan=plan,
             request=regenerate_request,
+            on_token=on_token,
         )
 
     async def delete_draft(self, draft_id: str, user_id: str) -> None:
@@ -527,7 +491,8 @@ class GenerationService:
             AppError: If draft not found or access denied
         """
         # Verify ownership
-        draft_response = self.supabase.table("generated_drafts").select("id").eq(
+        supabase = await get_async_supabase_client()
+        draft_response = await supabase.table("generated_drafts").select("id").eq(
             "id", draft_id
         ).eq("user_id", user_id).execute()
 
@@ -540,4 +505,20 @@ class GenerationService:
             )
 
         # Delete draft
-        self.supabase.table("generated_drafts").delete().eq("id", draft_id).execute()
+        await supabase.table("generated_drafts").delete().eq("id", draft_id).execute()
+
+        # Deleted drafts don't count toward the monthly limit: recount
+        await invalidate_draft_count(user_id)
+
+
+_generation_service: Optional[GenerationService] = None
+
+
+def get_generation_service() -> GenerationService:
+    """Get the process-wide GenerationService (stateless, so safe to share)."""
+    global _generation_service
+
+    if _generation_service is None:
+        _generation_service = GenerationService()
+
+    return _generation_service
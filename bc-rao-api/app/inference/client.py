@@ -3,10 +3,12 @@ InferenceClient: OpenRouter abstraction with model routing and cost tracking.
 Provides task-based model selection with automatic fallback and budget enforcement.
 
 Supports both single-prompt and system/user message pairs for proper LLM
-persona separation via the Chat Completions API.
+persona separation via the Chat Completions API, and streaming the primary
+model's tokens to a callback as they are generated.
 """
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict
 import httpx
+import orjson
 from app.config import settings
 from app.inference.router import MODEL_ROUTING
 from app.inference.cost_tracker import CostTracker
@@ -43,6 +45,7 @@ class InferenceClient:
         plan: str,
         campaign_id: Optional[str] = None,
         system_prompt: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> dict:
         """
         Make inference call with budget checking and cost tracking.
@@ -52,12 +55,18 @@ class InferenceClient:
         following. When omitted, sends prompt as a single user message (legacy
         behavior for non-generation tasks).
 
+        When on_token is provided, the primary model's response is streamed
+        and each content delta is passed to on_token as it arrives. The
+        fallback model (if the primary fails) isn't streamed; its content
+        only comes back in the result.
+
         Args:
             prompt: User prompt/input
             user_id: User UUID for cost tracking
             plan: User plan (trial, starter, growth)
             campaign_id: Campaign UUID (optional)
             system_prompt: Optional system-level instructions for LLM persona
+            on_token: Optional callback receiving streamed content deltas
 
         Returns:
             dict with keys: content, model_used, token_count, cost_usd
@@ -87,14 +96,25 @@ class InferenceClient:
 
         # 2. Try primary model
         try:
-            result = await self._call_openrouter(
-                messages=messages,
-                model=self.config["model"],
-                max_tokens=self.config["max_tokens"],
-                temperature=self.config["temperature"],
-                frequency_penalty=self.config.get("frequency_penalty"),
-                presence_penalty=self.config.get("presence_penalty"),
-            )
+            if on_token is not None:
+                result = await self._stream_openrouter(
+                    messages=messages,
+                    model=self.config["model"],
+                    max_tokens=self.config["max_tokens"],
+                    temperature=self.config["temperature"],
+                    on_token=on_token,
+                    frequency_penalty=self.config.get("frequency_penalty"),
+                    presence_penalty=self.config.get("presence_penalty"),
+                )
+            else:
+                result = await self._call_openrouter(
+                    messages=messages,
+                    model=self.config["model"],
+                    max_tokens=self.config["max_tokens"],
+                    temperature=self.config["temperature"],
+                    frequency_penalty=self.config.get("frequency_penalty"),
+                    presence_penalty=self.config.get("presence_penalty"),
+                )
         except Exception as e:
             # 3. Fallback to secondary model on failure
             try:
@@ -166,22 +186,9 @@ class InferenceClient:
         Returns:
             dict with keys: content, model_used, token_count
         """
-        url = f"{settings.OPENROUTER_BASE_URL}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-            "HTTP-Referer": "https://bcrao.app",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "model": model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature
-        }
-        if frequency_penalty is not None:
-            payload["frequency_penalty"] = frequency_penalty
-        if presence_penalty is not None:
-            payload["presence_penalty"] = presence_penalty
+        url, headers, payload = self._openrouter_request(
+            messages, model, max_tokens, temperature, frequency_penalty, presence_penalty
+        )
 
         async with httpx.AsyncClient(timeout=60.0) as client:
             response = await client.post(url, headers=headers, json=payload)
@@ -200,6 +207,90 @@ class InferenceClient:
             "token_count": token_count
         }
 
+    async def _stream_openrouter(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        on_token: Callable[[str], None],
+        frequency_penalty: Optional[float] = None,
+        presence_penalty: Optional[float] = None,
+    ) -> dict:
+        """
+        Make a streaming HTTP call to OpenRouter API.
+
+        Same request as _call_openrouter with stream=True: the response is a
+        stream of SSE chunks whose content deltas are passed to on_token,
+        and the last chunk carries the token usage.
+
+        Returns:
+            dict with keys: content, model_used, token_count
+        """
+        url, headers, payload = self._openrouter_request(
+            messages, model, max_tokens, temperature, frequency_penalty, presence_penalty
+        )
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+
+        parts = []
+        usage = {}
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            async with client.stream("POST", url, headers=headers, json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    # Skip blank separators and ": OPENROUTER PROCESSING" comments
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[len("data: "):]
+                    if data == "[DONE]":
+                        break
+
+                    chunk = orjson.loads(data)
+                    if "error" in chunk:
+                        raise RuntimeError(chunk["error"].get("message", "Streaming error"))
+                    if chunk.get("usage"):
+                        usage = chunk["usage"]
+                    for choice in chunk.get("choices") or ():
+                        delta = (choice.get("delta") or {}).get("content")
+                        if delta:
+                            parts.append(delta)
+                            on_token(delta)
+
+        return {
+            "content": "".join(parts),
+            "model_used": model,
+            "token_count": usage.get("total_tokens", 0)
+        }
+
+    def _openrouter_request(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        frequency_penalty: Optional[float],
+        presence_penalty: Optional[float],
+    ) -> tuple:
+        """URL, headers and JSON payload of a Chat Completions request."""
+        url = f"{settings.OPENROUTER_BASE_URL}/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+            "HTTP-Referer": "https://bcrao.app",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        if frequency_penalty is not None:
+            payload["frequency_penalty"] = frequency_penalty
+        if presence_penalty is not None:
+            payload["presence_penalty"] = presence_penalty
+        return url, headers, payload
+
     def _estimate_cost(self, token_count: int, model: str) -> float:
         """
         Estimate cost based on token count and model.
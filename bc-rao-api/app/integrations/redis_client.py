@@ -0,0 +1,68 @@
+"""
+Asyncio Redis clients, split into two connection pools.
+
+- General: short GET/SET calls from request handlers and SSE state reads.
+  Small pool, short socket timeout.
+- Blocking: long-lived Pub/Sub subscriptions held by the StreamHub. Sized
+  to the expected number of concurrently streamed tasks; no socket timeout,
+  since a subscription idles between updates.
+
+Keeping them apart means a pile-up of open subscriptions can't starve the
+quick reads. Both pools wait at most REDIS_POOL_TIMEOUT for a free
+connection and raise redis.ConnectionError when saturated instead of
+queueing indefinitely.
+"""
+from typing import Optional
+
+import redis.asyncio
+
+from app.config import settings
+
+
+_general_client: Optional[redis.asyncio.Redis] = None
+_blocking_client: Optional[redis.asyncio.Redis] = None
+
+
+def get_general_client() -> redis.asyncio.Redis:
+    """Get or create the client for short commands (state reads)."""
+    global _general_client
+
+    if _general_client is None:
+        pool = redis.asyncio.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            max_connections=settings.REDIS_GENERAL_POOL_MAX,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+        _general_client = redis.asyncio.Redis(connection_pool=pool)
+
+    return _general_client
+
+
+def get_blocking_client() -> redis.asyncio.Redis:
+    """Get or create the client for Pub/Sub subscriptions."""
+    global _blocking_client
+
+    if _blocking_client is None:
+        pool = redis.asyncio.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            max_connections=settings.REDIS_BLOCKING_POOL_MAX,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+        )
+        _blocking_client = redis.asyncio.Redis(connection_pool=pool)
+
+    return _blocking_client
+
+
+async def close_redis_clients() -> None:
+    """Close both pools if they were created."""
+    global _general_client, _blocking_client
+
+    for client in (_general_client, _blocking_client):
+        if client is not None:
+            await client.aclose(close_connection_pool=True)
+
+    _general_client = None
+    _blocking_client = None
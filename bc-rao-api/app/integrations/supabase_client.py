@@ -2,12 +2,17 @@
 Supabase client for server-side database operations.
 Uses service role key for bypassing RLS when needed.
 """
+import asyncio
 from typing import Optional
-from supabase import create_client, Client
+from supabase import AsyncClient, Client, acreate_client, create_client
 from app.config import settings
 
 
 _supabase_client: Optional[Client] = None
+_async_supabase_client: Optional[AsyncClient] = None
+# Serializes the first creation: acreate_client awaits, so concurrent first
+# requests would otherwise each build (and keep) their own client
+_async_supabase_lock = asyncio.Lock()
 
 
 def get_supabase_client() -> Client:
@@ -27,3 +32,27 @@ def get_supabase_client() -> Client:
         )
 
     return _supabase_client
+
+
+async def get_async_supabase_client() -> AsyncClient:
+    """
+    Get or create the asyncio Supabase client with service role key.
+
+    Queries are awaited over a shared httpx.AsyncClient, so async endpoints
+    don't block the event loop the way the sync client's execute() does.
+    Once created, this is a global read: no lock, no factory work.
+
+    Returns:
+        Supabase AsyncClient instance for server-side operations
+    """
+    global _async_supabase_client
+
+    if _async_supabase_client is None:
+        async with _async_supabase_lock:
+            if _async_supabase_client is None:
+                _async_supabase_client = await acreate_client(
+                    supabase_url=settings.SUPABASE_URL,
+                    supabase_key=settings.SUPABASE_SERVICE_ROLE_KEY
+                )
+
+    return _async_supabase_client
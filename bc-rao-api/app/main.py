@@ -68,12 +68,21 @@ async def startup_event():
 async def shutdown_event():
     """
     Application shutdown event handler.
-    Closes Redis connection to prevent resource leaks.
+    Ends open progress streams, closes Redis connections and stops the NLP
+    worker pool to prevent resource leaks.
     """
+    from app.services.stream_hub import stream_hub
+    await stream_hub.close()
+
     from app.workers.task_runner import get_redis
+    from app.integrations.redis_client import close_redis_clients
     r = get_redis()
     if r:
         r.close()
+    await close_redis_clients()
+
+    from app.analysis.nlp_pipeline import shutdown_nlp_executor
+    shutdown_nlp_executor()
 
 
 @app.get("/health")
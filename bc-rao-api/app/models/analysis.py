@@ -5,10 +5,23 @@ Models for NLP results, post scoring, community profiles, and forbidden patterns
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+# Sort options for analyzed posts; each maps to a fixed ORDER BY in the
+# get_campaign_analyzed_posts function (migration 006)
+AnalyzedPostSortField = Literal[
+    "total_score",
+    "vulnerability_weight",
+    "rhythm_adherence",
+    "formality_match",
+    "marketing_jargon_penalty",
+    "created_at",
+]
+SortDirection = Literal["asc", "desc"]
 
 
 class NLPResult(BaseModel):
@@ -34,6 +47,11 @@ class PostScoreBreakdown(BaseModel):
     penalty_phrases: list[dict]  # {phrase, severity, category}
 
 
+class BatchBreakdownRequest(BaseModel):
+    """Posts to fetch scoring breakdowns for in one request."""
+    post_ids: list[UUID] = Field(..., min_length=1, max_length=100)
+
+
 class CommunityProfileResponse(BaseModel):
     """Community profile with ISC score and behavioral patterns."""
     id: UUID
@@ -63,6 +63,12 @@ class ShadowEntry(BaseModel):
     created_at: datetime
 
 
+class MonitoredPostsResponse(BaseModel):
+    """Monitored posts of a campaign."""
+    posts: list[ShadowEntry]
+    total: int
+
+
 class MonitoringDashboardStats(BaseModel):
     """Dashboard statistics for monitoring overview."""
     active_count: int
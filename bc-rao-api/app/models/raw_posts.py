@@ -5,7 +5,7 @@ Handles CRUD operations and API responses for collected Reddit posts.
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RawPostCreate(BaseModel):
@@ -32,16 +32,16 @@ class RawPostResponse(RawPostCreate):
     is_ai_processed: bool
     collected_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RawPostListResponse(BaseModel):
     """Paginated list response for raw posts."""
     posts: list[RawPostResponse]
-    total: int
+    total: Optional[int] = None  # Estimated for large results; not counted when paging by cursor
     page: int
     per_page: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last
 
 
 class CollectionProgress(BaseModel):
@@ -18,9 +18,12 @@ import statistics
 from typing import Optional, Callable, List, Dict, Any
 from uuid import UUID
 
-from app.integrations.supabase_client import get_supabase_client
+from fastapi import status
+
+from app.integrations.supabase_client import get_async_supabase_client, get_supabase_client
 from app.analysis.nlp_pipeline import analyze_posts_batch
 from app.analysis.scorers import (
+    TEXT_SIGNAL_KEYS,
     calculate_post_score,
     calculate_isc_score,
 )
@@ -33,10 +36,12 @@ from app.analysis.style_guide_generator import generate_style_guide
 from app.models.analysis import (
     AnalysisResult,
     AnalysisProgress,
+    AnalyzedPostSortField,
     CommunityProfileResponse,
     PostScoreBreakdown,
     BlacklistResponse,
     ForbiddenPatternEntry,
+    SortDirection,
     isc_to_tier,
 )
 from app.utils.errors import AppError, ErrorCode
@@ -163,6 +168,8 @@ class AnalysisService:
                         "formality_score": nlp_result.get("formality_score"),
                         "avg_sentence_length": nlp_result.get("avg_sentence_length"),
                         "sentence_length_std": nlp_result.get("sentence_length_std"),
+                        # Text-only signals already computed during the NLP pass
+                        **{key: nlp_result[key] for key in TEXT_SIGNAL_KEYS if key in nlp_result},
                     }
 
                     # Calculate score
@@ -375,82 +382,135 @@ class AnalysisService:
 
         return profile
 
-    async def get_community_profile(self, campaign_id: str, subreddit: str) -> dict:
+    async def _campaign_rpc(self, function: str, campaign_id: str, user_id: str, **params) -> Any:
+        """
+        Call a campaign-scoped read function (see migration 004).
+
+        The function checks ownership and fetches the data in one round-trip;
+        it returns NULL when the campaign isn't found or isn't the user's.
+
+        Raises:
+            AppError: If campaign not found or access denied
+        """
+        supabase = await get_async_supabase_client()
+        response = await supabase.rpc(
+            function, {"p_campaign_id": campaign_id, "p_user_id": user_id, **params}
+        ).execute()
+
+        if response.data is None:
+            raise AppError(
+                ErrorCode.RESOURCE_NOT_FOUND,
+                "Campaign not found or access denied",
+                {"campaign_id": campaign_id},
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+
+        return response.data
+
+    async def get_community_profile(self, campaign_id: str, user_id: str, subreddit: str) -> dict:
         """
         Fetch single community profile by campaign + subreddit.
 
         Args:
             campaign_id: Campaign UUID
+            user_id: User UUID (must own the campaign)
             subreddit: Subreddit name
 
         Returns:
             Community profile dict with isc_tier computed
 
         Raises:
-            AppError: If profile not found
+            AppError: If campaign not owned or profile not found
         """
-        response = self.supabase.table("community_profiles").select("*").eq(
-            "campaign_id", campaign_id
-        ).eq("subreddit", subreddit).execute()
+        profiles = await self._campaign_rpc(
+            "get_campaign_community_profiles", campaign_id, user_id, p_subreddit=subreddit
+        )
 
-        if not response.data:
+        if not profiles:
             raise AppError(
                 ErrorCode.RESOURCE_NOT_FOUND,
                 f"Community profile not found for r/{subreddit}",
                 {"campaign_id": campaign_id, "subreddit": subreddit}
             )
 
-        profile = response.data[0]
+        profile = profiles[0]
         profile["isc_tier"] = isc_to_tier(profile["isc_score"])
 
         return profile
 
-    async def get_community_profiles(self, campaign_id: str) -> List[dict]:
+    async def get_community_profiles(self, campaign_id: str, user_id: str) -> List[dict]:
         """
         Fetch all community profiles for a campaign.
 
         Args:
             campaign_id: Campaign UUID
+            user_id: User UUID (must own the campaign)
 
         Returns:
             List of community profile dicts with isc_tier computed
-        """
-        response = self.supabase.table("community_profiles").select("*").eq(
-            "campaign_id", campaign_id
-        ).execute()
 
-        profiles = response.data
+        Raises:
+            AppError: If campaign not found or access denied
+        """
+        profiles = await self._campaign_rpc("get_campaign_community_profiles", campaign_id, user_id)
 
         for profile in profiles:
             profile["isc_tier"] = isc_to_tier(profile["isc_score"])
 
         return profiles
 
-    async def get_scoring_breakdown(self, post_id: str) -> dict:
+    async def get_scoring_breakdown(self, campaign_id: str, user_id: str, post_id: str) -> dict:
         """
-        Get detailed scoring breakdown for a single post.
+        Get detailed scoring breakdown for a single post of a campaign.
 
         Args:
+            campaign_id: Campaign UUID
+            user_id: User UUID (must own the campaign)
             post_id: Post UUID
 
         Returns:
             PostScoreBreakdown dict with penalty phrases for inline highlighting
 
         Raises:
-            AppError: If post not found
+            AppError: If campaign not owned or post not found in it
         """
-        response = self.supabase.table("raw_posts").select(
-            "id, raw_text, rhythm_metadata, subreddit, campaign_id"
-        ).eq("id", post_id).execute()
+        result = await self._campaign_rpc(
+            "get_campaign_post_scoring", campaign_id, user_id, p_post_id=post_id
+        )
+        post = result["post"]
 
-        if not response.data:
+        if not post:
             raise AppError(
                 ErrorCode.RESOURCE_NOT_FOUND,
                 "Post not found",
                 {"post_id": post_id}
             )
 
-        post = response.data[0]
+        return self._build_breakdown(post)
+
+    async def get_scoring_breakdowns(self, campaign_id: str, user_id: str, post_ids: list[str]) -> dict:
+        """
+        Get scoring breakdowns for several posts of a campaign in one query.
+
+        Args:
+            campaign_id: Campaign UUID
+            user_id: User UUID (must own the campaign)
+            post_ids: Post UUIDs (posts outside the campaign are left out)
+
+        Returns:
+            Dict mapping post_id to its PostScoreBreakdown dict
+
+        Raises:
+            AppError: If campaign not found or access denied
+        """
+        result = await self._campaign_rpc(
+            "get_campaign_posts_scoring", campaign_id, user_id, p_post_ids=post_ids
+        )
+
+        return {post["id"]: self._build_breakdown(post) for post in result["posts"]}
+
+    def _build_breakdown(self, post: dict) -> dict:
+        """Build a PostScoreBreakdown dict from a raw post with rhythm_metadata."""
         rhythm_metadata = post.get("rhythm_metadata") or {}
 
         # Get penalty phrases from pattern checker
@@ -461,7 +521,7 @@ class AnalysisService:
         penalty_phrases.extend(stored_penalties)
 
         return {
-            "post_id": post_id,
+            "post_id": post["id"],
             "vulnerability_weight": rhythm_metadata.get("vulnerability_weight", 0),
             "rhythm_adherence": rhythm_metadata.get("rhythm_adherence", 0),
             "formality_match": rhythm_metadata.get("formality_match", 0),
@@ -474,50 +534,48 @@ class AnalysisService:
     async def get_analyzed_posts(
         self,
         campaign_id: str,
+        user_id: str,
         subreddit: Optional[str] = None,
-        sort_by: str = "total_score",
-        sort_dir: str = "desc",
+        sort_by: AnalyzedPostSortField = "total_score",
+        sort_dir: SortDirection = "desc",
         page: int = 1,
         per_page: int = 20,
     ) -> dict:
         """
         Fetch analyzed posts with filtering and sorting.
 
+        The page and the filtered total come back from one RPC call (one
+        round-trip, one statement).
+
         Args:
             campaign_id: Campaign UUID
+            user_id: User UUID (must own the campaign)
             subreddit: Optional subreddit filter
-            sort_by: Sort field (total_score, vulnerability_weight, rhythm_adherence, etc.)
+            sort_by: Sort field (one of AnalyzedPostSortField)
             sort_dir: Sort direction (asc, desc)
             page: Page number (1-indexed)
             per_page: Items per page
 
         Returns:
             Dict with posts, total, page, per_page
-        """
-        query = self.supabase.table("raw_posts").select(
-            "id, title, raw_text, subreddit, archetype, success_score, rhythm_metadata, collected_at",
-            count="exact"
-        ).eq("campaign_id", campaign_id)
-
-        if subreddit:
-            query = query.eq("subreddit", subreddit)
-
-        # Apply sorting - note: Supabase sorts by column names, not JSONB fields
-        # For now, sort by success_score which mirrors rhythm_metadata->total_score
-        if sort_by == "total_score":
-            query = query.order("success_score", desc=(sort_dir == "desc"))
-        else:
-            query = query.order("success_score", desc=True)
-
-        # Pagination
-        offset = (page - 1) * per_page
-        query = query.range(offset, offset + per_page - 1)
 
-        response = query.execute()
+        Raises:
+            AppError: If campaign not found or access denied
+        """
+        # sort_by is validated at the router; the SQL function maps it to
+        # its own hard-coded ORDER BY
+        result = await self._campaign_rpc(
+            "get_campaign_analyzed_posts", campaign_id, user_id,
+            p_subreddit=subreddit,
+            p_sort_key=sort_by,
+            p_sort_desc=sort_dir == "desc",
+            p_limit=per_page,
+            p_offset=(page - 1) * per_page,
+        )
 
         return {
-            "posts": response.data,
-            "total": response.count,
+            "posts": result["posts"],
+            "total": result["total"],
             "page": page,
             "per_page": per_page,
         }
@@ -525,6 +583,7 @@ class AnalysisService:
     async def get_forbidden_patterns(
         self,
         campaign_id: str,
+        user_id: str,
         subreddit: Optional[str] = None,
     ) -> dict:
         """
@@ -532,26 +591,24 @@ class AnalysisService:
 
         Args:
             campaign_id: Campaign UUID
+            user_id: User UUID (must own the campaign)
             subreddit: Optional subreddit filter
 
         Returns:
             BlacklistResponse dict with patterns, total, categories
-        """
-        query = self.supabase.table("community_profiles").select(
-            "subreddit, forbidden_patterns"
-        ).eq("campaign_id", campaign_id)
-
-        if subreddit:
-            query = query.eq("subreddit", subreddit)
 
-        response = query.execute()
-        profiles = response.data
+        Raises:
+            AppError: If campaign not found or access denied
+        """
+        result = await self._campaign_rpc(
+            "get_campaign_forbidden_patterns", campaign_id, user_id, p_subreddit=subreddit
+        )
 
         # Aggregate patterns
         patterns_by_category = {}
         all_patterns = []
 
-        for profile in profiles:
+        for profile in result["profiles"]:
             forbidden = profile.get("forbidden_patterns", {})
             detected = forbidden.get("detected_patterns", [])
 
@@ -569,46 +626,27 @@ class AnalysisService:
                     "count": pattern["match_count"],
                 })
 
-        # Fetch custom user patterns from syntax_blacklist table
-        # Custom patterns are identified by confidence=1.0 and no source_post_id
-        try:
-            # Get campaign's target subreddits to scope the query
-            campaign_resp = self.supabase.table("campaigns").select(
-                "target_subreddits"
-            ).eq("id", campaign_id).execute()
-            target_subs = []
-            if campaign_resp.data:
-                target_subs = campaign_resp.data[0].get("target_subreddits", [])
-
-            if target_subs:
-                custom_response = self.supabase.table("syntax_blacklist").select(
-                    "id, subreddit, forbidden_pattern, confidence"
-                ).in_("subreddit", target_subs).eq(
-                    "confidence", 1.0
-                ).is_("source_post_id", "null").execute()
-
-                for custom in custom_response.data:
-                    fp = custom["forbidden_pattern"]
-                    # Parse category from prefix format [CAT:xxx]
-                    cat = "Custom"
-                    actual_pattern = fp
-                    if fp.startswith("[CAT:") and "]" in fp:
-                        end = fp.index("]")
-                        cat = fp[5:end]
-                        actual_pattern = fp[end + 1:]
-
-                    all_patterns.append({
-                        "category": cat,
-                        "pattern": actual_pattern,
-                        "subreddit": custom.get("subreddit"),
-                        "is_system": False,
-                        "count": 0,
-                    })
-
-                    patterns_by_category[cat] = patterns_by_category.get(cat, 0) + 1
-        except Exception:
-            # Table query failed, skip gracefully
-            pass
+        # Custom user patterns from syntax_blacklist for the campaign's target
+        # subreddits, identified by confidence=1.0 and no source_post_id
+        for custom in result["custom_patterns"]:
+            fp = custom["forbidden_pattern"]
+            # Parse category from prefix format [CAT:xxx]
+            cat = "Custom"
+            actual_pattern = fp
+            if fp.startswith("[CAT:") and "]" in fp:
+                end = fp.index("]")
+                cat = fp[5:end]
+                actual_pattern = fp[end + 1:]
+
+            all_patterns.append({
+                "category": cat,
+                "pattern": actual_pattern,
+                "subreddit": custom.get("subreddit"),
+                "is_system": False,
+                "count": 0,
+            })
+
+            patterns_by_category[cat] = patterns_by_category.get(cat, 0) + 1
 
         return {
             "patterns": all_patterns,
@@ -645,7 +683,8 @@ class AnalysisService:
             AppError: If campaign not found or access denied
         """
         # Validate campaign ownership and get target subreddits
-        campaign_response = self.supabase.table("campaigns").select(
+        supabase = await get_async_supabase_client()
+        campaign_response = await supabase.table("campaigns").select(
             "id, target_subreddits"
         ).eq("id", campaign_id).eq("user_id", user_id).execute()
 
@@ -674,25 +713,26 @@ class AnalysisService:
         # Encode category into forbidden_pattern as prefix
         encoded_pattern = f"[CAT:{category}]{pattern}"
 
-        # Insert for each target subreddit
-        results = []
-        for sub in target_subs:
-            try:
-                pattern_data = {
-                    "subreddit": sub,
-                    "forbidden_pattern": encoded_pattern,
-                    "failure_type": "AdminRemoval",
-                    "confidence": 1.0,
-                    "is_global": len(target_subs) > 1,
-                }
-
-                response = self.supabase.table("syntax_blacklist").insert(
-                    pattern_data
-                ).execute()
-                if response.data:
-                    results.append(response.data[0])
-            except Exception:
-                pass  # Skip duplicates
+        # One insert for every target subreddit, skipping existing patterns
+        rows = [
+            {
+                "subreddit": sub,
+                "forbidden_pattern": encoded_pattern,
+                "failure_type": "AdminRemoval",
+                "confidence": 1.0,
+                "is_global": len(target_subs) > 1,
+            }
+            for sub in target_subs
+        ]
+        try:
+            response = await supabase.table("syntax_blacklist").upsert(
+                rows,
+                on_conflict="subreddit,forbidden_pattern",
+                ignore_duplicates=True
+            ).execute()
+            results = response.data or []
+        except Exception:
+            results = []  # Reported below
 
         if not results:
             raise AppError(
@@ -708,3 +748,16 @@ class AnalysisService:
             "subreddit": subreddit,
             "is_system": False,
         }
+
+
+_analysis_service: Optional[AnalysisService] = None
+
+
+def get_analysis_service() -> AnalysisService:
+    """Get the shared AnalysisService instance; used by routers via Depends()."""
+    global _analysis_service
+
+    if _analysis_service is None:
+        _analysis_service = AnalysisService()
+
+    return _analysis_service
@@ -0,0 +1,39 @@
+"""
+Short-lived Redis cache for campaign ownership + plan lookups.
+
+Triggers (collection, analysis) resolve the same (campaign, user) pair
+over and over within a session; ownership and plans change rarely. Only
+positive results are cached, so a campaign that isn't the user's is
+always re-checked. Redis errors fall back to Supabase.
+"""
+import logging
+from typing import Optional
+
+from app.config import settings
+from app.integrations.redis_client import get_general_client
+
+logger = logging.getLogger(__name__)
+
+
+def owner_plan_key(campaign_id: str, user_id: str) -> str:
+    """Redis key caching the plan of a user who owns a campaign."""
+    return f"campaign:{campaign_id}:owner_plan:{user_id}"
+
+
+async def get_cached_owner_plan(campaign_id: str, user_id: str) -> Optional[str]:
+    """Cached plan if the user was recently confirmed as the campaign's owner."""
+    try:
+        return await get_general_client().get(owner_plan_key(campaign_id, user_id))
+    except Exception as e:
+        logger.warning(f"Ownership cache read failed for campaign {campaign_id}: {e}")
+        return None
+
+
+async def cache_owner_plan(campaign_id: str, user_id: str, plan: str):
+    """Remember a confirmed owner's plan for OWNERSHIP_CACHE_TTL_SECONDS."""
+    try:
+        await get_general_client().setex(
+            owner_plan_key(campaign_id, user_id), settings.OWNERSHIP_CACHE_TTL_SECONDS, plan
+        )
+    except Exception as e:
+        logger.warning(f"Ownership cache write failed for campaign {campaign_id}: {e}")
@@ -2,7 +2,7 @@
 Authentication service for handling Supabase Auth operations.
 Manages signup, login, token refresh, and user profile retrieval.
 """
-from typing import Tuple, Dict, Any
+from typing import Any, Dict, Optional, Tuple
 from supabase import Client
 from app.integrations.supabase_client import get_supabase_client
 from app.utils.errors import AppError, ErrorCode
@@ -206,3 +206,16 @@ class AuthService:
                 details={"error": str(e)},
                 status_code=500
             )
+
+
+_auth_service: Optional[AuthService] = None
+
+
+def get_auth_service() -> AuthService:
+    """Get the shared AuthService built on the singleton Supabase client."""
+    global _auth_service
+
+    if _auth_service is None:
+        _auth_service = AuthService()
+
+    return _auth_service
@@ -222,3 +222,16 @@ class CampaignService:
                 message=f"Failed to delete campaign: {str(e)}",
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+_campaign_service: Optional[CampaignService] = None
+
+
+def get_campaign_service() -> CampaignService:
+    """Get the process-wide CampaignService (stateless, so safe to share)."""
+    global _campaign_service
+
+    if _campaign_service is None:
+        _campaign_service = CampaignService()
+
+    return _campaign_service
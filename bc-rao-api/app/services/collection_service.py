@@ -3,24 +3,32 @@ Collection service: Full pipeline orchestration for Reddit post collection.
 Orchestrates: scrape -> filter -> classify -> store with partial failure handling.
 """
 import asyncio
+import base64
+import binascii
 import json
-from typing import Optional, Callable
+from typing import Any, Dict, Optional, Callable
 from datetime import datetime
 from uuid import UUID
 
 from app.integrations.apify_client import scrape_subreddit
 from app.services.regex_filter import filter_posts, select_top_for_classification
 from app.inference.client import InferenceClient
-from app.integrations.supabase_client import get_supabase_client
+from app.integrations.supabase_client import get_async_supabase_client, get_supabase_client
 from app.models.raw_posts import (
-    RawPostResponse,
-    RawPostListResponse,
     CollectionProgress,
     CollectionResult
 )
 from app.utils.errors import AppError, ErrorCode
 
 
+# Columns of RawPostResponse, as listed by get_campaign_posts_after (migration 008)
+RAW_POST_COLUMNS = (
+    "id, campaign_id, user_id, subreddit, reddit_post_id, reddit_url, author, "
+    "author_karma, title, raw_text, comment_count, upvote_ratio, archetype, "
+    "success_score, reddit_created_at, is_ai_processed, collected_at"
+)
+
+
 class CollectionService:
     """
     Service for orchestrating the full Reddit collection pipeline.
@@ -402,11 +410,20 @@ Respond with JSON only:
         min_score: Optional[float] = None,
         max_score: Optional[float] = None,
         page: int = 1,
-        per_page: int = 20
-    ) -> RawPostListResponse:
+        per_page: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get paginated list of raw posts with optional filters.
 
+        Rows and total come from one request. The total is exact up to
+        PostgREST's max-rows and the planner's estimate beyond (counting
+        every matching post would scan them all). With a cursor (next_cursor
+        of a previous page), pages by keyset instead of offset and skips the
+        count. Posts are the rows as
+        returned by Supabase (RawPostResponse columns only), so the router
+        can stream them without building a model per post.
+
         Args:
             campaign_id: Campaign UUID
             user_id: User UUID (for RLS)
@@ -414,15 +431,27 @@ Respond with JSON only:
             subreddit: Filter by subreddit (optional)
             min_score: Minimum success_score (optional)
             max_score: Maximum success_score (optional)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored with a cursor
             per_page: Items per page
+            cursor: Opaque cursor from next_cursor (optional)
 
         Returns:
-            RawPostListResponse with posts, total, page, per_page
+            Dict with posts, total, page, per_page, next_cursor (the
+            RawPostListResponse shape)
+
+        Raises:
+            AppError: Malformed cursor (400), or campaign not owned (404)
         """
-        # Build query
-        query = self.supabase.table("raw_posts").select("*", count="exact")
-        query = query.eq("campaign_id", campaign_id)
+        if cursor is not None:
+            return await self._get_posts_after(
+                campaign_id, user_id, archetype, subreddit,
+                min_score, max_score, page, per_page, cursor
+            )
+
+        # Build query (async client: reads run on the request's event loop)
+        supabase = await get_async_supabase_client()
+        query = supabase.table("raw_posts").select(RAW_POST_COLUMNS, count="estimated")
+        query = query.eq("campaign_id", campaign_id).eq("user_id", user_id)
 
         # Apply optional filters
         if archetype:
@@ -434,46 +463,128 @@ Respond with JSON only:
         if max_score is not None:
             query = query.lte("success_score", max_score)
 
-        # Apply ordering
-        query = query.order("success_score", desc=True).order("collected_at", desc=True)
+        # Apply ordering (same as keyset pages, so next_cursor continues this page)
+        query = (
+            query.order("success_score", desc=True, nullsfirst=False)
+            .order("collected_at", desc=True)
+            .order("id", desc=True)
+        )
 
-        # Apply pagination
+        # Apply pagination, one extra row tells whether another page follows
+        # (the total may be an estimate)
         offset = (page - 1) * per_page
-        query = query.range(offset, offset + per_page - 1)
+        query = query.range(offset, offset + per_page)
 
         # Execute query
-        response = query.execute()
+        response = await query.execute()
+
+        if not response.data:
+            # Tell an empty page of an owned campaign from a campaign the
+            # user doesn't own (404, as in cursor mode)
+            campaign = await supabase.table("campaigns").select("id").eq(
+                "id", campaign_id
+            ).eq("user_id", user_id).execute()
+            if not campaign.data:
+                raise AppError(
+                    code=ErrorCode.RESOURCE_NOT_FOUND,
+                    message="Campaign not found or access denied",
+                    details={"campaign_id": campaign_id},
+                    status_code=404
+                )
 
-        # Parse response
-        posts = [RawPostResponse(**post) for post in response.data]
-        total = response.count or 0
+        posts = response.data[:per_page]
+        has_more = len(response.data) > per_page
 
-        return RawPostListResponse(
-            posts=posts,
-            total=total,
-            page=page,
-            per_page=per_page
-        )
+        return {
+            "posts": posts,
+            "total": response.count or 0,
+            "page": page,
+            "per_page": per_page,
+            "next_cursor": _encode_cursor(posts[-1]) if has_more else None,
+        }
+
+    async def _get_posts_after(
+        self,
+        campaign_id: str,
+        user_id: str,
+        archetype: Optional[str],
+        subreddit: Optional[str],
+        min_score: Optional[float],
+        max_score: Optional[float],
+        page: int,
+        per_page: int,
+        cursor: str
+    ) -> Dict[str, Any]:
+        """Keyset page of posts after a cursor (get_campaign_posts_after, migration 008)."""
+        after_score, after_collected_at, after_id = _decode_cursor(cursor)
+
+        supabase = await get_async_supabase_client()
+        response = await supabase.rpc("get_campaign_posts_after", {
+            "p_campaign_id": campaign_id,
+            "p_user_id": user_id,
+            "p_archetype": archetype,
+            "p_subreddit": subreddit,
+            "p_min_score": min_score,
+            "p_max_score": max_score,
+            "p_after_score": after_score,
+            "p_after_collected_at": after_collected_at,
+            "p_after_id": after_id,
+            # One extra row tells whether another page follows
+            "p_limit": per_page + 1,
+        }).execute()
+
+        if response.data is None:
+            raise AppError(
+                code=ErrorCode.RESOURCE_NOT_FOUND,
+                message="Campaign not found or access denied",
+                details={"campaign_id": campaign_id},
+                status_code=404
+            )
+
+        rows = response.data["posts"]
+        page_rows = rows[:per_page]
+
+        return {
+            "posts": page_rows,
+            "total": None,
+            "page": page,
+            "per_page": per_page,
+            "next_cursor": _encode_cursor(page_rows[-1]) if len(rows) > per_page else None,
+        }
 
     async def get_post_detail(
         self,
         post_id: str,
+        campaign_id: str,
         user_id: str
-    ) -> RawPostResponse:
+    ) -> Dict[str, Any]:
         """
         Get single post detail by ID.
 
+        The row is returned as stored (RawPostResponse columns only):
+        Supabase rows are trusted, so no model is validated per request.
+
         Args:
             post_id: Post UUID
-            user_id: User UUID (for RLS verification)
+            campaign_id: Campaign UUID the post must belong to
+            user_id: User UUID the post must belong to
 
         Returns:
-            RawPostResponse
+            Post row in the RawPostResponse shape
 
         Raises:
-            AppError: NOT_FOUND if post doesn't exist or not owned by user
+            AppError: NOT_FOUND if post doesn't exist, belongs to another
+                campaign or isn't owned by user
         """
-        response = self.supabase.table("raw_posts").select("*").eq("id", post_id).execute()
+        supabase = await get_async_supabase_client()
+        response = await (
+            supabase.table("raw_posts")
+            .select(RAW_POST_COLUMNS)
+            .eq("id", post_id)
+            .eq("campaign_id", campaign_id)
+            .eq("user_id", user_id)
+            .execute()
+        )
         post = response.data[0] if response.data else None
 
         if not post:
@@ -484,7 +595,7 @@ Respond with JSON only:
                 status_code=404
             )
 
-        return RawPostResponse(**post)
+        return post
 
     async def get_collection_stats(
         self,
@@ -494,9 +605,12 @@ Respond with JSON only:
         """
         Get collection statistics for a campaign.
 
+        Aggregated in Postgres (get_campaign_collection_stats, migration 009),
+        so only the counts cross the wire, not every post of the campaign.
+
         Args:
             campaign_id: Campaign UUID
-            user_id: User UUID (for RLS)
+            user_id: User UUID (ownership check)
 
         Returns:
             Dict with stats:
@@ -504,40 +618,45 @@ Respond with JSON only:
             - by_archetype: Count by archetype
             - by_subreddit: Count by subreddit
             - avg_success_score: Average success score
-        """
-        # Get all posts for this campaign
-        response = self.supabase.table("raw_posts").select("archetype, subreddit, success_score").eq("campaign_id", campaign_id).execute()
-
-        posts = response.data
-        total = len(posts)
-
-        if total == 0:
-            return {
-                "total": 0,
-                "by_archetype": {},
-                "by_subreddit": {},
-                "avg_success_score": 0.0
-            }
 
-        # Count by archetype
-        by_archetype = {}
-        for post in posts:
-            archetype = post.get("archetype", "Unclassified")
-            by_archetype[archetype] = by_archetype.get(archetype, 0) + 1
-
-        # Count by subreddit
-        by_subreddit = {}
-        for post in posts:
-            subreddit = post.get("subreddit", "Unknown")
-            by_subreddit[subreddit] = by_subreddit.get(subreddit, 0) + 1
+        Raises:
+            AppError: NOT_FOUND if campaign doesn't exist or not owned by user
+        """
+        supabase = await get_async_supabase_client()
+        response = await supabase.rpc(
+            "get_campaign_collection_stats",
+            {"p_campaign_id": campaign_id, "p_user_id": user_id}
+        ).execute()
 
-        # Calculate average success score
-        scores = [p.get("success_score") for p in posts if p.get("success_score") is not None]
-        avg_success_score = sum(scores) / len(scores) if scores else 0.0
+        if response.data is None:
+            raise AppError(
+                code=ErrorCode.RESOURCE_NOT_FOUND,
+                message="Campaign not found or access denied",
+                details={"campaign_id": campaign_id},
+                status_code=404
+            )
 
-        return {
-            "total": total,
-            "by_archetype": by_archetype,
-            "by_subreddit": by_subreddit,
-            "avg_success_score": round(avg_success_score, 2)
-        }
+        return response.data
+
+
+def _encode_cursor(post: dict) -> str:
+    """Opaque cursor for the sort key (success_score, collected_at, id) of a post row."""
+    key = [post.get("success_score"), post["collected_at"], post["id"]]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Inverse of _encode_cursor: (success_score, collected_at, id)."""
+    try:
+        score, collected_at, post_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if score is not None:
+            score = float(score)
+        # Rejected here rather than by the RPC's timestamptz cast
+        datetime.fromisoformat(collected_at)
+        return score, collected_at, str(UUID(post_id))
+    except (binascii.Error, ValueError, TypeError, AttributeError):
+        raise AppError(
+            code=ErrorCode.VALIDATION_ERROR,
+            message="Invalid pagination cursor",
+            details={"cursor": cursor}
+        )
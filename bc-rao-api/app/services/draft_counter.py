@@ -0,0 +1,112 @@
+"""
+Redis counter of the drafts a user generated this month.
+
+The monthly limit used to be checked with a count of generated_drafts on
+every generate and regenerate request. The count is now seeded once per
+user and month from Supabase, then incremented as drafts are saved, and
+expires at the end of the month. Deleting a draft drops the counter so
+the next check recounts (deleted drafts don't count toward the limit).
+Redis errors fall back to counting in Supabase.
+
+A draft saved or deleted while the counter is unseeded leaves a short-
+lived stale marker, so a count taken before that change isn't stored;
+otherwise a draft saved between the count and the seed would go
+uncounted for the rest of the month. A seed can still land just before
+an increment for a draft its count already included, overcounting by
+one until a draft is deleted or the month ends.
+"""
+import logging
+from datetime import datetime
+from typing import Optional
+
+from app.integrations.redis_client import get_general_client
+
+logger = logging.getLogger(__name__)
+
+# How long a count taken before a draft was saved or deleted is refused.
+# Counting and seeding take milliseconds, this only needs to outlast that
+STALE_COUNT_SECONDS = 60
+
+# An unseeded (or expired) counter stays unset: INCR would start it at 1
+# and undercount. The marker tells a count in flight that it's stale
+_INCR_IF_SEEDED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCR', KEYS[1])
+end
+redis.call('SET', KEYS[2], 1, 'EX', ARGV[1])
+return nil
+"""
+
+_SEED_UNLESS_STALE = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return nil
+end
+return redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2], 'NX')
+"""
+
+_INVALIDATE = """
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], 1, 'EX', ARGV[1])
+"""
+
+
+def draft_count_key(user_id: str, now: datetime) -> str:
+    """Redis key counting a user's drafts in the month of `now`."""
+    return f"drafts_count:{user_id}:{now:%Y%m}"
+
+
+def _stale_key(count_key: str) -> str:
+    return f"{count_key}:stale"
+
+
+def seconds_until_month_end(now: datetime) -> int:
+    """Seconds from `now` until the first instant of the next month."""
+    if now.month == 12:
+        next_month = now.replace(year=now.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    else:
+        next_month = now.replace(month=now.month + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    return max(int((next_month - now).total_seconds()), 1)
+
+
+async def get_cached_draft_count(user_id: str) -> Optional[int]:
+    """This month's draft count, or None if it has to be counted."""
+    try:
+        count = await get_general_client().get(draft_count_key(user_id, datetime.utcnow()))
+    except Exception as e:
+        logger.warning(f"Draft counter read failed for user {user_id}: {e}")
+        return None
+    return int(count) if count is not None else None
+
+
+async def cache_draft_count(user_id: str, count: int):
+    """Seed this month's counter from a Supabase count."""
+    now = datetime.utcnow()
+    key = draft_count_key(user_id, now)
+    try:
+        # Skipped if a draft was saved or deleted since the count may have
+        # been taken; NX keeps a concurrent seed's value
+        await get_general_client().eval(
+            _SEED_UNLESS_STALE, 2, key, _stale_key(key), count, seconds_until_month_end(now)
+        )
+    except Exception as e:
+        logger.warning(f"Draft counter write failed for user {user_id}: {e}")
+
+
+async def increment_draft_count(user_id: str):
+    """Count a saved draft, or mark a count in flight as stale."""
+    key = draft_count_key(user_id, datetime.utcnow())
+    try:
+        await get_general_client().eval(
+            _INCR_IF_SEEDED, 2, key, _stale_key(key), STALE_COUNT_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Draft counter increment failed for user {user_id}: {e}")
+
+
+async def invalidate_draft_count(user_id: str):
+    """Drop this month's counter so the next check recounts."""
+    key = draft_count_key(user_id, datetime.utcnow())
+    try:
+        await get_general_client().eval(_INVALIDATE, 2, key, _stale_key(key), STALE_COUNT_SECONDS)
+    except Exception as e:
+        logger.warning(f"Draft counter invalidation failed for user {user_id}: {e}")
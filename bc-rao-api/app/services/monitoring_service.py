@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 from uuid import UUID
 from typing import Optional
 
+from pydantic import TypeAdapter
+
 from app.integrations.supabase_client import get_supabase_client
 from app.models.monitoring import (
     RegisterPostResponse,
@@ -16,6 +18,9 @@ from app.models.monitoring import (
     parse_reddit_url
 )
 
+# Validates a whole page of shadow_table rows in one pydantic-core call
+_SHADOW_ENTRIES = TypeAdapter(list[ShadowEntry])
+
 
 class MonitoringService:
     """
@@ -108,41 +113,129 @@ class MonitoringService:
 
         # 6. Insert into shadow_table
         now = datetime.utcnow()
-        next_check_at = now + timedelta(hours=check_interval_hours)
-        audit_due_at = now + timedelta(days=7)
-
-        insert_data = {
-            "draft_id": str(draft_id) if draft_id else None,
-            "campaign_id": str(campaign_id),
-            "user_id": str(user_id),
-            "post_url": post_url,
-            "subreddit": subreddit,
-            "status_vida": "Ativo",
-            "conversational_depth": 0,
-            "isc_at_post": isc_at_post,
-            "account_status": account_status,
-            "check_interval_hours": check_interval_hours,
-            "total_checks": 0,
-            "last_check_at": now.isoformat(),
-            "submitted_at": now.isoformat(),
-            "audit_due_at": audit_due_at.isoformat()
-        }
+        insert_data = _shadow_row(
+            user_id, campaign_id, post_url, subreddit, draft_id,
+            isc_at_post, account_status, check_interval_hours, now
+        )
 
         result = self.supabase.table("shadow_table").insert(insert_data).execute()
         created_row = result.data[0]
 
         # 7. Return RegisterPostResponse
-        return RegisterPostResponse(
-            id=created_row["id"],
-            post_url=post_url,
-            subreddit=subreddit,
-            reddit_post_id=reddit_post_id,
-            status=created_row["status_vida"],
-            isc_at_post=isc_at_post,
-            check_interval_hours=check_interval_hours,
-            next_check_at=next_check_at,
-            created_at=created_row["created_at"]
-        )
+        return _registration_response(created_row, reddit_post_id, now)
+
+    def register_posts_bulk(
+        self,
+        user_id: str,
+        posts: list[tuple[str, str]]
+    ) -> list[RegisterPostResponse]:
+        """
+        Register several posts for monitoring at once.
+
+        Same rules as register_post, but each lookup (already registered
+        URLs, recent drafts, ISC scores, account status) is one query for
+        the whole batch, and the rows go in with a single insert. The batch
+        is all-or-nothing: any invalid or already registered URL rejects it.
+
+        Args:
+            user_id: User UUID
+            posts: (campaign_id, post_url) pairs
+
+        Returns:
+            RegisterPostResponse per post, in request order
+
+        Raises:
+            ValueError: If a URL is invalid, repeated, or already registered
+        """
+        # 1. Validate URLs and extract subreddit + post_id
+        parsed = []
+        seen = set()
+        for campaign_id, post_url in posts:
+            match = parse_reddit_url(post_url)
+            if not match:
+                raise ValueError(f"Invalid Reddit URL format: {post_url}")
+            if post_url in seen:
+                raise ValueError(f"Post listed twice: {post_url}")
+            seen.add(post_url)
+            parsed.append((str(campaign_id), post_url, match["subreddit"], match["post_id"]))
+
+        campaign_ids = list({p[0] for p in parsed})
+        subreddits = list({p[2] for p in parsed})
+
+        # 2. Check if any post is already registered for this user
+        existing = self.supabase.table("shadow_table").select("post_url").eq(
+            "user_id", user_id
+        ).in_("post_url", list(seen)).execute()
+        if existing.data:
+            raise ValueError(f"Post already registered: {existing.data[0]['post_url']}")
+
+        # 3. Infer draft mappings: most recent approved/posted draft per
+        # campaign + subreddit within 24 hours
+        cutoff = datetime.utcnow() - timedelta(hours=24)
+        draft_response = self.supabase.table("generated_drafts").select(
+            "id, campaign_id, subreddit"
+        ).eq(
+            "user_id", user_id
+        ).in_(
+            "campaign_id", campaign_ids
+        ).in_(
+            "subreddit", subreddits
+        ).in_(
+            "status", ["approved", "posted"]
+        ).gte(
+            "created_at", cutoff.isoformat()
+        ).order("created_at", desc=True).execute()
+
+        drafts = {}
+        for draft in draft_response.data:
+            drafts.setdefault((draft["campaign_id"], draft["subreddit"]), draft["id"])
+
+        # 4. Current ISC per campaign + subreddit
+        profile_response = self.supabase.table("community_profiles").select(
+            "campaign_id, subreddit, isc_score"
+        ).in_(
+            "campaign_id", campaign_ids
+        ).in_(
+            "subreddit", subreddits
+        ).execute()
+
+        isc_scores = {
+            (profile["campaign_id"], profile["subreddit"]): profile["isc_score"]
+            for profile in profile_response.data
+        }
+
+        # 5. Check interval from the user's account status (see register_post)
+        account_status = "Established"
+        check_interval_hours = 4
+
+        recent_posts = self.supabase.table("shadow_table").select("account_status").eq(
+            "user_id", user_id
+        ).order("created_at", desc=True).limit(1).execute()
+
+        if recent_posts.data:
+            account_status = recent_posts.data[0].get("account_status", "Established")
+            check_interval_hours = 1 if account_status == "New" else 4
+
+        # 6. Insert all rows in one call
+        now = datetime.utcnow()
+        rows = [
+            _shadow_row(
+                user_id, campaign_id, post_url, subreddit,
+                drafts.get((campaign_id, subreddit)),
+                isc_scores.get((campaign_id, subreddit), 5.0),
+                account_status, check_interval_hours, now
+            )
+            for campaign_id, post_url, subreddit, _ in parsed
+        ]
+
+        result = self.supabase.table("shadow_table").insert(rows).execute()
+        created = {row["post_url"]: row for row in result.data}
+
+        # 7. Responses in request order
+        return [
+            _registration_response(created[post_url], reddit_post_id, now)
+            for _, post_url, _, reddit_post_id in parsed
+        ]
 
     def get_monitored_posts(
         self,
@@ -173,7 +266,7 @@ class MonitoringService:
         query = query.order("submitted_at", desc=True)
 
         response = query.execute()
-        return [ShadowEntry(**row) for row in response.data]
+        return _SHADOW_ENTRIES.validate_python(response.data)
 
     def get_shadow_entry(self, shadow_id: str, user_id: str) -> ShadowEntry:
         """
@@ -346,3 +439,63 @@ class MonitoringService:
         }).eq("id", shadow_id).execute()
 
         return outcome
+
+
+def _shadow_row(
+    user_id: str,
+    campaign_id: str,
+    post_url: str,
+    subreddit: str,
+    draft_id: Optional[str],
+    isc_at_post: float,
+    account_status: str,
+    check_interval_hours: int,
+    now: datetime
+) -> dict:
+    """shadow_table row of a newly registered post."""
+    audit_due_at = now + timedelta(days=7)
+
+    return {
+        "draft_id": str(draft_id) if draft_id else None,
+        "campaign_id": str(campaign_id),
+        "user_id": str(user_id),
+        "post_url": post_url,
+        "subreddit": subreddit,
+        "status_vida": "Ativo",
+        "conversational_depth": 0,
+        "isc_at_post": isc_at_post,
+        "account_status": account_status,
+        "check_interval_hours": check_interval_hours,
+        "total_checks": 0,
+        "last_check_at": now.isoformat(),
+        "submitted_at": now.isoformat(),
+        "audit_due_at": audit_due_at.isoformat()
+    }
+
+
+def _registration_response(created_row: dict, reddit_post_id: str, now: datetime) -> RegisterPostResponse:
+    """RegisterPostResponse for an inserted shadow_table row."""
+    return RegisterPostResponse(
+        id=created_row["id"],
+        post_url=created_row["post_url"],
+        subreddit=created_row["subreddit"],
+        reddit_post_id=reddit_post_id,
+        status=created_row["status_vida"],
+        isc_at_post=created_row["isc_at_post"],
+        check_interval_hours=created_row["check_interval_hours"],
+        next_check_at=now + timedelta(hours=created_row["check_interval_hours"]),
+        created_at=created_row["created_at"]
+    )
+
+
+_monitoring_service: Optional[MonitoringService] = None
+
+
+def get_monitoring_service() -> MonitoringService:
+    """Get the process-wide MonitoringService (stateless, so safe to share)."""
+    global _monitoring_service
+
+    if _monitoring_service is None:
+        _monitoring_service = MonitoringService()
+
+    return _monitoring_service
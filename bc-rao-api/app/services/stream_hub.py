@@ -0,0 +1,251 @@
+"""
+Fan-out of task state updates from Redis Pub/Sub to SSE subscribers.
+
+Every SSE client watching the same task shares one Pub/Sub subscription:
+a single reader per task decodes each published state, encodes its SSE
+frame once, and hands both to every subscriber's bounded queue. Redis
+connections therefore scale with the number of active tasks, not with the
+number of open browser tabs, and JSON encoding with the number of updates.
+"""
+import asyncio
+import logging
+from contextlib import suppress
+from typing import AsyncIterator, Dict, List, Optional
+
+import orjson
+from redis.asyncio.client import PubSub
+
+from app.integrations.redis_client import get_blocking_client
+from app.utils.sse import SSE_DONE_FRAME, SSE_KEEPALIVE_FRAME, state_frame
+from app.workers.task_runner import get_task_state_async, task_key
+
+logger = logging.getLogger(__name__)
+
+# Seconds without a published update before a task stream sends a keepalive
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# Minimum seconds between two progress frames; faster updates are coalesced
+SSE_PROGRESS_COALESCE_SECONDS = 0.1
+
+# Task states in lifecycle order; a stream never moves back to an earlier one
+_STATE_PHASES = {"PENDING": 0, "STARTED": 1, "PROGRESS": 2, "SUCCESS": 3, "FAILURE": 3}
+
+
+class StreamHub:
+    """
+    Shares one Redis Pub/Sub subscription per task among SSE subscribers.
+
+    Subscriber queues are bounded; a slow consumer loses its oldest
+    updates rather than holding memory (the stream re-reads the stored
+    state on keepalive, so the latest state still reaches it).
+    """
+
+    def __init__(self, max_queue_size: int = 256):
+        self.max_queue_size = max_queue_size
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._pubsubs: Dict[str, PubSub] = {}
+        self._readers: Dict[str, asyncio.Task] = {}
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, task_id: str) -> asyncio.Queue:
+        """
+        Register a subscriber for a task's state updates.
+
+        The Redis subscription is active when this returns, so callers can
+        read the stored state afterwards without missing an update.
+
+        Returns:
+            Queue receiving each published {"state", "meta", "frame"} dict
+            (frame: the encoded SSE frame, shared by all subscribers), then
+            None if the hub is closed while subscribed
+        """
+        queue = asyncio.Queue(maxsize=self.max_queue_size)
+
+        async with self._lock:
+            subscribers = self._subscribers.get(task_id)
+            if subscribers is None:
+                pubsub = get_blocking_client().pubsub()
+                await pubsub.subscribe(task_key(task_id))
+                subscribers = self._subscribers[task_id] = []
+                self._pubsubs[task_id] = pubsub
+                self._readers[task_id] = asyncio.create_task(self._read(task_id, pubsub))
+            subscribers.append(queue)
+
+        return queue
+
+    async def unsubscribe(self, task_id: str, queue: asyncio.Queue) -> None:
+        """Remove a subscriber; the last one out closes the task's subscription."""
+        async with self._lock:
+            subscribers = self._subscribers.get(task_id)
+            if subscribers is None or queue not in subscribers:
+                return
+
+            subscribers.remove(queue)
+            if subscribers:
+                return
+
+            del self._subscribers[task_id]
+            pubsub = self._pubsubs.pop(task_id)
+            reader = self._readers.pop(task_id)
+
+        reader.cancel()
+        with suppress(asyncio.CancelledError):
+            await reader
+        await _close(pubsub)
+
+    async def close(self) -> None:
+        """
+        Stop every reader and release its subscription (process shutdown).
+
+        Subscribers receive None so their streams end; browsers then
+        reconnect to a live worker.
+        """
+        async with self._lock:
+            subscribers = self._subscribers
+            pubsubs = self._pubsubs
+            readers = self._readers
+            self._subscribers, self._pubsubs, self._readers = {}, {}, {}
+
+        for reader in readers.values():
+            reader.cancel()
+        for reader in readers.values():
+            with suppress(asyncio.CancelledError):
+                await reader
+        for pubsub in pubsubs.values():
+            await _close(pubsub)
+
+        for queues in subscribers.values():
+            for queue in queues:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def _read(self, task_id: str, pubsub: PubSub) -> None:
+        """Forward every message on the task channel to its subscribers."""
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                update = orjson.loads(message["data"])
+                update["frame"] = state_frame(update["state"], update["meta"])
+                for queue in self._subscribers.get(task_id, ()):
+                    if queue.full():
+                        queue.get_nowait()  # Drop oldest
+                    queue.put_nowait(update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Current subscribers fall back to stored-state reads on keepalive;
+            # forget the dead reader so the next subscriber starts a new one.
+            logger.error(f"Pub/Sub reader for task {task_id} stopped: {e}")
+            if self._readers.get(task_id) is asyncio.current_task():
+                del self._readers[task_id]
+                del self._pubsubs[task_id]
+                del self._subscribers[task_id]
+                await _close(pubsub)
+
+
+async def _close(pubsub: PubSub) -> None:
+    """Unsubscribe and release the connection, ignoring a broken connection."""
+    with suppress(Exception):
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+
+
+# Process-wide hub shared by all SSE endpoints
+stream_hub = StreamHub()
+
+
+async def task_event_stream(task_id: str) -> AsyncIterator[bytes]:
+    """
+    SSE frames for a task's progress, pushed from the shared StreamHub.
+
+    Reads the stored state once to catch up, then yields a frame for each
+    published state change until SUCCESS or FAILURE. Progress updates
+    arriving within SSE_PROGRESS_COALESCE_SECONDS of the previous progress
+    frame are coalesced into one frame carrying the latest meta. States
+    only move forward (PENDING, STARTED, PROGRESS, then SUCCESS or
+    FAILURE): a stale one, e.g. a queued update older than the catch-up
+    read, is skipped instead of rewinding the client. After
+    SSE_KEEPALIVE_SECONDS without an update it sends a keepalive comment
+    and re-reads the stored state, in case an update was dropped. Ends
+    without a done event if the hub closes, so the browser reconnects.
+
+    SSE format:
+    - event: progress | started | pending | success | error | done
+    - data: JSON payload with state details
+    """
+    # Subscribe before reading the current state so no update in between is lost
+    updates = await stream_hub.subscribe(task_id)
+    loop = asyncio.get_running_loop()
+
+    try:
+        last_state = None
+        last_meta = None
+        last_phase = 0
+        next_progress_at = 0.0
+        task = await get_task_state_async(task_id)
+
+        while True:
+            # No stored state yet, or a stale one: wait for the next update
+            if task is not None and _STATE_PHASES.get(task["state"], 0) >= last_phase:
+                state = task["state"]
+                meta = task["meta"]
+                last_phase = _STATE_PHASES.get(state, 0)
+
+                state_changed = (state != last_state or meta != last_meta)
+                last_state = state
+                last_meta = meta
+
+                # Published updates carry the frame the hub encoded once for
+                # every subscriber; stored states (catch-up, keepalive) are
+                # encoded here, and only on a change
+                if state in ("SUCCESS", "FAILURE"):
+                    yield _frame(task)
+                    yield SSE_DONE_FRAME
+                    break
+                elif state_changed:
+                    frame = _frame(task)
+                    if frame is not None:
+                        yield frame
+                    if state == "PROGRESS":
+                        next_progress_at = loop.time() + SSE_PROGRESS_COALESCE_SECONDS
+
+            try:
+                task = await asyncio.wait_for(updates.get(), SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield SSE_KEEPALIVE_FRAME
+                task = await get_task_state_async(task_id)
+            else:
+                if task is None:
+                    break  # Hub closed (shutdown)
+                task = await _latest_progress(updates, task, next_progress_at)
+    finally:
+        await stream_hub.unsubscribe(task_id, updates)
+
+
+def _frame(task: dict) -> Optional[bytes]:
+    """SSE frame of a task state, reusing the one built by the hub if any."""
+    if "frame" in task:
+        return task["frame"]
+    return state_frame(task["state"], task["meta"])
+
+
+async def _latest_progress(updates: asyncio.Queue, task: dict, deadline: float) -> Optional[dict]:
+    """
+    Collect PROGRESS updates until the loop time reaches deadline.
+
+    Returns the latest one, or the first update of another state (which
+    supersedes pending progress) or the hub's closing None as soon as it
+    arrives.
+    """
+    loop = asyncio.get_running_loop()
+    while task is not None and task["state"] == "PROGRESS":
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            task = await asyncio.wait_for(updates.get(), remaining)
+        except asyncio.TimeoutError:
+            break
+    return task
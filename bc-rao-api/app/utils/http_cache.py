@@ -0,0 +1,57 @@
+"""
+Conditional GET support (ETag / If-None-Match) for campaign analysis reads.
+
+Analysis data only changes when a collection or analysis run finishes, so
+each campaign carries a data version token in Redis that those runs
+replace. ETags are an HMAC over (campaign, user, version): a matching
+If-None-Match proves this user was already served the current version,
+so the 304 can be answered without touching Supabase.
+"""
+import hashlib
+import hmac
+import uuid
+from typing import Optional
+
+from app.config import settings
+from app.integrations.redis_client import get_general_client
+from app.workers.task_runner import data_version_key
+
+# Responses may be cached by the browser only, and must be revalidated
+# (cheaply, via 304) before reuse so finished runs show up immediately.
+CACHE_CONTROL = "private, no-cache"
+
+
+async def get_data_version(campaign_id: str) -> str:
+    """Current data version token for a campaign, creating one if missing."""
+    redis = get_general_client()
+    key = data_version_key(campaign_id)
+
+    version = await redis.get(key)
+    if version is None:
+        # First read (or Redis was flushed): any token works, issued ETags just stop matching
+        await redis.set(key, uuid.uuid4().hex, nx=True)
+        version = await redis.get(key)
+
+    return version
+
+
+def make_etag(campaign_id: str, user_id: str, version: str, resource: str = "") -> str:
+    """
+    Weak ETag bound to the campaign, the requesting user and the data version.
+
+    resource narrows it to one item of the campaign (e.g. a post id), so a
+    validator issued for one item never revalidates another.
+    """
+    message = f"{campaign_id}:{user_id}:{version}"
+    if resource:
+        message += f":{resource}"
+    message = message.encode()
+    digest = hmac.new(settings.SUPABASE_JWT_SECRET.encode(), message, hashlib.sha256).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value lists the given ETag."""
+    if not if_none_match:
+        return False
+    return etag in (candidate.strip() for candidate in if_none_match.split(","))
@@ -0,0 +1,38 @@
+"""
+Response classes shared by API routers.
+"""
+from typing import Any, AsyncIterator, List
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    For routers returning plain dicts (no response_model): orjson encodes
+    nested payloads several times faster than stdlib json. Routes with a
+    response_model should keep FastAPI's default class, which lets Pydantic
+    serialize straight to bytes. (FastAPI's own ORJSONResponse is deprecated
+    for that reason.)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+async def stream_json_list(key: str, items: List[Any], **fields: Any) -> AsyncIterator[bytes]:
+    """
+    Stream {key: [items...], **fields} as JSON, one encoded item per chunk.
+
+    Items are encoded one at a time, so the whole body never exists as one
+    buffer (nor as a jsonable_encoder copy of the data).
+    """
+    yield b"{" + orjson.dumps(key) + b":["
+    for index, item in enumerate(items):
+        if index:
+            yield b"," + orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            yield orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+    yield b"]," + orjson.dumps(fields)[1:] if fields else b"]}"
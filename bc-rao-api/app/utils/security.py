@@ -2,13 +2,90 @@
 Security utilities for JWT verification and authentication.
 Uses Supabase Auth API for reliable token verification.
 """
-from typing import Dict, Any
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import httpx
 from app.config import settings
 from app.utils.errors import AppError, ErrorCode
 
 
+# Verified tokens: blake2b(token) -> (payload, expires_at), in LRU order.
+# Keyed by digest so raw tokens aren't kept in memory.
+_verified_tokens: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _token_exp(token: str) -> Optional[float]:
+    """Read the exp claim without verifying (the token was already verified)."""
+    try:
+        claims = token.split(".")[1]
+        claims += "=" * (-len(claims) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(claims))["exp"])
+    except Exception:
+        return None
+
+
+def forget_jwt(token: str):
+    """Drop a token from the verification cache (e.g. once it's been replaced)."""
+    with _verified_tokens_lock:
+        _verified_tokens.pop(_token_key(token), None)
+
+
 def verify_jwt(token: str) -> Dict[str, Any]:
+    """
+    Verify a Supabase JWT token, using the per-process verification cache.
+
+    A dashboard page load sends the same token to several endpoints; only
+    the first one asks Supabase. Cached entries last JWT_CACHE_TTL_SECONDS
+    and never outlive the token's own exp claim.
+
+    Args:
+        token: JWT token string from Authorization header
+
+    Returns:
+        Dict with at least {"sub": user_id} matching JWT payload format
+
+    Raises:
+        AppError: If token is invalid or expired
+    """
+    key = _token_key(token)
+    now = time.time()
+
+    with _verified_tokens_lock:
+        cached = _verified_tokens.get(key)
+        if cached is not None:
+            payload, expires_at = cached
+            if expires_at > now:
+                _verified_tokens.move_to_end(key)
+                return payload
+            del _verified_tokens[key]
+
+    payload = _verify_with_supabase(token)
+
+    expires_at = now + settings.JWT_CACHE_TTL_SECONDS
+    exp = _token_exp(token)
+    if exp is not None:
+        expires_at = min(expires_at, exp)
+
+    with _verified_tokens_lock:
+        _verified_tokens[key] = (payload, expires_at)
+        _verified_tokens.move_to_end(key)
+        while len(_verified_tokens) > settings.JWT_CACHE_MAX_SIZE:
+            _verified_tokens.popitem(last=False)
+
+    return payload
+
+
+def _verify_with_supabase(token: str) -> Dict[str, Any]:
     """
     Verify a Supabase JWT token by calling Supabase Auth API.
 
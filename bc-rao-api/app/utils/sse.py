@@ -0,0 +1,89 @@
+"""
+Server-Sent Events framing shared by the progress streams.
+
+Frames are bytes so StreamingResponse sends them without another encode.
+Static frames and event prefixes are built once here; a data frame is
+prefix + orjson.dumps(payload) + SSE_FRAME_END.
+"""
+import zlib
+from typing import AsyncIterator, Optional
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+# zlib level for gzipped streams: frames are small and flushed one by one,
+# so the shared window (repeated keys across frames) does most of the work
+SSE_GZIP_LEVEL = 1
+
+SSE_PROGRESS_PREFIX = b"event: progress\ndata: "
+SSE_SUCCESS_PREFIX = b"event: success\ndata: "
+SSE_ERROR_PREFIX = b"event: error\ndata: "
+SSE_FRAME_END = b"\n\n"
+
+SSE_STARTED_FRAME = b'event: started\ndata: {"state":"started"}\n\n'
+SSE_PENDING_FRAME = b'event: pending\ndata: {"state":"pending"}\n\n'
+SSE_DONE_FRAME = b"event: done\ndata: {}\n\n"
+SSE_KEEPALIVE_FRAME = b": keepalive\n\n"
+
+
+def state_frame(state: str, meta: dict) -> Optional[bytes]:
+    """SSE frame for a stored or published task state (None for an unknown state)."""
+    if state == "PROGRESS":
+        return SSE_PROGRESS_PREFIX + orjson.dumps(meta) + SSE_FRAME_END
+    if state == "SUCCESS":
+        return SSE_SUCCESS_PREFIX + orjson.dumps(meta) + SSE_FRAME_END
+    if state == "FAILURE":
+        return SSE_ERROR_PREFIX + orjson.dumps(meta) + SSE_FRAME_END
+    if state == "STARTED":
+        return SSE_STARTED_FRAME
+    if state == "PENDING":
+        return SSE_PENDING_FRAME
+    return None
+
+
+# Response headers of every progress stream. No Connection header: it is
+# hop-by-hop and forbidden in HTTP/2, which the TLS edge speaks to browsers
+# (several streams then share one connection instead of counting against
+# HTTP/1.1's six per origin); uvicorn keeps HTTP/1.1 connections open anyway.
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable NGINX buffering for real-time streaming
+    "Vary": "Accept-Encoding",
+}
+
+
+def sse_response(frames: AsyncIterator[bytes], accept_encoding: Optional[str] = None) -> StreamingResponse:
+    """
+    StreamingResponse for SSE frames, gzipped when the client accepts it.
+
+    GZipMiddleware skips text/event-stream, so streams are compressed here:
+    one gzip stream per connection, sync-flushed after every frame so each
+    event reaches the browser as soon as it is yielded.
+    """
+    if _accepts_gzip(accept_encoding):
+        return StreamingResponse(
+            _gzip_frames(frames),
+            media_type="text/event-stream",
+            headers={**SSE_HEADERS, "Content-Encoding": "gzip"},
+        )
+    return StreamingResponse(frames, media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q=0 refuses it)."""
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+async def _gzip_frames(frames: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(SSE_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    try:
+        async for frame in frames:
+            yield compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        # Run the frame generator's cleanup (e.g. unsubscribe) on disconnect too
+        await frames.aclose()
@@ -34,7 +34,7 @@ async def run_analysis_background(
         """
         Callback to emit analysis progress updates for SSE streaming.
 
-        Stores progress in Redis for the SSE endpoint to poll.
+        Stores progress in Redis, published to the SSE endpoint.
         """
         update_task_state(task_id, "PROGRESS", {
             "state": progress.state,
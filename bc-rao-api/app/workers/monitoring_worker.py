@@ -13,7 +13,7 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from app.services.monitoring_service import MonitoringService
+from app.services.monitoring_service import get_monitoring_service
 from app.integrations.reddit_client import RedditDualCheckClient
 from app.integrations.supabase_client import get_supabase_client
 from app.services import email_service
@@ -46,7 +46,7 @@ async def run_monitoring_check(task_id: str, shadow_id: str):
     try:
         update_task_state(task_id, "STARTED", {"state": "started"})
 
-        service = MonitoringService()
+        service = get_monitoring_service()
         reddit_client = RedditDualCheckClient()
         supabase = get_supabase_client()
 
@@ -304,7 +304,7 @@ async def run_post_audit(task_id: str, shadow_id: str):
     try:
         update_task_state(task_id, "STARTED", {"state": "started"})
 
-        service = MonitoringService()
+        service = get_monitoring_service()
         reddit_client = RedditDualCheckClient()
         supabase = get_supabase_client()
 
@@ -3,56 +3,126 @@ Lightweight in-process task runner using Redis for state tracking.
 Replaces Celery for Railway deployment where memory is limited.
 
 Tasks run as asyncio background tasks within the FastAPI process.
-Progress is stored in Redis and polled by the SSE endpoint.
+Progress is stored in Redis and also published on the task's channel, so
+SSE endpoints can push updates instead of polling.
 """
 import asyncio
-import json
+import logging
 import uuid
-from typing import Optional
+from typing import Optional, Set
 
+import orjson
 import redis
 
 from app.config import settings
+from app.integrations.redis_client import get_general_client
+
+logger = logging.getLogger(__name__)
 
 _redis_client = None
 
+# Seconds between periodic monitoring rounds
+MONITORING_INTERVAL_SECONDS = 900
+# Redis key held by the process dispatching the current monitoring round
+MONITORING_LOCK_KEY = "monitoring:dispatch_lock"
+
 
 def get_redis():
     """Get or create Redis client singleton."""
     global _redis_client
     if _redis_client is None:
-        _redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        _redis_client = redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
     return _redis_client
 
 
+def task_key(task_id: str) -> str:
+    """Redis key holding a task's latest state; also its Pub/Sub channel."""
+    return f"task:{task_id}"
+
+
+# Strong references to running background tasks: the event loop only keeps
+# weak ones, so an unreferenced task can be garbage-collected mid-flight.
+_background_tasks: Set[asyncio.Task] = set()
+
+# Caps concurrent analysis runs (CPU-bound NLP); extra runs wait as PENDING
+_analysis_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_ANALYSES)
+
+# Caps concurrent collection runs (scraping threads, LLM classification)
+_collection_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_COLLECTIONS)
+
+# Caps concurrent monitoring checks (Reddit dual-check requests)
+_monitoring_check_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_MONITORING_CHECKS)
+
+
+def spawn_background(coro) -> asyncio.Task:
+    """Start a coroutine as a background task, keeping it referenced until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def data_version_key(campaign_id: str) -> str:
+    """Redis key holding an opaque token that changes whenever a campaign's analysis data does."""
+    return f"campaign:{campaign_id}:data_version"
+
+
+async def bump_data_version(campaign_id: str):
+    """Mark a campaign's posts/profiles as changed, invalidating issued ETags."""
+    try:
+        await get_general_client().set(data_version_key(campaign_id), uuid.uuid4().hex)
+    except Exception as e:
+        # Runs in finally blocks: never mask the task's own outcome
+        logger.warning(f"Data version bump failed for campaign {campaign_id}: {e}")
+
+
 def generate_task_id() -> str:
     """Generate a unique task ID."""
     return str(uuid.uuid4())
 
 
 def update_task_state(task_id: str, state: str, meta: dict):
-    """Write task state to Redis with 1-hour TTL."""
-    r = get_redis()
-    r.setex(
-        f"task:{task_id}",
-        3600,
-        json.dumps({"state": state, "meta": meta})
-    )
+    """
+    Write task state to Redis with 1-hour TTL and publish it to subscribers.
+
+    Both commands go in one pipelined round-trip.
+    """
+    key = task_key(task_id)
+    payload = orjson.dumps({"state": state, "meta": meta}, option=orjson.OPT_NON_STR_KEYS)
+
+    pipe = get_redis().pipeline(transaction=False)
+    pipe.setex(key, 3600, payload)
+    pipe.publish(key, payload)
+    pipe.execute()
 
 
 def get_task_state(task_id: str) -> dict:
     """Read task state from Redis."""
     r = get_redis()
-    data = r.get(f"task:{task_id}")
+    data = r.get(task_key(task_id))
     if data:
-        return json.loads(data)
+        return orjson.loads(data)
+    return {"state": "PENDING", "meta": {}}
+
+
+async def get_task_state_async(task_id: str) -> dict:
+    """Read task state from Redis without blocking the event loop."""
+    data = await get_general_client().get(task_key(task_id))
+    if data:
+        return orjson.loads(data)
     return {"state": "PENDING", "meta": {}}
 
 
 async def run_collection_background(task_id: str, campaign_id: str, user_id: str, plan: str):
     """
     Run collection pipeline as an asyncio background task.
-    Stores progress in Redis for SSE streaming.
+    Stores progress in Redis for SSE streaming. At most
+    MAX_CONCURRENT_COLLECTIONS runs execute at once; the rest wait their
+    turn and show as PENDING meanwhile.
 
     After successful collection, auto-triggers analysis pipeline (LOCKED user decision).
     """
@@ -71,42 +141,46 @@ async def run_collection_background(task_id: str, campaign_id: str, user_id: str
             "errors": progress.errors
         })
 
-    try:
-        update_task_state(task_id, "STARTED", {"state": "started"})
-
-        service = CollectionService()
-        result = await service.run_collection(
-            campaign_id=campaign_id,
-            user_id=user_id,
-            plan=plan,
-            progress_callback=progress_callback
-        )
-
-        # Auto-trigger analysis after successful collection (LOCKED user decision)
-        analysis_task_id = generate_task_id()
-
-        update_task_state(task_id, "SUCCESS", {
-            "status": result.status,
-            "scraped": result.scraped,
-            "filtered": result.filtered,
-            "classified": result.classified,
-            "errors": result.errors,
-            "analysis_task_id": analysis_task_id  # Frontend can track analysis progress
-        })
+    async with _collection_slots:
+        try:
+            update_task_state(task_id, "STARTED", {"state": "started"})
+
+            service = CollectionService()
+            result = await service.run_collection(
+                campaign_id=campaign_id,
+                user_id=user_id,
+                plan=plan,
+                progress_callback=progress_callback
+            )
 
-        # Launch analysis as background task (pass user_id/plan for style guide)
-        asyncio.create_task(
-            run_analysis_background_task(
-                analysis_task_id, campaign_id,
-                user_id=user_id, plan=plan,
+            # Auto-trigger analysis after successful collection (LOCKED user decision)
+            analysis_task_id = generate_task_id()
+
+            update_task_state(task_id, "SUCCESS", {
+                "status": result.status,
+                "scraped": result.scraped,
+                "filtered": result.filtered,
+                "classified": result.classified,
+                "errors": result.errors,
+                "analysis_task_id": analysis_task_id  # Frontend can track analysis progress
+            })
+
+            # Launch analysis as background task (pass user_id/plan for style guide)
+            spawn_background(
+                run_analysis_background_task(
+                    analysis_task_id, campaign_id,
+                    user_id=user_id, plan=plan,
+                )
             )
-        )
 
-    except Exception as e:
-        update_task_state(task_id, "FAILURE", {
-            "error": str(e),
-            "type": type(e).__name__
-        })
+        except Exception as e:
+            update_task_state(task_id, "FAILURE", {
+                "error": str(e),
+                "type": type(e).__name__
+            })
+        finally:
+            # New (possibly partial) posts are visible to the analysis endpoints
+            await bump_data_version(campaign_id)
 
 
 async def run_analysis_background_task(
@@ -118,7 +192,9 @@ async def run_analysis_background_task(
 ):
     """
     Run analysis pipeline as an asyncio background task.
-    Stores progress in Redis for SSE streaming.
+    Stores progress in Redis for SSE streaming. At most
+    MAX_CONCURRENT_ANALYSES runs execute at once; the rest wait their turn
+    and show as PENDING meanwhile.
 
     Args:
         task_id: Task UUID for Redis state tracking
@@ -129,13 +205,19 @@ async def run_analysis_background_task(
     """
     from app.workers.analysis_worker import run_analysis_background
 
-    await run_analysis_background(task_id, campaign_id, force_refresh, user_id=user_id, plan=plan)
+    async with _analysis_slots:
+        try:
+            await run_analysis_background(task_id, campaign_id, force_refresh, user_id=user_id, plan=plan)
+        finally:
+            await bump_data_version(campaign_id)
 
 
 async def run_monitoring_check_background_task(task_id: str, shadow_id: str):
     """
     Run monitoring check as an asyncio background task.
-    Stores progress in Redis for SSE streaming.
+    Stores progress in Redis for SSE streaming. At most
+    MAX_CONCURRENT_MONITORING_CHECKS checks execute at once; the rest wait
+    their turn and show as PENDING meanwhile.
 
     Args:
         task_id: Task UUID for Redis state tracking
@@ -143,7 +225,8 @@ async def run_monitoring_check_background_task(task_id: str, shadow_id: str):
     """
     from app.workers.monitoring_worker import run_monitoring_check
 
-    await run_monitoring_check(task_id, shadow_id)
+    async with _monitoring_check_slots:
+        await run_monitoring_check(task_id, shadow_id)
 
 
 async def run_audit_background_task(task_id: str, shadow_id: str):
@@ -165,19 +248,30 @@ async def schedule_periodic_monitoring():
     Schedule periodic monitoring checks every 15 minutes.
 
     Creates a recurring asyncio task that dispatches pending checks.
-    Runs indefinitely in the background.
+    Runs indefinitely in the background. Every worker process runs one;
+    a Redis lock lets only the first of them dispatch each round.
     """
     from app.workers.monitoring_worker import dispatch_pending_checks
-    import logging
 
-    logger = logging.getLogger(__name__)
     logger.info("Starting periodic monitoring scheduler (15-min interval)")
 
     while True:
         try:
-            await dispatch_pending_checks()
+            if await _claim_monitoring_round():
+                await dispatch_pending_checks()
         except Exception as e:
             logger.error(f"Periodic monitoring dispatch error: {e}")
 
-        # Sleep for 15 minutes
-        await asyncio.sleep(900)
+        await asyncio.sleep(MONITORING_INTERVAL_SECONDS)
+
+
+async def _claim_monitoring_round() -> bool:
+    """Take the lock for this monitoring round; True if no other process holds it."""
+    try:
+        # Expires before the next round so a dead holder can't block it
+        return bool(await get_general_client().set(
+            MONITORING_LOCK_KEY, "1", nx=True, ex=MONITORING_INTERVAL_SECONDS - 60
+        ))
+    except Exception:
+        # Without Redis, dispatch anyway (duplicates beat missed checks)
+        return True
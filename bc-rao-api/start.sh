@@ -1,4 +1,5 @@
 #!/bin/bash
 
 # Start FastAPI server (collection tasks run in-process via asyncio)
-uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+# on uvloop + httptools, same as the Dockerfile
+uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --workers ${WEB_CONCURRENCY:-1} --loop uvloop --http httptools
@@ -2,11 +2,11 @@
 Tests for collection service - Reddit post collection pipeline.
 
 Tests subreddit validation (including BUG-A18 fix for r/ prefix rejection),
-empty subreddit list handling, and retry logic.
+empty subreddit list handling, retry logic, and the post and stats reads.
 """
 import pytest
-from unittest.mock import patch, AsyncMock
-from app.services.collection_service import CollectionService
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.services.collection_service import CollectionService, _decode_cursor, _encode_cursor
 from app.utils.errors import AppError, ErrorCode
 
 
@@ -463,3 +463,146 @@ async def test_various_valid_formats(valid_name, mock_supabase):
         except Exception:
             # Other exceptions expected (missing mocks)
             pass
+
+
+class TestPostsCursor:
+    """Keyset cursors round-trip the sort key and reject garbage."""
+
+    def test_round_trip(self):
+        post = {
+            "success_score": 7.5,
+            "collected_at": "2026-01-01T00:00:00+00:00",
+            "id": "6f1c1b1e-0000-4000-8000-000000000000",
+        }
+
+        assert _decode_cursor(_encode_cursor(post)) == (
+            7.5, "2026-01-01T00:00:00+00:00", "6f1c1b1e-0000-4000-8000-000000000000"
+        )
+
+    def test_unscored_post(self):
+        post = {"success_score": None, "collected_at": "2026-01-01T00:00:00+00:00",
+                "id": "6f1c1b1e-0000-4000-8000-000000000000"}
+
+        assert _decode_cursor(_encode_cursor(post))[0] is None
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "WzFd", ""])
+    def test_malformed_cursor_rejected(self, cursor):
+        with pytest.raises(AppError) as exc_info:
+            _decode_cursor(cursor)
+        assert exc_info.value.code == ErrorCode.VALIDATION_ERROR
+
+    @pytest.mark.parametrize("collected_at", [None, "garbage", 17])
+    def test_tampered_timestamp_rejected(self, collected_at):
+        cursor = _encode_cursor({"success_score": 1.0, "collected_at": collected_at,
+                                 "id": "6f1c1b1e-0000-4000-8000-000000000000"})
+
+        with pytest.raises(AppError) as exc_info:
+            _decode_cursor(cursor)
+        assert exc_info.value.code == ErrorCode.VALIDATION_ERROR
+
+
+class TestGetPostsAfter:
+    """Cursor pages pass Supabase rows through for streaming."""
+
+    @pytest.mark.asyncio
+    @patch('app.services.collection_service.get_supabase_client')
+    @patch('app.services.collection_service.get_async_supabase_client')
+    async def test_extra_row_yields_next_cursor(self, mock_get_client, _):
+        rows = [
+            {"success_score": 9.0 - i, "collected_at": "2026-01-01T00:00:00+00:00",
+             "id": f"6f1c1b1e-0000-4000-8000-00000000000{i}"}
+            for i in range(3)
+        ]
+        client = MagicMock()
+        client.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data={"posts": rows}))
+        mock_get_client.return_value = client
+
+        cursor = _encode_cursor({"success_score": 10.0, "collected_at": "2026-01-02T00:00:00+00:00",
+                                 "id": "6f1c1b1e-0000-4000-8000-00000000000f"})
+        result = await CollectionService().get_posts("camp123", "user123", per_page=2, cursor=cursor)
+
+        assert result["posts"] == rows[:2]
+        assert result["total"] is None
+        assert _decode_cursor(result["next_cursor"]) == (8.0, rows[1]["collected_at"], rows[1]["id"])
+        assert client.rpc.call_args.args[1]["p_limit"] == 3
+
+
+class TestGetPostsOffset:
+    """Offset pages are scoped to the owner like cursor pages."""
+
+    @staticmethod
+    def _client(*results):
+        query = MagicMock()
+        for method in ("select", "eq", "order", "range"):
+            getattr(query, method).return_value = query
+        query.execute = AsyncMock(side_effect=list(results))
+        client = MagicMock()
+        client.table.return_value = query
+        return client, query
+
+    @pytest.mark.asyncio
+    @patch('app.services.collection_service.get_supabase_client')
+    @patch('app.services.collection_service.get_async_supabase_client')
+    async def test_unowned_campaign_raises_404(self, mock_get_client, _):
+        client, query = self._client(MagicMock(data=[], count=0), MagicMock(data=[]))
+        mock_get_client.return_value = client
+
+        with pytest.raises(AppError) as exc_info:
+            await CollectionService().get_posts("camp123", "user123")
+
+        assert exc_info.value.code == ErrorCode.RESOURCE_NOT_FOUND
+        query.eq.assert_any_call("user_id", "user123")
+
+    @pytest.mark.asyncio
+    @patch('app.services.collection_service.get_supabase_client')
+    @patch('app.services.collection_service.get_async_supabase_client')
+    async def test_empty_page_of_owned_campaign(self, mock_get_client, _):
+        client, _query = self._client(MagicMock(data=[], count=0), MagicMock(data=[{"id": "camp123"}]))
+        mock_get_client.return_value = client
+
+        result = await CollectionService().get_posts("camp123", "user123")
+
+        assert result["posts"] == []
+        assert result["next_cursor"] is None
+
+
+class TestCollectionStats:
+    """Stats come aggregated from one RPC; 404 when the campaign isn't owned."""
+
+    @pytest.mark.asyncio
+    @patch('app.services.collection_service.get_supabase_client')
+    @patch('app.services.collection_service.get_async_supabase_client')
+    async def test_unowned_campaign_raises_404(self, mock_get_client, _):
+        client = MagicMock()
+        client.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=None))
+        mock_get_client.return_value = client
+
+        with pytest.raises(AppError) as exc_info:
+            await CollectionService().get_collection_stats("camp123", "user123")
+
+        assert exc_info.value.code == ErrorCode.RESOURCE_NOT_FOUND
+        client.rpc.assert_called_once_with(
+            "get_campaign_collection_stats", {"p_campaign_id": "camp123", "p_user_id": "user123"}
+        )
+
+
+class TestGetPostDetail:
+    """A post is only served within its campaign and to its owner."""
+
+    @pytest.mark.asyncio
+    @patch('app.services.collection_service.get_supabase_client')
+    @patch('app.services.collection_service.get_async_supabase_client')
+    async def test_post_of_other_campaign_raises_404(self, mock_get_client, _):
+        client = MagicMock()
+        query = client.table.return_value.select.return_value.eq.return_value.eq.return_value.eq.return_value
+        query.execute = AsyncMock(return_value=MagicMock(data=[]))
+        mock_get_client.return_value = client
+
+        with pytest.raises(AppError) as exc_info:
+            await CollectionService().get_post_detail("post123", "camp123", "user123")
+
+        assert exc_info.value.code == ErrorCode.RESOURCE_NOT_FOUND
+        select = client.table.return_value.select.return_value
+        select.eq.assert_called_once_with("id", "post123")
+        select.eq.return_value.eq.assert_called_once_with("campaign_id", "camp123")
+        select.eq.return_value.eq.return_value.eq.assert_called_once_with("user_id", "user123")
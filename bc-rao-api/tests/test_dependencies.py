@@ -0,0 +1,81 @@
+"""
+Tests for the authentication and campaign ownership dependencies.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.dependencies import campaign_owner_plan, get_current_user
+
+
+def _rpc_returning(data):
+    """Async Supabase client whose rpc() call returns data."""
+    client = MagicMock()
+    client.rpc.return_value.execute = AsyncMock(return_value=SimpleNamespace(data=data))
+    return client
+
+
+@patch("app.dependencies.cache_owner_plan", new_callable=AsyncMock)
+class TestCampaignOwnerPlan:
+    """Ownership and plan from one RPC (or the Redis cache); 404 when not owned."""
+
+    @patch("app.dependencies.get_cached_owner_plan", AsyncMock(return_value=None))
+    async def test_returns_plan_and_caches_it(self, mock_cache):
+        campaign_id = uuid4()
+        client = _rpc_returning("growth")
+
+        with patch("app.dependencies.get_async_supabase_client", AsyncMock(return_value=client)):
+            plan = await campaign_owner_plan(campaign_id, {"sub": "user-1"})
+
+        assert plan == "growth"
+        client.rpc.assert_called_once_with(
+            "get_campaign_owner_plan", {"p_campaign_id": str(campaign_id), "p_user_id": "user-1"}
+        )
+        client.table.assert_not_called()
+        mock_cache.assert_awaited_once_with(str(campaign_id), "user-1", "growth")
+
+    @patch("app.dependencies.get_cached_owner_plan", AsyncMock(return_value="starter"))
+    async def test_cache_hit_skips_supabase(self, mock_cache):
+        mock_client = AsyncMock()
+
+        with patch("app.dependencies.get_async_supabase_client", mock_client):
+            plan = await campaign_owner_plan(uuid4(), {"sub": "user-1"})
+
+        assert plan == "starter"
+        mock_client.assert_not_called()
+        mock_cache.assert_not_awaited()
+
+    @patch("app.dependencies.get_cached_owner_plan", AsyncMock(return_value=None))
+    async def test_unowned_campaign_raises_404_and_is_not_cached(self, mock_cache):
+        client = _rpc_returning(None)
+
+        with patch("app.dependencies.get_async_supabase_client", AsyncMock(return_value=client)):
+            with pytest.raises(HTTPException) as exc_info:
+                await campaign_owner_plan(uuid4(), {"sub": "user-1"})
+
+        assert exc_info.value.status_code == 404
+        mock_cache.assert_not_awaited()
+
+
+class TestGetCurrentUser:
+    """The bearer is verified once per request, however many dependencies need the user."""
+
+    def test_shared_dependency_verifies_token_once(self):
+        app = FastAPI()
+
+        async def needs_user(user: dict = Depends(get_current_user)) -> str:
+            return user["sub"]
+
+        @app.get("/probe")
+        async def probe(sub: str = Depends(needs_user), user: dict = Depends(get_current_user)):
+            return {"sub": sub, "same": sub == user["sub"]}
+
+        with patch("app.dependencies.verify_jwt", return_value={"sub": "user-1"}) as mock_verify:
+            response = TestClient(app).get("/probe", headers={"Authorization": "Bearer token"})
+
+        assert response.json() == {"sub": "user-1", "same": True}
+        mock_verify.assert_called_once_with("token")
@@ -0,0 +1,91 @@
+"""
+Tests for the Redis counter backing the monthly draft limit.
+"""
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.draft_counter import (
+    STALE_COUNT_SECONDS,
+    cache_draft_count,
+    draft_count_key,
+    get_cached_draft_count,
+    increment_draft_count,
+    invalidate_draft_count,
+    seconds_until_month_end,
+)
+
+
+class TestDraftCountKey:
+    """Keys and expiry follow the calendar month."""
+
+    def test_key_is_per_user_and_month(self):
+        assert draft_count_key("user-1", datetime(2026, 3, 15)) == "drafts_count:user-1:202603"
+
+    def test_expires_at_month_end(self):
+        assert seconds_until_month_end(datetime(2026, 3, 31, 23, 59, 0)) == 60
+
+    def test_december_rolls_over_the_year(self):
+        assert seconds_until_month_end(datetime(2026, 12, 31, 23, 0, 0)) == 3600
+
+
+class TestDraftCounter:
+    """Seeded from a count, incremented only once seeded."""
+
+    @patch("app.services.draft_counter.get_general_client")
+    async def test_cached_count_is_an_int(self, mock_client):
+        mock_client.return_value.get = AsyncMock(return_value="7")
+        assert await get_cached_draft_count("user-1") == 7
+
+    @patch("app.services.draft_counter.get_general_client")
+    async def test_missing_counter_means_recount(self, mock_client):
+        mock_client.return_value.get = AsyncMock(return_value=None)
+        assert await get_cached_draft_count("user-1") is None
+
+    @patch("app.services.draft_counter.get_general_client")
+    async def test_redis_error_means_recount(self, mock_client):
+        mock_client.return_value.get = AsyncMock(side_effect=ConnectionError("down"))
+        assert await get_cached_draft_count("user-1") is None
+
+    @patch("app.services.draft_counter.get_general_client")
+    async def test_seed_skips_stale_counts(self, mock_client):
+        client = MagicMock()
+        client.eval = AsyncMock(return_value=None)
+        mock_client.return_value = client
+
+        await cache_draft_count("user-1", 3)
+
+        script, numkeys, key, stale_key, count, ttl = client.eval.await_args.args
+        assert "NX" in script
+        assert numkeys == 2
+        assert stale_key == f"{key}:stale"
+        assert count == 3
+        assert ttl > 0
+
+    @patch("app.services.draft_counter.get_general_client")
+    async def test_increment_is_conditional(self, mock_client):
+        client = MagicMock()
+        client.eval = AsyncMock(return_value=None)
+        mock_client.return_value = client
+
+        await increment_draft_count("user-1")
+
+        script, numkeys, key, stale_key, ttl = client.eval.await_args.args
+        assert "EXISTS" in script
+        assert numkeys == 2
+        assert key.startswith("drafts_count:user-1:")
+        # An unseeded counter marks a count in flight as stale instead
+        assert stale_key == f"{key}:stale"
+        assert ttl == STALE_COUNT_SECONDS
+
+    @patch("app.services.draft_counter.get_general_client")
+    async def test_invalidation_marks_counts_stale(self, mock_client):
+        client = MagicMock()
+        client.eval = AsyncMock(return_value=None)
+        mock_client.return_value = client
+
+        await invalidate_draft_count("user-1")
+
+        script, numkeys, key, stale_key, _ = client.eval.await_args.args
+        assert "DEL" in script
+        assert numkeys == 2
+        assert stale_key == f"{key}:stale"
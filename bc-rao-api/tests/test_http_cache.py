@@ -0,0 +1,35 @@
+"""
+Tests for ETag helpers used by the analysis read endpoints.
+"""
+from app.utils.http_cache import etag_matches, make_etag
+
+
+class TestMakeEtag:
+    """ETags are weak, stable and bound to campaign, user and version."""
+
+    def test_stable_for_same_inputs(self):
+        assert make_etag("c1", "u1", "v1") == make_etag("c1", "u1", "v1")
+
+    def test_is_weak_validator(self):
+        assert make_etag("c1", "u1", "v1").startswith('W/"')
+
+    def test_changes_with_version_and_user(self):
+        etag = make_etag("c1", "u1", "v1")
+        assert make_etag("c1", "u1", "v2") != etag
+        assert make_etag("c1", "u2", "v1") != etag
+
+    def test_resource_scopes_etag_to_one_item(self):
+        etag = make_etag("c1", "u1", "v1", "p1")
+        assert etag != make_etag("c1", "u1", "v1")
+        assert etag != make_etag("c1", "u1", "v1", "p2")
+
+
+class TestEtagMatches:
+    """If-None-Match parsing."""
+
+    def test_matches_listed_etag(self):
+        etag = make_etag("c1", "u1", "v1")
+        assert etag_matches(f'W/"other", {etag}', etag)
+
+    def test_missing_header_never_matches(self):
+        assert not etag_matches(None, make_etag("c1", "u1", "v1"))
@@ -0,0 +1,73 @@
+"""
+Tests for streaming Chat Completions through InferenceClient.
+"""
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.inference.client import InferenceClient
+
+
+def _streaming_client(lines):
+    """httpx.AsyncClient factory answering every request with SSE lines."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content="\n".join(lines).encode())
+
+    real_client = httpx.AsyncClient
+
+    def factory(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    return factory, requests
+
+
+class TestStreamOpenRouter:
+    """Content deltas reach on_token, usage comes from the last chunk."""
+
+    @patch("app.inference.client.CostTracker")
+    async def test_streams_deltas_and_reads_usage(self, _tracker):
+        factory, requests = _streaming_client([
+            ": OPENROUTER PROCESSING",
+            "",
+            'data: {"choices":[{"delta":{"role":"assistant","content":"Hello"}}]}',
+            "",
+            'data: {"choices":[{"delta":{"content":" world"}}]}',
+            "",
+            'data: {"choices":[],"usage":{"total_tokens":42}}',
+            "",
+            "data: [DONE]",
+        ])
+        tokens = []
+
+        with patch("app.inference.client.httpx.AsyncClient", factory):
+            result = await InferenceClient("generate_draft")._stream_openrouter(
+                messages=[{"role": "user", "content": "hi"}],
+                model="test-model",
+                max_tokens=10,
+                temperature=0.5,
+                on_token=tokens.append,
+            )
+
+        assert tokens == ["Hello", " world"]
+        assert result == {"content": "Hello world", "model_used": "test-model", "token_count": 42}
+        assert b'"stream":true' in requests[0].content.replace(b" ", b"")
+
+    @patch("app.inference.client.CostTracker")
+    async def test_error_chunk_raises(self, _tracker):
+        factory, _ = _streaming_client([
+            'data: {"error":{"message":"provider overloaded"}}',
+        ])
+
+        with patch("app.inference.client.httpx.AsyncClient", factory), \
+                pytest.raises(RuntimeError, match="provider overloaded"):
+            await InferenceClient("generate_draft")._stream_openrouter(
+                messages=[{"role": "user", "content": "hi"}],
+                model="test-model",
+                max_tokens=10,
+                temperature=0.5,
+                on_token=lambda token: None,
+            )
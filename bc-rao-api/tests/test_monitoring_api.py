@@ -0,0 +1,90 @@
+"""
+Tests for batch registration of monitored posts.
+"""
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import monitoring
+from app.dependencies import get_current_user
+from app.models.monitoring import RegisterPostResponse
+from app.services.monitoring_service import get_monitoring_service
+
+CAMPAIGN_ID = str(uuid4())
+URLS = [
+    "https://reddit.com/r/python/comments/abc123/first/",
+    "https://reddit.com/r/python/comments/def456/second/",
+]
+
+
+@pytest.fixture
+def service():
+    return MagicMock()
+
+
+@pytest.fixture
+def client(service):
+    app = FastAPI()
+    app.include_router(monitoring.router, prefix="/monitoring")
+    app.dependency_overrides[get_current_user] = lambda: {"sub": "user-1"}
+    app.dependency_overrides[get_monitoring_service] = lambda: service
+    return TestClient(app)
+
+
+def _registered(user_id, posts):
+    return [
+        RegisterPostResponse(
+            id=uuid4(),
+            post_url=post_url,
+            subreddit="python",
+            reddit_post_id=post_url.split("/comments/")[1].split("/")[0],
+            status="Ativo",
+            isc_at_post=5.0,
+            check_interval_hours=4,
+            next_check_at=datetime(2026, 1, 1, 4),
+            created_at=datetime(2026, 1, 1),
+        )
+        for _, post_url in posts
+    ]
+
+
+class TestRegisterBatch:
+    """One bulk registration, then a background check per post."""
+
+    def test_registers_all_and_starts_checks(self, client, service):
+        with patch.object(monitoring, "spawn_background") as spawn, \
+                patch.object(monitoring, "run_monitoring_check_background", MagicMock()):
+            service.register_posts_bulk.side_effect = _registered
+            response = client.post("/monitoring/register/batch", json=[
+                {"campaign_id": CAMPAIGN_ID, "post_url": url} for url in URLS
+            ])
+
+        assert response.status_code == 201
+        assert [post["post_url"] for post in response.json()] == URLS
+        service.register_posts_bulk.assert_called_once_with(
+            user_id="user-1", posts=[(CAMPAIGN_ID, url) for url in URLS]
+        )
+        assert spawn.call_count == 2
+
+    def test_already_registered_is_409(self, client, service):
+        with patch.object(monitoring, "spawn_background") as spawn:
+            service.register_posts_bulk.side_effect = ValueError(
+                f"Post already registered: {URLS[0]}"
+            )
+            response = client.post("/monitoring/register/batch", json=[
+                {"campaign_id": CAMPAIGN_ID, "post_url": URLS[0]}
+            ])
+
+        assert response.status_code == 409
+        spawn.assert_not_called()
+
+    def test_oversized_batch_is_rejected(self, client, service):
+        posts = [{"campaign_id": CAMPAIGN_ID, "post_url": URLS[0]}] * (monitoring.MAX_BATCH_REGISTRATIONS + 1)
+        response = client.post("/monitoring/register/batch", json=posts)
+
+        assert response.status_code == 422
+        service.register_posts_bulk.assert_not_called()
@@ -0,0 +1,117 @@
+"""Tests for forbidden pattern detection."""
+
+import re
+import time
+
+import pytest
+
+from app.analysis.pattern_extractor import (
+    extract_forbidden_patterns,
+    check_post_penalties,
+    _RepeatedPhraseDetector,
+)
+
+
+LONG_CLEAN_TEXT = (
+    "Spent the weekend reworking our onboarding flow and learned a lot "
+    "about where people drop off during signup."
+)
+
+
+class TestExtractForbiddenPatterns:
+    """Category counts and pattern details from the prefiltered scan."""
+
+    def test_empty_input(self):
+        assert extract_forbidden_patterns([]) == {"by_category": {}, "detected_patterns": []}
+
+    def test_counts_posts_per_category(self):
+        texts = [
+            "Check out my app, use the promo code SAVE10 " + LONG_CLEAN_TEXT,
+            "I built a tool for this. " + LONG_CLEAN_TEXT,
+            LONG_CLEAN_TEXT,
+        ]
+
+        result = extract_forbidden_patterns(texts)
+
+        assert result["by_category"]["Promotional"] == 1
+        assert result["by_category"]["Self-referential"] == 2
+        assert result["by_category"]["Off-topic"] == 0
+
+    def test_case_sensitive_patterns_stay_case_sensitive(self):
+        result = extract_forbidden_patterns([LONG_CLEAN_TEXT.lower()])
+
+        assert result["by_category"]["Spam indicators"] == 0
+
+    def test_repeated_phrase_detected(self):
+        text = "buy this now! " * 3 + LONG_CLEAN_TEXT
+
+        result = extract_forbidden_patterns([text])
+
+        assert result["by_category"]["Spam indicators"] == 1
+
+    def test_sorted_by_match_count(self):
+        texts = ["my app is great " + LONG_CLEAN_TEXT] * 3 + ["coupon inside " + LONG_CLEAN_TEXT]
+
+        counts = [p["match_count"] for p in extract_forbidden_patterns(texts)["detected_patterns"]]
+
+        assert counts == sorted(counts, reverse=True)
+
+
+class TestCheckPostPenalties:
+    """Per-post penalty phrases for inline highlighting."""
+
+    def test_clean_text_has_no_penalties(self):
+        assert check_post_penalties(LONG_CLEAN_TEXT) == []
+
+    def test_phrases_deduplicated_case_insensitively(self):
+        penalties = check_post_penalties("My app rocks. my app rocks. " + LONG_CLEAN_TEXT)
+
+        phrases = [p["phrase"].lower() for p in penalties]
+        assert phrases.count("my app") == 1
+
+    def test_severity_by_category(self):
+        penalties = check_post_penalties("Use my discount code at bit.ly/abc " + LONG_CLEAN_TEXT)
+
+        by_category = {p["category"]: p["severity"] for p in penalties}
+        assert by_category["Promotional"] == "high"
+        assert by_category["Link patterns"] == "medium"
+
+
+class TestRepeatedPhraseDetector:
+    """The detector must report exactly what the backreference regex did."""
+
+    REGEX = re.compile(r'(.{10,}?)\1{2,}')
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "buy this now! " * 3,
+        "buy this now! " * 2,
+        "abababababababababababababababab",
+        "prefix text " + "same phrase " * 4 + "suffix",
+        "line one is here\n" * 3,
+        "aaaaaaaaaa\naaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        "a" * 100,
+        "".join("aaaaaaaaaa" + format(i, "05d") for i in range(40)),
+        LONG_CLEAN_TEXT,
+    ])
+    def test_matches_regex(self, text):
+        expected = [m.span() for m in self.REGEX.finditer(text)]
+        actual = [m.span() for m in _RepeatedPhraseDetector().finditer(text)]
+
+        assert actual == expected
+        assert bool(_RepeatedPhraseDetector().search(text)) == bool(expected)
+
+    def test_scales_on_adversarial_input(self):
+        # One 10-char window recurring every 15 chars made the old scan
+        # quadratic: 4x the input took ~16x as long
+        def elapsed(count):
+            text = "".join("aaaaaaaaaa" + format(i, "05d") for i in range(count))
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                list(_RepeatedPhraseDetector().finditer(text))
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        # O(n log n) is ~4.5x; the slack absorbs noisy runners
+        assert elapsed(4000) / elapsed(1000) < 10
@@ -0,0 +1,25 @@
+"""
+Tests for the shared response helpers.
+"""
+import json
+
+import pytest
+
+from app.utils.responses import stream_json_list
+
+
+async def _collect(chunks):
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestStreamJsonList:
+    """Streamed bodies decode to the same object as a one-shot encode."""
+
+    @pytest.mark.parametrize("items", [[], [{"id": 1}], [{"id": 1}, {"id": 2, "tags": ["a"]}]])
+    async def test_round_trips(self, items):
+        body = await _collect(stream_json_list("posts", items, total=7, page=2))
+        assert json.loads(body) == {"posts": items, "total": 7, "page": 2}
+
+    async def test_without_extra_fields(self):
+        body = await _collect(stream_json_list("posts", [1, 2]))
+        assert json.loads(body) == {"posts": [1, 2]}
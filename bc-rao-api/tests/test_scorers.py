@@ -0,0 +1,90 @@
+"""Tests for post scoring and ISC calculation."""
+
+import pytest
+
+from app.analysis.scorers import (
+    calculate_vulnerability_weight,
+    calculate_marketing_jargon_penalty,
+    calculate_link_density_penalty,
+    calculate_post_score,
+    score_text_signals,
+)
+
+
+SAMPLE_TEXTS = [
+    "",
+    "I struggled with this for months. Any advice?",
+    "We leverage synergy to disrupt the paradigm. Reach out for ROI!",
+    "Check https://example.com/leverage and www.synergy.io for details",
+    "roi is not ROI, but Leverage and leverage are the same",
+    "growth hackwww.example.com and www.thought leader",
+    "https://www.foo.com https://bar.com http://baz.com",
+]
+
+
+class TestFusedPenaltyScan:
+    """calculate_post_score penalties must match the standalone scorers."""
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_penalties_match_standalone_functions(self, text):
+        result = calculate_post_score({"raw_text": text}, {})
+
+        jargon_penalty, jargon_phrases = calculate_marketing_jargon_penalty(text)
+        link_penalty, link_phrases = calculate_link_density_penalty(text)
+
+        assert result["marketing_jargon_penalty"] == jargon_penalty
+        assert result["link_density_penalty"] == link_penalty
+        assert result["penalty_phrases"] == jargon_phrases + link_phrases
+
+    def test_jargon_inside_url_still_counted(self):
+        result = calculate_post_score({"raw_text": "see https://example.com/leverage"}, {})
+
+        phrases = [p["phrase"] for p in result["penalty_phrases"]]
+        assert "leverage" in phrases
+        assert "https://example.com/leverage" in phrases
+
+    def test_roi_is_case_sensitive(self):
+        result = calculate_post_score({"raw_text": "roi roi roi"}, {})
+
+        assert result["marketing_jargon_penalty"] == 0.0
+
+
+class TestScoreBuckets:
+    """Bucket boundaries for vulnerability and link scores."""
+
+    @pytest.mark.parametrize("matches,expected", [
+        (0, 0.0), (1, 3.0), (3, 3.0), (4, 5.0), (6, 5.0),
+        (7, 7.0), (10, 7.0), (11, 7.3), (20, 10.0),
+    ])
+    def test_vulnerability_buckets(self, matches, expected):
+        assert calculate_vulnerability_weight("?" * matches) == expected
+
+    @pytest.mark.parametrize("count,expected", [(0, 0.0), (1, 3.0), (2, 6.0), (3, 9.0), (5, 9.0)])
+    def test_link_buckets(self, count, expected):
+        text = " ".join(f"https://example.com/{i}" for i in range(count))
+        assert calculate_link_density_penalty(text)[0] == expected
+
+
+class TestTextSignals:
+    """Precomputed text signals are reused by calculate_post_score."""
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_precomputed_signals_give_same_score(self, text):
+        post = {"raw_text": text, "avg_sentence_length": 12.0, "sentence_length_std": 4.0}
+
+        fresh = calculate_post_score(post, {"avg_sentence_length": 10.0})
+        reused = calculate_post_score({**post, **score_text_signals(text)}, {"avg_sentence_length": 10.0})
+
+        assert reused == fresh
+
+    def test_signals_are_not_recomputed_when_present(self):
+        signals = {
+            "vulnerability_weight": 10.0,
+            "marketing_jargon_penalty": 0.0,
+            "link_density_penalty": 0.0,
+            "penalty_phrases": [],
+        }
+
+        result = calculate_post_score({"raw_text": "", **signals}, {})
+
+        assert result["vulnerability_weight"] == 10.0
@@ -0,0 +1,61 @@
+"""
+Tests for the per-process JWT verification cache.
+"""
+import base64
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.utils import security
+from app.utils.security import forget_jwt, verify_jwt
+
+
+def _token(exp: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"header.{claims}.signature"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    security._verified_tokens.clear()
+    yield
+    security._verified_tokens.clear()
+
+
+class TestVerifyJwtCache:
+    """Supabase is asked once per token until the cache entry expires."""
+
+    @patch("app.utils.security._verify_with_supabase", return_value={"sub": "user-1"})
+    def test_repeat_calls_hit_cache(self, mock_verify):
+        token = _token(time.time() + 3600)
+
+        assert verify_jwt(token) == {"sub": "user-1"}
+        assert verify_jwt(token) == {"sub": "user-1"}
+        mock_verify.assert_called_once_with(token)
+
+    @patch("app.utils.security._verify_with_supabase", return_value={"sub": "user-1"})
+    def test_entry_never_outlives_token_exp(self, mock_verify):
+        token = _token(time.time() - 1)
+
+        verify_jwt(token)
+        verify_jwt(token)
+        assert mock_verify.call_count == 2
+
+    @patch("app.utils.security._verify_with_supabase", return_value={"sub": "user-1"})
+    def test_forget_forces_reverification(self, mock_verify):
+        token = _token(time.time() + 3600)
+
+        verify_jwt(token)
+        forget_jwt(token)
+        verify_jwt(token)
+        assert mock_verify.call_count == 2
+
+    @patch("app.utils.security._verify_with_supabase", return_value={"sub": "user-1"})
+    def test_raw_token_not_stored(self, _):
+        token = _token(time.time() + 3600)
+
+        verify_jwt(token)
+        assert token.encode() not in security._verified_tokens
+        assert len(next(iter(security._verified_tokens))) == 16
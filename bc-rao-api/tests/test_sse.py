@@ -0,0 +1,91 @@
+"""
+Tests for the precomputed SSE frames and the response shared by the progress streams.
+"""
+import json
+import zlib
+
+import pytest
+
+from app.utils import sse
+
+
+class TestStaticFrames:
+    """Hand-written frames stay well-formed SSE with JSON data."""
+
+    @pytest.mark.parametrize("frame, event, data", [
+        (sse.SSE_STARTED_FRAME, "started", {"state": "started"}),
+        (sse.SSE_PENDING_FRAME, "pending", {"state": "pending"}),
+        (sse.SSE_DONE_FRAME, "done", {}),
+    ])
+    def test_event_frames(self, frame, event, data):
+        assert frame.endswith(b"\n\n")
+        event_line, data_line = frame.decode().strip("\n").split("\n")
+        assert event_line == f"event: {event}"
+        assert json.loads(data_line.removeprefix("data: ")) == data
+
+    def test_keepalive_is_a_comment(self):
+        assert sse.SSE_KEEPALIVE_FRAME.startswith(b":")
+        assert sse.SSE_KEEPALIVE_FRAME.endswith(b"\n\n")
+
+    @pytest.mark.parametrize("prefix, event", [
+        (sse.SSE_PROGRESS_PREFIX, "progress"),
+        (sse.SSE_SUCCESS_PREFIX, "success"),
+        (sse.SSE_ERROR_PREFIX, "error"),
+    ])
+    def test_prefixes(self, prefix, event):
+        assert prefix == f"event: {event}\ndata: ".encode()
+
+
+class TestStateFrame:
+    """Each task state maps to its SSE event."""
+
+    @pytest.mark.parametrize("state, expected", [
+        ("PROGRESS", b'event: progress\ndata: {"current":1}\n\n'),
+        ("SUCCESS", b'event: success\ndata: {"current":1}\n\n'),
+        ("FAILURE", b'event: error\ndata: {"current":1}\n\n'),
+        ("STARTED", sse.SSE_STARTED_FRAME),
+        ("PENDING", sse.SSE_PENDING_FRAME),
+    ])
+    def test_known_states(self, state, expected):
+        assert sse.state_frame(state, {"current": 1}) == expected
+
+    def test_unknown_state_has_no_frame(self):
+        assert sse.state_frame("RETRY", {}) is None
+
+
+class TestHeaders:
+    """Stream headers stay valid over HTTP/2."""
+
+    def test_no_hop_by_hop_headers(self):
+        assert "Connection" not in sse.SSE_HEADERS
+        assert sse.SSE_HEADERS["X-Accel-Buffering"] == "no"
+
+
+class TestSseResponse:
+    """Streams are gzipped only for clients that accept it, frame by frame."""
+
+    @pytest.mark.parametrize("header, gzipped", [
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("identity", False),
+        (None, False),
+    ])
+    def test_negotiation(self, header, gzipped):
+        response = sse.sse_response(_frames(), header)
+        assert (response.headers.get("content-encoding") == "gzip") is gzipped
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    async def test_each_frame_decodes_as_it_arrives(self):
+        response = sse.sse_response(_frames(), "gzip")
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        decoded = [decoder.decompress(chunk) async for chunk in response.body_iterator]
+
+        assert decoded[:2] == [sse.SSE_STARTED_FRAME, sse.SSE_DONE_FRAME]
+        assert decoder.eof
+
+
+async def _frames():
+    yield sse.SSE_STARTED_FRAME
+    yield sse.SSE_DONE_FRAME
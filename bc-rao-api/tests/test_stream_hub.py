@@ -0,0 +1,209 @@
+"""
+Tests for the shared Pub/Sub fan-out used by SSE progress streams.
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.stream_hub import StreamHub, task_event_stream
+
+
+class FakePubSub:
+    """Async Pub/Sub whose listen() yields messages pushed with publish()."""
+
+    def __init__(self):
+        self.channels = []
+        self.closed = False
+        self._messages = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def unsubscribe(self):
+        self.channels.clear()
+
+    async def aclose(self):
+        self.closed = True
+
+    def publish(self, state, meta):
+        self._messages.put_nowait({"type": "message", "data": json.dumps({"state": state, "meta": meta})})
+
+    async def listen(self):
+        yield {"type": "subscribe", "data": 1}
+        while True:
+            yield await self._messages.get()
+
+
+def _fake_redis(pubsub):
+    client = MagicMock()
+    client.pubsub.return_value = pubsub
+    return client
+
+
+async def _settle():
+    """Let the reader task forward pending messages."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _collect(stream):
+    """All frames of a stream."""
+    return [frame async for frame in stream]
+
+
+class TestStreamHub:
+    """One subscription per task, fanned out to every subscriber."""
+
+    async def test_subscribers_share_one_subscription(self):
+        pubsub = FakePubSub()
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)) as mock_redis:
+            hub = StreamHub()
+            first = await hub.subscribe("abc")
+            second = await hub.subscribe("abc")
+
+            assert mock_redis.call_count == 1
+            assert pubsub.channels == ["task:abc"]
+
+            await hub.unsubscribe("abc", first)
+            await hub.unsubscribe("abc", second)
+
+    async def test_updates_reach_every_subscriber(self):
+        pubsub = FakePubSub()
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)):
+            hub = StreamHub()
+            first = await hub.subscribe("abc")
+            second = await hub.subscribe("abc")
+
+            pubsub.publish("PROGRESS", {"current": 1})
+            await _settle()
+
+            expected = {
+                "state": "PROGRESS",
+                "meta": {"current": 1},
+                "frame": b'event: progress\ndata: {"current":1}\n\n',
+            }
+            first_update = first.get_nowait()
+            assert first_update == expected
+            # Encoded once by the reader, shared by every subscriber
+            assert second.get_nowait()["frame"] is first_update["frame"]
+
+            await hub.unsubscribe("abc", first)
+            await hub.unsubscribe("abc", second)
+
+    async def test_full_queue_drops_oldest(self):
+        pubsub = FakePubSub()
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)):
+            hub = StreamHub(max_queue_size=2)
+            queue = await hub.subscribe("abc")
+
+            for current in range(3):
+                pubsub.publish("PROGRESS", {"current": current})
+            await _settle()
+
+            assert [queue.get_nowait()["meta"]["current"] for _ in range(2)] == [1, 2]
+
+            await hub.unsubscribe("abc", queue)
+
+    async def test_last_unsubscribe_closes_subscription(self):
+        pubsub = FakePubSub()
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)):
+            hub = StreamHub()
+            first = await hub.subscribe("abc")
+            second = await hub.subscribe("abc")
+
+            await hub.unsubscribe("abc", first)
+            assert not pubsub.closed
+
+            await hub.unsubscribe("abc", second)
+            assert pubsub.closed
+            assert pubsub.channels == []
+
+
+class TestTaskEventStream:
+    """SSE frames follow the stored state, then published updates."""
+
+    async def test_catches_up_then_streams_until_success(self):
+        pubsub = FakePubSub()
+        stored = {"state": "PROGRESS", "meta": {"current": 1}}
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)), \
+                patch("app.services.stream_hub.stream_hub", StreamHub()), \
+                patch("app.services.stream_hub.get_task_state_async", AsyncMock(return_value=stored)):
+            stream = task_event_stream("abc")
+
+            assert await stream.__anext__() == b'event: progress\ndata: {"current":1}\n\n'
+
+            pubsub.publish("SUCCESS", {"status": "done"})
+            frames = [frame async for frame in stream]
+
+            assert frames == [
+                b'event: success\ndata: {"status":"done"}\n\n',
+                b"event: done\ndata: {}\n\n",
+            ]
+            assert pubsub.closed
+
+    async def test_rapid_progress_is_coalesced(self):
+        pubsub = FakePubSub()
+        stored = {"state": "PROGRESS", "meta": {"current": 1}}
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)), \
+                patch("app.services.stream_hub.stream_hub", StreamHub()), \
+                patch("app.services.stream_hub.SSE_PROGRESS_COALESCE_SECONDS", 0.05), \
+                patch("app.services.stream_hub.get_task_state_async", AsyncMock(return_value=stored)):
+            stream = task_event_stream("abc")
+            assert await stream.__anext__() == b'event: progress\ndata: {"current":1}\n\n'
+
+            for current in (2, 3, 4):
+                pubsub.publish("PROGRESS", {"current": current})
+            assert await stream.__anext__() == b'event: progress\ndata: {"current":4}\n\n'
+
+            pubsub.publish("SUCCESS", {"status": "done"})
+            assert await stream.__anext__() == b'event: success\ndata: {"status":"done"}\n\n'
+            await stream.aclose()
+
+    async def test_published_updates_need_no_state_reads(self):
+        pubsub = FakePubSub()
+        read_state = AsyncMock(return_value=None)
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)), \
+                patch("app.services.stream_hub.stream_hub", StreamHub()), \
+                patch("app.services.stream_hub.get_task_state_async", read_state):
+            stream = task_event_stream("abc")
+
+            pubsub.publish("STARTED", {"state": "started"})
+            assert await stream.__anext__() == b'event: started\ndata: {"state":"started"}\n\n'
+            pubsub.publish("FAILURE", {"error": "boom"})
+            assert await stream.__anext__() == b'event: error\ndata: {"error":"boom"}\n\n'
+            await stream.aclose()
+
+        # Only the catch-up read; every later state was pushed over Pub/Sub
+        read_state.assert_awaited_once_with("abc")
+
+    async def test_hub_close_ends_stream_without_done(self):
+        pubsub = FakePubSub()
+        hub = StreamHub()
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)), \
+                patch("app.services.stream_hub.stream_hub", hub), \
+                patch("app.services.stream_hub.get_task_state_async", AsyncMock(return_value=None)):
+            frames = asyncio.create_task(_collect(task_event_stream("abc")))
+            await _settle()
+
+            await hub.close()
+
+            assert await frames == []
+            assert pubsub.closed
+
+    async def test_stale_update_does_not_rewind(self):
+        pubsub = FakePubSub()
+        stored = {"state": "PROGRESS", "meta": {"current": 2}}
+        with patch("app.services.stream_hub.get_blocking_client", return_value=_fake_redis(pubsub)), \
+                patch("app.services.stream_hub.stream_hub", StreamHub()), \
+                patch("app.services.stream_hub.get_task_state_async", AsyncMock(return_value=stored)):
+            stream = task_event_stream("abc")
+            assert await stream.__anext__() == b'event: progress\ndata: {"current":2}\n\n'
+
+            # Published before the catch-up read, delivered after it
+            pubsub.publish("STARTED", {"state": "started"})
+            pubsub.publish("SUCCESS", {"status": "done"})
+
+            assert [frame async for frame in stream] == [
+                b'event: success\ndata: {"status":"done"}\n\n',
+                b"event: done\ndata: {}\n\n",
+            ]
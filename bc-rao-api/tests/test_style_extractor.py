@@ -1,7 +1,13 @@
 """Tests for SpaCy-based style extractor."""
 
 import pytest
-from app.analysis.style_extractor import extract_community_style, _empty_style
+from app.analysis.nlp_pipeline import nlp
+from app.analysis.style_extractor import (
+    extract_community_style,
+    _empty_style,
+    _style_cache,
+    _style_cache_key,
+)
 
 
 # Sample texts mimicking different subreddit styles
@@ -197,3 +203,37 @@ class TestExtractCommunityStyle:
         assert result["imperfections"]["parenthetical_frequency"] == 0.0
         assert result["imperfections"]["self_correction_rate"] == 0.0
         assert result["imperfections"]["dash_interruption_rate"] == 0.0
+
+
+class TestPipelineComponents:
+    """Test the shared SpaCy pipeline only loads what style extraction needs."""
+
+    def test_ner_excluded(self):
+        assert "ner" not in nlp.pipe_names
+
+    def test_required_components_present(self):
+        # POS (tagger + attribute_ruler), lemmas, sentences and noun_chunks (parser)
+        for name in ("tagger", "attribute_ruler", "lemmatizer", "parser"):
+            assert name in nlp.pipe_names
+
+
+class TestStyleCache:
+    """Repeated inputs are served from the fingerprint cache."""
+
+    def test_cached_result_matches_fresh(self):
+        _style_cache.clear()
+        fresh = extract_community_style(GAMING_POSTS)
+        cached = extract_community_style(list(GAMING_POSTS))
+        assert cached == fresh
+
+    def test_callers_get_independent_copies(self):
+        _style_cache.clear()
+        first = extract_community_style(GAMING_POSTS)
+        first["vocabulary"]["top_terms"].clear()
+        assert extract_community_style(GAMING_POSTS)["vocabulary"]["top_terms"]
+
+    def test_key_depends_on_top_texts(self):
+        assert _style_cache_key(GAMING_POSTS, GAMING_POSTS[:2]) != _style_cache_key(GAMING_POSTS, GAMING_POSTS[:3])
+
+    def test_key_is_not_fooled_by_separators(self):
+        assert _style_cache_key(["a\n\nb"], []) != _style_cache_key(["a", "b"], [])
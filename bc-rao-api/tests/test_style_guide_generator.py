@@ -82,6 +82,14 @@ class TestParseStyleGuideJson:
         result = _parse_style_guide_json("This is not JSON at all")
         assert result == EMPTY_STYLE_GUIDE
 
+    def test_unbalanced_braces_return_empty(self):
+        result = _parse_style_guide_json("} Sorry, no guide this time {")
+        assert result == EMPTY_STYLE_GUIDE
+
+    def test_object_inside_array_is_used(self):
+        result = _parse_style_guide_json(f"[{VALID_STYLE_GUIDE_JSON}]")
+        assert result["voice_description"] != ""
+
     def test_partial_json_fills_defaults(self):
         partial = json.dumps({
             "voice_description": "Casual and fun",
@@ -144,6 +152,17 @@ class TestDescribeFormalityFromMetrics:
         result = _describe_formality_from_metrics(metrics)
         assert "formal" in result.lower()
 
+    @pytest.mark.parametrize("ratio,expected", [
+        (0.38, "Formal/technical (low stop-word ratio)"),
+        (0.39, "Moderate formality"),
+        (0.43, "Moderate formality"),
+        (0.48, "Casual conversational"),
+        (0.49, "Very casual (high stop-word ratio indicates informal writing)"),
+    ])
+    def test_bounds_belong_to_lower_bucket(self, ratio, expected):
+        metrics = {"vocabulary": {"stop_word_ratio": ratio}}
+        assert _describe_formality_from_metrics(metrics) == expected
+
     def test_empty_metrics(self):
         result = _describe_formality_from_metrics({})
         # Should return something reasonable with defaults
@@ -0,0 +1,27 @@
+"""
+Tests for the shared Supabase clients.
+"""
+import asyncio
+from unittest.mock import patch
+
+from app.integrations import supabase_client
+
+
+class TestAsyncSupabaseClient:
+    """One AsyncClient per process, even under concurrent first use."""
+
+    async def test_concurrent_first_calls_create_one_client(self):
+        created = []
+
+        async def slow_create(**kwargs):
+            await asyncio.sleep(0.01)
+            created.append(object())
+            return created[-1]
+
+        with patch.object(supabase_client, "_async_supabase_client", None), \
+                patch.object(supabase_client, "_async_supabase_lock", asyncio.Lock()), \
+                patch.object(supabase_client, "acreate_client", slow_create):
+            clients = await asyncio.gather(*(supabase_client.get_async_supabase_client() for _ in range(5)))
+
+        assert len(created) == 1
+        assert all(client is created[0] for client in clients)
@@ -0,0 +1,123 @@
+"""
+Tests for task state storage and Pub/Sub delivery in the task runner.
+"""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import orjson
+
+from app.workers.task_runner import (
+    _background_tasks,
+    _claim_monitoring_round,
+    bump_data_version,
+    run_collection_background,
+    spawn_background,
+    update_task_state,
+)
+
+
+class TestUpdateTaskState:
+    """State writes are stored and published in one round-trip."""
+
+    @patch("app.workers.task_runner.get_redis")
+    def test_stores_and_publishes_same_payload(self, mock_get_redis):
+        pipe = MagicMock()
+        mock_get_redis.return_value.pipeline.return_value = pipe
+
+        update_task_state("abc", "PROGRESS", {"current": 3})
+
+        payload = orjson.dumps({"state": "PROGRESS", "meta": {"current": 3}})
+        pipe.setex.assert_called_once_with("task:abc", 3600, payload)
+        pipe.publish.assert_called_once_with("task:abc", payload)
+        pipe.execute.assert_called_once()
+
+    @patch("app.workers.task_runner.get_redis")
+    def test_encodes_model_dump_types(self, mock_get_redis):
+        pipe = MagicMock()
+        mock_get_redis.return_value.pipeline.return_value = pipe
+        draft_id = UUID("12345678-1234-5678-1234-567812345678")
+
+        update_task_state("abc", "SUCCESS", {
+            "draft": {"id": draft_id, "created_at": datetime(2026, 1, 2, 3, 4, 5)}
+        })
+
+        stored = orjson.loads(pipe.setex.call_args.args[2])
+        assert stored["meta"]["draft"] == {
+            "id": str(draft_id),
+            "created_at": "2026-01-02T03:04:05",
+        }
+
+
+class TestSpawnBackground:
+    """Background tasks stay referenced until they finish."""
+
+    async def test_task_is_held_until_done(self):
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+
+        task = spawn_background(job())
+        assert task in _background_tasks
+
+        release.set()
+        await task
+        assert task not in _background_tasks
+
+
+class TestRunCollectionBackground:
+    """Collection runs wait for a free slot before starting."""
+
+    async def test_waits_for_slot_then_runs(self):
+        slots = asyncio.Semaphore(1)
+        service = MagicMock()
+        service.return_value.run_collection = AsyncMock(side_effect=RuntimeError("apify down"))
+
+        with patch("app.workers.task_runner._collection_slots", slots), \
+                patch("app.workers.task_runner.update_task_state") as mock_update, \
+                patch("app.workers.task_runner.bump_data_version", new_callable=AsyncMock) as mock_bump, \
+                patch("app.services.collection_service.CollectionService", service):
+            await slots.acquire()
+            task = asyncio.create_task(run_collection_background("abc", "c1", "u1", "trial"))
+            await asyncio.sleep(0)
+            mock_update.assert_not_called()
+
+            slots.release()
+            await task
+
+        states = [call.args[1] for call in mock_update.call_args_list]
+        assert states == ["STARTED", "FAILURE"]
+        mock_bump.assert_awaited_once_with("c1")
+
+
+class TestBumpDataVersion:
+    """Version bumps run in finally blocks, so Redis errors must not escape."""
+
+    @patch("app.workers.task_runner.get_general_client")
+    async def test_redis_error_is_swallowed(self, mock_client):
+        mock_client.return_value.set = AsyncMock(side_effect=ConnectionError("down"))
+
+        await bump_data_version("c1")
+
+        assert mock_client.return_value.set.await_args.args[0] == "campaign:c1:data_version"
+
+
+class TestClaimMonitoringRound:
+    """One process per monitoring round dispatches; Redis outages don't stop it."""
+
+    @patch("app.workers.task_runner.get_general_client")
+    async def test_lock_held_elsewhere_skips_round(self, mock_client):
+        mock_client.return_value.set = AsyncMock(return_value=None)
+
+        assert await _claim_monitoring_round() is False
+        mock_client.return_value.set.assert_awaited_once_with(
+            "monitoring:dispatch_lock", "1", nx=True, ex=840
+        )
+
+    @patch("app.workers.task_runner.get_general_client")
+    async def test_redis_error_still_dispatches(self, mock_client):
+        mock_client.return_value.set = AsyncMock(side_effect=ConnectionError("down"))
+
+        assert await _claim_monitoring_round() is True
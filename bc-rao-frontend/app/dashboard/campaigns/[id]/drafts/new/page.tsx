@@ -24,6 +24,7 @@ interface ProgressData {
   status: string;
   currentPhase?: string;
   draftId?: string;
+  preview?: string;
 }
 
 type Phase = "idle" | "generating" | "complete" | "error";
@@ -177,6 +178,11 @@ export default function NewDraftPage() {
       eventSource.addEventListener("progress", ((event: MessageEvent) => {
         try {
           const data = JSON.parse(event.data);
+          if (data.type === "chunk") {
+            // Each chunk carries the whole text generated so far
+            setProgress((prev) => ({ ...prev, preview: data.content }));
+            return;
+          }
           setProgress({
             status: data.message || "Processing...",
             currentPhase: data.phase,
@@ -343,6 +349,11 @@ export default function NewDraftPage() {
                 Current phase: {progress.currentPhase}
               </p>
             )}
+            {progress.preview && (
+              <p className="whitespace-pre-wrap rounded-lg border bg-muted/50 p-4 text-sm">
+                {progress.preview}
+              </p>
+            )}
           </CardContent>
         </Card>
       )}
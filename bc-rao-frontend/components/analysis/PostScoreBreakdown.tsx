@@ -3,6 +3,7 @@
 import { useState } from "react";
 import { ChevronDown, ChevronUp } from "lucide-react";
 import { createClient } from "@/lib/supabase/client";
+import { loadScoringBreakdown } from "@/lib/scoring-breakdowns";
 import PenaltyHighlighter from "./PenaltyHighlighter";
 
 interface PostScoreBreakdownProps {
@@ -55,20 +56,7 @@ export default function PostScoreBreakdown({
         const supabase = createClient();
         const { data: { session } } = await supabase.auth.getSession();
         const token = session?.access_token;
-        const response = await fetch(
-          `/api/campaigns/${campaignId}/scoring-breakdown?post_id=${postId}`,
-          {
-            headers: {
-              ...(token ? { Authorization: `Bearer ${token}` } : {}),
-            },
-          }
-        );
-
-        if (!response.ok) {
-          throw new Error("Failed to fetch scoring breakdown");
-        }
-
-        const data = await response.json();
+        const data = await loadScoringBreakdown(campaignId, postId, token);
         setBreakdown(data);
       } catch (err) {
         setError(err instanceof Error ? err.message : "Unknown error");
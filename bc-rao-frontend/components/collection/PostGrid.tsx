@@ -35,6 +35,7 @@ interface PostGridProps {
 export default function PostGrid({ campaignId, filters, onPostClick }: PostGridProps) {
   const [posts, setPosts] = useState<Post[]>([]);
   const [total, setTotal] = useState(0);
+  const [hasMore, setHasMore] = useState(false);
   const [page, setPage] = useState(1);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -86,6 +87,8 @@ export default function PostGrid({ campaignId, filters, onPostClick }: PostGridP
       const data = await response.json();
       setPosts(data.posts || []);
       setTotal(data.total || 0);
+      // total may be an estimate for large campaigns; next_cursor is exact
+      setHasMore(Boolean(data.next_cursor));
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to load posts");
     } finally {
@@ -147,7 +150,7 @@ export default function PostGrid({ campaignId, filters, onPostClick }: PostGridP
   }
 
   const startIdx = (page - 1) * perPage + 1;
-  const endIdx = Math.min(page * perPage, total);
+  const endIdx = startIdx + posts.length - 1;
 
   return (
     <div className="space-y-4">
@@ -218,7 +221,7 @@ export default function PostGrid({ campaignId, filters, onPostClick }: PostGridP
             variant="outline"
             size="sm"
             onClick={() => setPage((p) => p + 1)}
-            disabled={endIdx >= total}
+            disabled={!hasMore}
           >
             Next
           </Button>
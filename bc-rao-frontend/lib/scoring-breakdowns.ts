@@ -0,0 +1,89 @@
+/**
+ * Batched loader for post scoring breakdowns.
+ *
+ * Breakdown requests made within the same short window (e.g. several
+ * posts expanded at once on the analysis page) are coalesced into one
+ * POST /scoring-breakdowns call per campaign instead of one GET per post.
+ */
+
+const BATCH_WINDOW_MS = 10;
+const MAX_BATCH_SIZE = 100;
+
+type Pending = {
+  resolve: (breakdown: any) => void;
+  reject: (error: Error) => void;
+};
+
+type Batch = {
+  token?: string;
+  posts: Map<string, Pending[]>;
+};
+
+const batches = new Map<string, Batch>();
+
+async function flush(campaignId: string) {
+  const batch = batches.get(campaignId);
+  batches.delete(campaignId);
+  if (!batch) return;
+
+  const postIds = Array.from(batch.posts.keys());
+
+  for (let start = 0; start < postIds.length; start += MAX_BATCH_SIZE) {
+    const chunk = postIds.slice(start, start + MAX_BATCH_SIZE);
+
+    try {
+      const response = await fetch(`/api/campaigns/${campaignId}/scoring-breakdowns`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          ...(batch.token ? { Authorization: `Bearer ${batch.token}` } : {}),
+        },
+        body: JSON.stringify({ post_ids: chunk }),
+      });
+
+      if (!response.ok) {
+        throw new Error("Failed to fetch scoring breakdown");
+      }
+
+      const data = await response.json();
+
+      for (const postId of chunk) {
+        const waiters = batch.posts.get(postId) ?? [];
+        const breakdown = data[postId];
+        for (const waiter of waiters) {
+          if (breakdown) {
+            waiter.resolve(breakdown);
+          } else {
+            waiter.reject(new Error("Post not found"));
+          }
+        }
+      }
+    } catch (err) {
+      const error = err instanceof Error ? err : new Error("Unknown error");
+      for (const postId of chunk) {
+        for (const waiter of batch.posts.get(postId) ?? []) {
+          waiter.reject(error);
+        }
+      }
+    }
+  }
+}
+
+export function loadScoringBreakdown(
+  campaignId: string,
+  postId: string,
+  token?: string
+): Promise<any> {
+  return new Promise((resolve, reject) => {
+    let batch = batches.get(campaignId);
+    if (!batch) {
+      batch = { token, posts: new Map() };
+      batches.set(campaignId, batch);
+      setTimeout(() => flush(campaignId), BATCH_WINDOW_MS);
+    }
+
+    const waiters = batch.posts.get(postId) ?? [];
+    waiters.push({ resolve, reject });
+    batch.posts.set(postId, waiters);
+  });
+}
@@ -0,0 +1,162 @@
+-- ============================================================
+-- Migration 004: Campaign-scoped read functions for analysis endpoints
+-- ============================================================
+-- Each analysis read used to make two round-trips: one to check that the
+-- campaign belongs to the user, one to fetch the data. These functions do
+-- both in a single statement (called via supabase.rpc). They return NULL
+-- when the campaign doesn't exist or isn't owned by the user, so the API
+-- can still answer 404 for that case.
+
+-- Community profiles of a campaign, optionally for one subreddit
+CREATE OR REPLACE FUNCTION get_campaign_community_profiles(
+    p_campaign_id UUID,
+    p_user_id UUID,
+    p_subreddit TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(
+        (
+            SELECT jsonb_agg(to_jsonb(p))
+            FROM community_profiles p
+            WHERE p.campaign_id = c.id
+              AND (p_subreddit IS NULL OR p.subreddit = p_subreddit)
+        ),
+        '[]'::jsonb
+    )
+    FROM campaigns c
+    WHERE c.id = p_campaign_id
+      AND c.user_id = p_user_id;
+$$;
+
+-- One post of a campaign for its scoring breakdown: {"post": row or null}
+CREATE OR REPLACE FUNCTION get_campaign_post_scoring(
+    p_campaign_id UUID,
+    p_user_id UUID,
+    p_post_id UUID
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'post',
+        (
+            SELECT jsonb_build_object(
+                'id', r.id,
+                'raw_text', r.raw_text,
+                'rhythm_metadata', r.rhythm_metadata,
+                'subreddit', r.subreddit,
+                'campaign_id', r.campaign_id
+            )
+            FROM raw_posts r
+            WHERE r.id = p_post_id
+              AND r.campaign_id = c.id
+        )
+    )
+    FROM campaigns c
+    WHERE c.id = p_campaign_id
+      AND c.user_id = p_user_id;
+$$;
+
+-- One page of analyzed posts plus the filtered total:
+-- {"posts": [...], "total": n}. Sorted by success_score.
+CREATE OR REPLACE FUNCTION get_campaign_analyzed_posts(
+    p_campaign_id UUID,
+    p_user_id UUID,
+    p_subreddit TEXT DEFAULT NULL,
+    p_sort_desc BOOLEAN DEFAULT TRUE,
+    p_limit INT DEFAULT 20,
+    p_offset INT DEFAULT 0
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'posts',
+        COALESCE(
+            (
+                SELECT jsonb_agg(
+                    to_jsonb(page)
+                    ORDER BY
+                        CASE WHEN p_sort_desc THEN page.success_score END DESC,
+                        CASE WHEN NOT p_sort_desc THEN page.success_score END ASC
+                )
+                FROM (
+                    SELECT r.id, r.title, r.raw_text, r.subreddit, r.archetype,
+                           r.success_score, r.rhythm_metadata, r.collected_at
+                    FROM raw_posts r
+                    WHERE r.campaign_id = c.id
+                      AND (p_subreddit IS NULL OR r.subreddit = p_subreddit)
+                    ORDER BY
+                        CASE WHEN p_sort_desc THEN r.success_score END DESC,
+                        CASE WHEN NOT p_sort_desc THEN r.success_score END ASC
+                    LIMIT p_limit
+                    OFFSET p_offset
+                ) page
+            ),
+            '[]'::jsonb
+        ),
+        'total',
+        (
+            SELECT count(*)
+            FROM raw_posts r
+            WHERE r.campaign_id = c.id
+              AND (p_subreddit IS NULL OR r.subreddit = p_subreddit)
+        )
+    )
+    FROM campaigns c
+    WHERE c.id = p_campaign_id
+      AND c.user_id = p_user_id;
+$$;
+
+-- Detected patterns from community profiles plus the user's custom
+-- patterns for the campaign's target subreddits:
+-- {"profiles": [{subreddit, forbidden_patterns}], "custom_patterns": [...]}
+CREATE OR REPLACE FUNCTION get_campaign_forbidden_patterns(
+    p_campaign_id UUID,
+    p_user_id UUID,
+    p_subreddit TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'profiles',
+        COALESCE(
+            (
+                SELECT jsonb_agg(jsonb_build_object(
+                    'subreddit', p.subreddit,
+                    'forbidden_patterns', p.forbidden_patterns
+                ))
+                FROM community_profiles p
+                WHERE p.campaign_id = c.id
+                  AND (p_subreddit IS NULL OR p.subreddit = p_subreddit)
+            ),
+            '[]'::jsonb
+        ),
+        'custom_patterns',
+        COALESCE(
+            (
+                SELECT jsonb_agg(jsonb_build_object(
+                    'id', b.id,
+                    'subreddit', b.subreddit,
+                    'forbidden_pattern', b.forbidden_pattern,
+                    'confidence', b.confidence
+                ))
+                FROM syntax_blacklist b
+                WHERE b.subreddit = ANY(c.target_subreddits)
+                  AND b.confidence = 1.0
+                  AND b.source_post_id IS NULL
+            ),
+            '[]'::jsonb
+        )
+    )
+    FROM campaigns c
+    WHERE c.id = p_campaign_id
+      AND c.user_id = p_user_id;
+$$;
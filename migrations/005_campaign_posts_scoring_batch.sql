@@ -0,0 +1,41 @@
+-- ============================================================
+-- Migration 005: Batch scoring breakdown lookup
+-- ============================================================
+-- Fetches several posts of a campaign for their scoring breakdowns in one
+-- statement (post_id = ANY(...)), so a dashboard can load every breakdown
+-- on a page with a single request. Like the functions of migration 004 it
+-- returns NULL when the campaign doesn't exist or isn't owned by the user.
+
+-- Posts of a campaign among p_post_ids: {"posts": [...]}. Ids that don't
+-- belong to the campaign are simply absent from the result.
+CREATE OR REPLACE FUNCTION get_campaign_posts_scoring(
+    p_campaign_id UUID,
+    p_user_id UUID,
+    p_post_ids UUID[]
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'posts',
+        COALESCE(
+            (
+                SELECT jsonb_agg(jsonb_build_object(
+                    'id', r.id,
+                    'raw_text', r.raw_text,
+                    'rhythm_metadata', r.rhythm_metadata,
+                    'subreddit', r.subreddit,
+                    'campaign_id', r.campaign_id
+                ))
+                FROM raw_posts r
+                WHERE r.id = ANY(p_post_ids)
+                  AND r.campaign_id = c.id
+            ),
+            '[]'::jsonb
+        )
+    )
+    FROM campaigns c
+    WHERE c.id = p_campaign_id
+      AND c.user_id = p_user_id;
+$$;
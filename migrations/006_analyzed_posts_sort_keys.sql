@@ -0,0 +1,97 @@
+-- ============================================================
+-- Migration 006: Sortable analyzed posts
+-- ============================================================
+-- get_campaign_analyzed_posts (migration 004) could only sort by
+-- success_score. It now takes a sort key from a fixed list; each key maps
+-- to a hard-coded ORDER BY expression here, so callers never send SQL.
+-- The page query is built with that plain expression (not a CASE over
+-- all keys), which lets Postgres walk the indexes below for column sorts.
+
+CREATE INDEX IF NOT EXISTS idx_raw_posts_campaign_score
+    ON raw_posts(campaign_id, success_score);
+CREATE INDEX IF NOT EXISTS idx_raw_posts_campaign_collected
+    ON raw_posts(campaign_id, collected_at);
+
+DROP FUNCTION IF EXISTS get_campaign_analyzed_posts(UUID, UUID, TEXT, BOOLEAN, INT, INT);
+
+-- One page of analyzed posts plus the filtered total:
+-- {"posts": [...], "total": n}. NULL if the campaign isn't the user's.
+CREATE OR REPLACE FUNCTION get_campaign_analyzed_posts(
+    p_campaign_id UUID,
+    p_user_id UUID,
+    p_subreddit TEXT DEFAULT NULL,
+    p_sort_key TEXT DEFAULT 'total_score',
+    p_sort_desc BOOLEAN DEFAULT TRUE,
+    p_limit INT DEFAULT 20,
+    p_offset INT DEFAULT 0
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_order TEXT;
+    v_result JSONB;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM campaigns c
+        WHERE c.id = p_campaign_id
+          AND c.user_id = p_user_id
+    ) THEN
+        RETURN NULL;
+    END IF;
+
+    v_order := CASE p_sort_key
+        WHEN 'total_score' THEN 'r.success_score'
+        WHEN 'vulnerability_weight' THEN '(r.rhythm_metadata->>''vulnerability_weight'')::float'
+        WHEN 'rhythm_adherence' THEN '(r.rhythm_metadata->>''rhythm_adherence'')::float'
+        WHEN 'formality_match' THEN '(r.rhythm_metadata->>''formality_match'')::float'
+        WHEN 'marketing_jargon_penalty' THEN '(r.rhythm_metadata->>''marketing_jargon_penalty'')::float'
+        WHEN 'created_at' THEN 'r.collected_at'
+    END;
+
+    IF v_order IS NULL THEN
+        RAISE EXCEPTION 'Unsupported sort key: %', p_sort_key;
+    END IF;
+
+    v_order := v_order || CASE WHEN p_sort_desc THEN ' DESC' ELSE ' ASC' END;
+
+    EXECUTE format($query$
+        SELECT jsonb_build_object(
+            'posts',
+            COALESCE(
+                (
+                    SELECT jsonb_agg(to_jsonb(page) - 'position' ORDER BY page.position)
+                    FROM (
+                        SELECT r.id, r.title, r.raw_text, r.subreddit, r.archetype,
+                               r.success_score, r.rhythm_metadata, r.collected_at,
+                               row_number() OVER (ORDER BY %1$s) AS position
+                        FROM raw_posts r
+                        WHERE r.campaign_id = $1
+                          AND ($2::text IS NULL OR r.subreddit = $2)
+                        ORDER BY %1$s
+                        LIMIT $3
+                        OFFSET $4
+                    ) page
+                ),
+                '[]'::jsonb
+            ),
+            'total',
+            -- Separate count in the same statement rather than
+            -- COUNT(*) OVER () on the page query: a window over every
+            -- matching row would have to read and sort them all before
+            -- LIMIT, losing the index scan above.
+            (
+                SELECT count(*)
+                FROM raw_posts r
+                WHERE r.campaign_id = $1
+                  AND ($2::text IS NULL OR r.subreddit = $2)
+            )
+        )
+    $query$, v_order)
+    INTO v_result
+    USING p_campaign_id, p_subreddit, p_limit, p_offset;
+
+    RETURN v_result;
+END;
+$$;
@@ -0,0 +1,24 @@
+-- ============================================================
+-- Migration 007: Campaign ownership + plan in one call
+-- ============================================================
+-- Triggering a collection or an analysis needs both the ownership check
+-- and the user's plan (for inference budget tracking). This returns the
+-- plan of the campaign's owner, 'trial' without a subscription row, or
+-- NULL when the campaign doesn't exist or isn't owned by the user.
+
+CREATE OR REPLACE FUNCTION get_campaign_owner_plan(
+    p_campaign_id UUID,
+    p_user_id UUID
+)
+RETURNS TEXT
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(
+        (SELECT s.plan::text FROM subscriptions s WHERE s.user_id = c.user_id),
+        'trial'
+    )
+    FROM campaigns c
+    WHERE c.id = p_campaign_id
+      AND c.user_id = p_user_id;
+$$;
@@ -0,0 +1,77 @@
+-- ============================================================
+-- Migration 008: Keyset pagination for collected posts
+-- ============================================================
+-- Offset pages make Postgres walk and discard every earlier row, and the
+-- exact count is another scan of the campaign's posts. This function
+-- returns the posts that follow a cursor (the sort key of the last post
+-- already seen) in the collection browser's order:
+--     success_score DESC NULLS LAST, collected_at DESC, id DESC
+-- which the index below serves directly. Like the functions of migration
+-- 004 it returns NULL when the campaign isn't owned by the user.
+
+CREATE INDEX IF NOT EXISTS idx_raw_posts_campaign_keyset
+    ON raw_posts(campaign_id, success_score DESC NULLS LAST, collected_at DESC, id DESC);
+
+-- Posts after the cursor: {"posts": [...]}. With no cursor (p_after_id
+-- NULL) starts from the top. Callers ask for one row more than a page to
+-- learn whether another page follows.
+CREATE OR REPLACE FUNCTION get_campaign_posts_after(
+    p_campaign_id UUID,
+    p_user_id UUID,
+    p_archetype TEXT DEFAULT NULL,
+    p_subreddit TEXT DEFAULT NULL,
+    p_min_score FLOAT DEFAULT NULL,
+    p_max_score FLOAT DEFAULT NULL,
+    p_after_score FLOAT DEFAULT NULL,
+    p_after_collected_at TIMESTAMPTZ DEFAULT NULL,
+    p_after_id UUID DEFAULT NULL,
+    p_limit INT DEFAULT 20
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'posts',
+        COALESCE(
+            (
+                SELECT jsonb_agg(to_jsonb(page) ORDER BY
+                    page.success_score DESC NULLS LAST,
+                    page.collected_at DESC,
+                    page.id DESC
+                )
+                FROM (
+                    SELECT r.id, r.campaign_id, r.user_id, r.subreddit, r.reddit_post_id,
+                           r.reddit_url, r.author, r.author_karma, r.title, r.raw_text,
+                           r.comment_count, r.upvote_ratio, r.archetype, r.success_score,
+                           r.reddit_created_at, r.is_ai_processed, r.collected_at
+                    FROM raw_posts r
+                    WHERE r.campaign_id = c.id
+                      AND (p_archetype IS NULL OR r.archetype::text = p_archetype)
+                      AND (p_subreddit IS NULL OR r.subreddit = p_subreddit)
+                      AND (p_min_score IS NULL OR r.success_score >= p_min_score)
+                      AND (p_max_score IS NULL OR r.success_score <= p_max_score)
+                      AND (
+                          p_after_id IS NULL
+                          -- Cursor on a scored post: lower scores, ties after it, then unscored
+                          OR (p_after_score IS NOT NULL AND (
+                              r.success_score < p_after_score
+                              OR (r.success_score = p_after_score
+                                  AND (r.collected_at, r.id) < (p_after_collected_at, p_after_id))
+                              OR r.success_score IS NULL
+                          ))
+                          -- Cursor already among unscored posts (sorted last)
+                          OR (p_after_score IS NULL AND r.success_score IS NULL
+                              AND (r.collected_at, r.id) < (p_after_collected_at, p_after_id))
+                      )
+                    ORDER BY r.success_score DESC NULLS LAST, r.collected_at DESC, r.id DESC
+                    LIMIT p_limit
+                ) page
+            ),
+            '[]'::jsonb
+        )
+    )
+    FROM campaigns c
+    WHERE c.id = p_campaign_id
+      AND c.user_id = p_user_id;
+$$;
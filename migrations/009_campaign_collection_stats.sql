@@ -0,0 +1,55 @@
+-- ============================================================
+-- Migration 009: Collection statistics aggregated in Postgres
+-- ============================================================
+-- The collection stats endpoint used to download archetype, subreddit and
+-- score of every post in the campaign and count them in Python. This
+-- function computes the total, the per-archetype and per-subreddit counts
+-- and the average score in one scan (GROUPING SETS) and returns only the
+-- aggregates. Like the functions of migration 004 it returns NULL when
+-- the campaign isn't owned by the user.
+--
+-- A materialized view was considered and rejected: REFRESH rebuilds it for
+-- every campaign after each collection, while this scan only reads one
+-- campaign's posts through idx_raw_posts_campaign_keyset.
+
+-- {"total": n, "by_archetype": {...}, "by_subreddit": {...},
+--  "avg_success_score": x (0 when no post is scored)}
+CREATE OR REPLACE FUNCTION get_campaign_collection_stats(
+    p_campaign_id UUID,
+    p_user_id UUID
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    WITH grouped AS (
+        SELECT
+            GROUPING(p.archetype, p.subreddit) AS level,
+            p.archetype,
+            p.subreddit,
+            count(*) AS posts,
+            avg(p.success_score) AS avg_score
+        FROM (
+            SELECT COALESCE(r.archetype::text, 'Unclassified') AS archetype,
+                   COALESCE(r.subreddit, 'Unknown') AS subreddit,
+                   r.success_score
+            FROM raw_posts r
+            WHERE r.campaign_id = p_campaign_id
+        ) p
+        -- level 1: per archetype, 2: per subreddit, 3: whole campaign
+        GROUP BY GROUPING SETS ((p.archetype), (p.subreddit), ())
+    )
+    SELECT jsonb_build_object(
+        'total',
+        (SELECT posts FROM grouped WHERE level = 3),
+        'by_archetype',
+        COALESCE((SELECT jsonb_object_agg(archetype, posts) FROM grouped WHERE level = 1), '{}'::jsonb),
+        'by_subreddit',
+        COALESCE((SELECT jsonb_object_agg(subreddit, posts) FROM grouped WHERE level = 2), '{}'::jsonb),
+        'avg_success_score',
+        COALESCE(round((SELECT avg_score FROM grouped WHERE level = 3)::numeric, 2), 0)
+    )
+    FROM campaigns c
+    WHERE c.id = p_campaign_id
+      AND c.user_id = p_user_id;
+$$;
@@ -0,0 +1,47 @@
+-- ============================================================
+-- Migration 010: Draft generation checks in one call
+-- ============================================================
+-- Generating or regenerating a draft used to take three round-trips
+-- before queueing: an ownership check, the user's plan and a count of
+-- the drafts generated this month. This function answers all three,
+-- returning {"plan": ..., "drafts_this_month": n}, or NULL when the
+-- campaign (generation) or draft (regeneration) isn't owned by the user.
+
+CREATE INDEX IF NOT EXISTS idx_drafts_user_created
+    ON generated_drafts(user_id, created_at);
+
+CREATE OR REPLACE FUNCTION get_draft_quota(
+    p_user_id UUID,
+    p_month_start TIMESTAMPTZ,
+    p_campaign_id UUID DEFAULT NULL,
+    p_draft_id UUID DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE
+        WHEN p_campaign_id IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM campaigns c
+            WHERE c.id = p_campaign_id AND c.user_id = p_user_id
+        ) THEN NULL
+        WHEN p_draft_id IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM generated_drafts d
+            WHERE d.id = p_draft_id AND d.user_id = p_user_id
+        ) THEN NULL
+        ELSE jsonb_build_object(
+            'plan',
+            COALESCE(
+                (SELECT s.plan::text FROM subscriptions s WHERE s.user_id = p_user_id),
+                'trial'
+            ),
+            'drafts_this_month',
+            (
+                SELECT count(*)
+                FROM generated_drafts d
+                WHERE d.user_id = p_user_id
+                  AND d.created_at >= p_month_start
+            )
+        )
+    END;
+$$;
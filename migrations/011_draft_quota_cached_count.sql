@@ -0,0 +1,46 @@
+-- ============================================================
+-- Migration 011: Skip the draft count when the API has it cached
+-- ============================================================
+-- The API keeps this month's draft count in Redis (seeded from this
+-- function, incremented as drafts are saved). get_draft_quota takes a
+-- p_count flag so checks that hit the cached counter only verify
+-- ownership and read the plan; drafts_this_month is NULL then.
+
+DROP FUNCTION IF EXISTS get_draft_quota(UUID, TIMESTAMPTZ, UUID, UUID);
+
+CREATE OR REPLACE FUNCTION get_draft_quota(
+    p_user_id UUID,
+    p_month_start TIMESTAMPTZ,
+    p_campaign_id UUID DEFAULT NULL,
+    p_draft_id UUID DEFAULT NULL,
+    p_count BOOLEAN DEFAULT TRUE
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE
+        WHEN p_campaign_id IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM campaigns c
+            WHERE c.id = p_campaign_id AND c.user_id = p_user_id
+        ) THEN NULL
+        WHEN p_draft_id IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM generated_drafts d
+            WHERE d.id = p_draft_id AND d.user_id = p_user_id
+        ) THEN NULL
+        ELSE jsonb_build_object(
+            'plan',
+            COALESCE(
+                (SELECT s.plan::text FROM subscriptions s WHERE s.user_id = p_user_id),
+                'trial'
+            ),
+            'drafts_this_month',
+            CASE WHEN p_count THEN (
+                SELECT count(*)
+                FROM generated_drafts d
+                WHERE d.user_id = p_user_id
+                  AND d.created_at >= p_month_start
+            ) END
+        )
+    END;
+$$;